@@ -1,33 +1,36 @@
-from agno.agent.agent import (
-    Agent,
-    AgentKnowledge,
-    AgentMemory,
-    AgentSession,
-    Function,
-    Memory,
-    Message,
-    Storage,
-    Toolkit,
-)
-from agno.run.response import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunEvent,
-    RunResponse,
-    RunResponseCancelledEvent,
-    RunResponseCompletedEvent,
-    RunResponseContentEvent,
-    RunResponseContinuedEvent,
-    RunResponseErrorEvent,
-    RunResponseEvent,
-    RunResponsePausedEvent,
-    RunResponseStartedEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
-)
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.agent.agent import Agent
+    from agno.knowledge.agent import AgentKnowledge
+    from agno.memory.agent import AgentMemory
+    from agno.memory.v2.memory import Memory
+    from agno.models.message import Message
+    from agno.run.response import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunEvent,
+        RunResponse,
+        RunResponseCancelledEvent,
+        RunResponseCompletedEvent,
+        RunResponseContentEvent,
+        RunResponseContinuedEvent,
+        RunResponseErrorEvent,
+        RunResponseEvent,
+        RunResponsePausedEvent,
+        RunResponseStartedEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
+    from agno.storage.base import Storage
+    from agno.storage.session.agent import AgentSession
+    from agno.tools.function import Function
+    from agno.tools.toolkit import Toolkit
 
 __all__ = [
     "Agent",
@@ -57,3 +60,37 @@ __all__ = [
     "ToolCallStartedEvent",
     "ToolCallCompletedEvent",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.agent.agent": ["Agent"],
+        "agno.knowledge.agent": ["AgentKnowledge"],
+        "agno.memory.agent": ["AgentMemory"],
+        "agno.memory.v2.memory": ["Memory"],
+        "agno.models.message": ["Message"],
+        "agno.run.response": [
+            "MemoryUpdateCompletedEvent",
+            "MemoryUpdateStartedEvent",
+            "ReasoningCompletedEvent",
+            "ReasoningStartedEvent",
+            "ReasoningStepEvent",
+            "RunEvent",
+            "RunResponse",
+            "RunResponseCancelledEvent",
+            "RunResponseCompletedEvent",
+            "RunResponseContentEvent",
+            "RunResponseContinuedEvent",
+            "RunResponseErrorEvent",
+            "RunResponseEvent",
+            "RunResponsePausedEvent",
+            "RunResponseStartedEvent",
+            "ToolCallCompletedEvent",
+            "ToolCallStartedEvent",
+        ],
+        "agno.storage.base": ["Storage"],
+        "agno.storage.session.agent": ["AgentSession"],
+        "agno.tools.function": ["Function"],
+        "agno.tools.toolkit": ["Toolkit"],
+    },
+)
@@ -10,12 +10,14 @@ from typing import (
     AsyncIterator,
     Callable,
     Dict,
+    Hashable,
     Iterator,
     List,
     Literal,
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -35,6 +37,7 @@ from agno.memory.v2.memory import Memory, SessionSummary
 from agno.memory.v2.schema import UserMemory
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageMetrics, MessageReferences
+from agno.models.rate_limit import aiterate_with_rate_limit_key, iterate_with_rate_limit_key, rate_limit_context
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
@@ -45,7 +48,7 @@ from agno.run.response import (
     RunResponseEvent,
     RunResponsePausedEvent,
 )
-from agno.run.team import TeamRunResponse, TeamRunResponseEvent
+from agno.run.team import TeamRunResponseEvent
 from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
@@ -83,6 +86,19 @@ from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
 
 
+@dataclass
+class ToolRunContext:
+    """Values of the current run that the agent's built-in tools read when they are called.
+
+    Built-in tools such as `search_knowledge_base` or `get_chat_history` read the session, user and knowledge
+    filters from here instead of capturing them, so the tools can be built once and reused across runs.
+    """
+
+    session_id: Optional[str] = None
+    user_id: Optional[str] = None
+    knowledge_filters: Optional[Dict[str, Any]] = None
+
+
 @dataclass(init=False)
 class Agent:
     # --- Agent settings ---
@@ -129,6 +145,9 @@ class Agent:
     enable_session_summaries: bool = False
     # If True, the agent adds a reference to the session summaries in the response
     add_session_summary_references: Optional[bool] = None
+    # If True, memories and summaries are created by background workers after the run returns.
+    # Set to False to have the run wait for them, so they are visible to the next run
+    background_memory_updates: bool = True
 
     # --- Agent History ---
     # add_history_to_messages=true adds messages from the chat history to the messages list sent to the Model.
@@ -342,6 +361,7 @@ class Agent:
         add_memory_references: Optional[bool] = None,
         enable_session_summaries: bool = False,
         add_session_summary_references: Optional[bool] = None,
+        background_memory_updates: bool = True,
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
@@ -432,6 +452,7 @@ class Agent:
         self.add_memory_references = add_memory_references
         self.enable_session_summaries = enable_session_summaries
         self.add_session_summary_references = add_session_summary_references
+        self.background_memory_updates = background_memory_updates
 
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
@@ -539,6 +560,9 @@ class Agent:
         self._tools_for_model: Optional[List[Dict[str, Any]]] = None
         self._functions_for_model: Optional[Dict[str, Function]] = None
         self._rebuild_tools: bool = True
+        # (async_mode, strict) the tools for the model were built for
+        self._tools_key: Optional[Tuple[bool, bool]] = None
+        self._tool_context: ToolRunContext = ToolRunContext()
 
         self._formatter: Optional[SafeFormatter] = None
 
@@ -690,14 +714,15 @@ class Agent:
 
         # 2. Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
-        model_response: ModelResponse = self.model.response(
-            messages=run_messages.messages,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-            response_format=response_format,
-        )
+        with rate_limit_context(run_response.session_id):
+            model_response: ModelResponse = self.model.response(
+                messages=run_messages.messages,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                response_format=response_format,
+            )
 
         # If a parser model is provided, structure the response separately
         if self.parser_model is not None:
@@ -1149,14 +1174,15 @@ class Agent:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Generate a response from the Model (includes running function calls)
-        model_response: ModelResponse = await self.model.aresponse(
-            messages=run_messages.messages,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-            response_format=response_format,
-        )
+        with rate_limit_context(run_response.session_id):
+            model_response: ModelResponse = await self.model.aresponse(
+                messages=run_messages.messages,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                response_format=response_format,
+            )
 
         # If a parser model is provided, structure the response separately
         if self.parser_model is not None:
@@ -1849,14 +1875,15 @@ class Agent:
 
         # 2. Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
-        model_response: ModelResponse = self.model.response(
-            messages=run_messages.messages,
-            response_format=response_format,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-        )
+        with rate_limit_context(run_response.session_id):
+            model_response: ModelResponse = self.model.response(
+                messages=run_messages.messages,
+                response_format=response_format,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+            )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
 
@@ -2268,14 +2295,15 @@ class Agent:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Generate a response from the Model (includes running function calls)
-        model_response: ModelResponse = await self.model.aresponse(
-            messages=run_messages.messages,
-            response_format=response_format,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-        )
+        with rate_limit_context(run_response.session_id):
+            model_response: ModelResponse = await self.model.aresponse(
+                messages=run_messages.messages,
+                response_format=response_format,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+            )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
 
@@ -3080,14 +3108,15 @@ class Agent:
         }
         model_response = ModelResponse(content="")
 
-        for model_response_event in self.model.response_stream(
+        model_response_stream = self.model.response_stream(
             messages=run_messages.messages,
             response_format=response_format,
             tools=self._tools_for_model,
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
-        ):
+        )
+        for model_response_event in iterate_with_rate_limit_key(run_response.session_id, model_response_stream):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
                 model_response=model_response,
@@ -3148,6 +3177,7 @@ class Agent:
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
         )  # type: ignore
+        model_response_stream = aiterate_with_rate_limit_key(run_response.session_id, model_response_stream)
 
         async for model_response_event in model_response_stream:  # type: ignore
             for event in self._handle_model_response_chunk(
@@ -3475,71 +3505,86 @@ class Agent:
         user_id: Optional[str] = None,
         messages: Optional[List[Message]] = None,
     ) -> Iterator[RunResponseEvent]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
+
+        from agno.utils.background import get_background_executor
 
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = []
+        # (function, kwargs, coalescing key) of each update
+        jobs: List[Tuple[Callable[..., Any], Dict[str, Any], Optional[Hashable]]] = []
 
-            # Create user memories from single message
-            if self.enable_user_memories and run_messages.user_message is not None:
-                log_debug("Creating user memories.")
-                futures.append(
-                    executor.submit(
-                        self.memory.create_user_memories,
-                        message=run_messages.user_message.get_content_string(),
-                        user_id=user_id,
-                    )
+        # Create user memories from single message
+        if self.enable_user_memories and run_messages.user_message is not None:
+            log_debug("Creating user memories.")
+            jobs.append(
+                (
+                    self.memory.create_user_memories,
+                    {"message": run_messages.user_message.get_content_string(), "user_id": user_id},
+                    None,
                 )
+            )
 
-            # Parse messages if provided
-            if self.enable_user_memories and messages is not None and len(messages) > 0:
-                parsed_messages = []
-                for _im in messages:
-                    if isinstance(_im, Message):
-                        parsed_messages.append(_im)
-                    elif isinstance(_im, dict):
-                        try:
-                            parsed_messages.append(Message(**_im))
-                        except Exception as e:
-                            log_warning(f"Failed to validate message during memory update: {e}")
-                    else:
-                        log_warning(f"Unsupported message type: {type(_im)}")
-                        continue
+        # Parse messages if provided
+        if self.enable_user_memories and messages is not None and len(messages) > 0:
+            parsed_messages = self._parse_memory_messages(messages)
+            if len(parsed_messages) > 0:
+                jobs.append((self.memory.create_user_memories, {"messages": parsed_messages, "user_id": user_id}, None))
+            else:
+                log_warning("Unable to add messages to memory")
 
-                if len(parsed_messages) > 0:
-                    futures.append(
-                        executor.submit(self.memory.create_user_memories, messages=parsed_messages, user_id=user_id)
-                    )
-                else:
-                    log_warning("Unable to add messages to memory")
+        # Create session summary
+        if self.enable_session_summaries:
+            log_debug("Creating session summary.")
+            jobs.append(
+                (
+                    self.memory.create_session_summary,  # type: ignore
+                    {"session_id": session_id, "user_id": user_id},
+                    ("session_summary", id(self.memory), session_id),
+                )
+            )
+
+        if jobs:
+            executor = get_background_executor()
+            if self.background_memory_updates:
+                for fn, kwargs, key in jobs:
+                    executor.submit(fn, key=key, **kwargs)
+                log_debug("Memory updates scheduled in the background.")
+                return
 
-            # Create session summary
-            if self.enable_session_summaries:
-                log_debug("Creating session summary.")
-                futures.append(
-                    executor.submit(self.memory.create_session_summary, session_id=session_id, user_id=user_id)  # type: ignore
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_memory_update_started_event(from_run_response=self.run_response), self.run_response
                 )
 
-            if futures:
-                if self.stream_intermediate_steps:
-                    yield self._handle_event(
-                        create_memory_update_started_event(from_run_response=self.run_response), self.run_response
-                    )
+            futures = [executor.submit(fn, key=key, **kwargs) for fn, kwargs, key in jobs]
+            # Wait for all operations to complete and handle any errors
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log_warning(f"Error in memory/summary operation: {str(e)}")
 
-                # Wait for all operations to complete and handle any errors
-                for future in as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        log_warning(f"Error in memory/summary operation: {str(e)}")
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_memory_update_completed_event(from_run_response=self.run_response), self.run_response
+                )
 
-                if self.stream_intermediate_steps:
-                    yield self._handle_event(
-                        create_memory_update_completed_event(from_run_response=self.run_response), self.run_response
-                    )
+    def _parse_memory_messages(self, messages: Sequence[Union[Dict, Message]]) -> List[Message]:
+        parsed_messages = []
+        for _im in messages:
+            if isinstance(_im, Message):
+                parsed_messages.append(_im)
+            elif isinstance(_im, dict):
+                try:
+                    parsed_messages.append(Message(**_im))
+                except Exception as e:
+                    log_warning(f"Failed to validate message during memory update: {e}")
+            else:
+                log_warning(f"Unsupported message type: {type(_im)}")
+                continue
+        return parsed_messages
 
     async def _amake_memories_and_summaries(
         self,
@@ -3550,6 +3595,13 @@ class Agent:
     ) -> AsyncIterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
+
+        if self.background_memory_updates:
+            # The background workers outlive the event loop, so they run the sync versions
+            for _ in self._make_memories_and_summaries(run_messages, session_id, user_id, messages):
+                pass
+            return
+
         tasks = []
 
         # Create user memories from single message
@@ -3564,19 +3616,7 @@ class Agent:
 
         # Parse messages if provided
         if self.enable_user_memories and messages is not None and len(messages) > 0:
-            parsed_messages = []
-            for _im in messages:
-                if isinstance(_im, Message):
-                    parsed_messages.append(_im)
-                elif isinstance(_im, dict):
-                    try:
-                        parsed_messages.append(Message(**_im))
-                    except Exception as e:
-                        log_warning(f"Failed to validate message during memory update: {e}")
-                else:
-                    log_warning(f"Unsupported message type: {type(_im)}")
-                    continue
-
+            parsed_messages = self._parse_memory_messages(messages)
             if len(parsed_messages) > 0:
                 tasks.append(self.memory.acreate_user_memories(messages=parsed_messages, user_id=user_id))
             else:
@@ -3648,26 +3688,23 @@ class Agent:
                 self._raise_if_async_tools()
             agent_tools.extend(self.tools)
 
+        # The session, user and knowledge filters of the run are read from self._tool_context when the tools
+        # are called, so the tools below are not tied to the run they were built for.
+
         # Add tools for accessing memory
         if self.read_chat_history:
-            agent_tools.append(self.get_chat_history_function(session_id=session_id))
-            self._rebuild_tools = True
+            agent_tools.append(self.get_chat_history_function())
         if self.read_tool_call_history:
-            agent_tools.append(self.get_tool_call_history_function(session_id=session_id))
-            self._rebuild_tools = True
+            agent_tools.append(self.get_tool_call_history_function())
         if self.search_previous_sessions_history:
             agent_tools.append(
-                self.get_previous_sessions_messages_function(
-                    num_history_sessions=self.num_history_sessions, user_id=user_id
-                )
+                self.get_previous_sessions_messages_function(num_history_sessions=self.num_history_sessions)
             )
-            self._rebuild_tools = True
 
         if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
             agent_tools.append(self.update_memory)
         elif isinstance(self.memory, Memory) and self.enable_agentic_memory:
-            agent_tools.append(self.get_update_user_memory_function(user_id=user_id, async_mode=async_mode))
-            self._rebuild_tools = True
+            agent_tools.append(self.get_update_user_memory_function(async_mode=async_mode))
 
         # Add tools for accessing knowledge
         if self.knowledge is not None or self.retriever is not None:
@@ -3683,16 +3720,9 @@ class Agent:
             if self.search_knowledge:
                 # Use async or sync search based on async_mode
                 if self.enable_agentic_knowledge_filters:
-                    agent_tools.append(
-                        self.search_knowledge_base_with_agentic_filters_function(
-                            async_mode=async_mode, knowledge_filters=knowledge_filters
-                        )
-                    )
+                    agent_tools.append(self.search_knowledge_base_with_agentic_filters_function(async_mode=async_mode))
                 else:
-                    agent_tools.append(
-                        self.search_knowledge_base_function(async_mode=async_mode, knowledge_filters=knowledge_filters)
-                    )
-                self._rebuild_tools = True
+                    agent_tools.append(self.search_knowledge_base_function(async_mode=async_mode))
 
             if self.update_knowledge:
                 agent_tools.append(self.add_to_knowledge)
@@ -3700,8 +3730,7 @@ class Agent:
         # Add transfer tools
         if self.has_team and self.team is not None:
             for agent_index, agent in enumerate(self.team):
-                agent_tools.append(self.get_transfer_function(agent, agent_index, session_id))
-            self._rebuild_tools = True
+                agent_tools.append(self.get_transfer_function(agent, agent_index))
 
         return agent_tools
 
@@ -3713,8 +3742,20 @@ class Agent:
         async_mode: bool = False,
         knowledge_filters: Optional[Dict[str, Any]] = None,
     ) -> None:
-        if self._rebuild_tools:
+        # Only the run context changes between runs. The tools read it when called, so they are reused.
+        self._tool_context = ToolRunContext(session_id=session_id, user_id=user_id, knowledge_filters=knowledge_filters)
+
+        # Check if we need strict mode for the functions for the model
+        strict = bool(
+            self.response_model is not None
+            and (self.structured_outputs or (not self.use_json_mode))
+            and model.supports_native_structured_outputs
+        )
+
+        tools_key = (async_mode, strict)
+        if self._rebuild_tools or self._tools_key != tools_key:
             self._rebuild_tools = False
+            self._tools_key = tools_key
 
             agent_tools = self.get_tools(
                 session_id=session_id, async_mode=async_mode, user_id=user_id, knowledge_filters=knowledge_filters
@@ -3728,15 +3769,6 @@ class Agent:
             if agent_tools is not None and len(agent_tools) > 0:
                 log_debug("Processing tools for model")
 
-                # Check if we need strict mode for the functions for the model
-                strict = False
-                if (
-                    self.response_model is not None
-                    and (self.structured_outputs or (not self.use_json_mode))
-                    and model.supports_native_structured_outputs
-                ):
-                    strict = True
-
                 for tool in agent_tools:
                     if isinstance(tool, Dict):
                         # If a dict is passed, it is a builtin tool
@@ -3749,6 +3781,8 @@ class Agent:
                         for name, func in tool.functions.items():
                             # If the function does not exist in self.functions
                             if name not in self._functions_for_model:
+                                # Copies of an Agent share its toolkits, so each gets its own Function to bind
+                                func = func.model_copy(update={"parameters": dict(func.parameters)})
                                 func._agent = self
                                 func.process_entrypoint(strict=strict)
                                 if strict and func.strict is None:
@@ -3765,15 +3799,17 @@ class Agent:
 
                     elif isinstance(tool, Function):
                         if tool.name not in self._functions_for_model:
-                            tool._agent = self
-                            tool.process_entrypoint(strict=strict)
-                            if strict and tool.strict is None:
-                                tool.strict = True
+                            # Copies of an Agent share its functions, so each gets its own Function to bind
+                            func = tool.model_copy(update={"parameters": dict(tool.parameters)})
+                            func._agent = self
+                            func.process_entrypoint(strict=strict)
+                            if strict and func.strict is None:
+                                func.strict = True
                             if self.tool_hooks is not None:
-                                tool.tool_hooks = self.tool_hooks
-                            self._functions_for_model[tool.name] = tool
-                            self._tools_for_model.append({"type": "function", "function": tool.to_dict()})
-                            log_debug(f"Added tool {tool.name}")
+                                func.tool_hooks = self.tool_hooks
+                            self._functions_for_model[func.name] = func
+                            self._tools_for_model.append({"type": "function", "function": func.to_dict()})
+                            log_debug(f"Added tool {func.name}")
 
                         # Add instructions from the Function
                         if tool.add_instructions and tool.instructions is not None:
@@ -3928,9 +3964,8 @@ class Agent:
             else:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
-                run_responses = self.memory.runs.get(session_id, [])  # type: ignore
                 memory_dict = self.memory.to_dict()
-                memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                memory_dict["runs"] = self._get_stored_runs(session_id) + self.memory.get_session_runs(session_id)
         else:
             memory_dict = None
 
@@ -3948,6 +3983,22 @@ class Agent:
             created_at=int(time()),
         )
 
+    def _get_stored_runs(self, session_id: str) -> List[Dict[str, Any]]:
+        """Return the runs of the session that Memory only keeps in storage, as stored"""
+        self.memory = cast(Memory, self.memory)
+        num_stored_runs = self.memory.get_num_stored_runs(session_id)
+        if num_stored_runs == 0:
+            return []
+
+        # The last session read or written holds the stored runs, otherwise read them back
+        session = self.agent_session
+        if (session is None or session.session_id != session_id) and self.storage is not None:
+            session = cast(AgentSession, self.storage.read(session_id=session_id))
+        stored_runs = (session.memory or {}).get("runs", []) if session is not None else []
+        if len(stored_runs) < num_stored_runs:
+            log_warning(f"Only {len(stored_runs)} of {num_stored_runs} stored runs found for session {session_id}")
+        return stored_runs[:num_stored_runs]
+
     def load_agent_session(self, session: AgentSession):
         """Load the existing Agent from an AgentSession (from the database)"""
 
@@ -4104,15 +4155,7 @@ class Agent:
             elif isinstance(self.memory, Memory):
                 if "runs" in session.memory:
                     try:
-                        if self.memory.runs is None:
-                            self.memory.runs = {}
-                        self.memory.runs[session.session_id] = []
-                        for run in session.memory["runs"]:
-                            run_session_id = run["session_id"]
-                            if "team_id" in run:
-                                self.memory.runs[run_session_id].append(TeamRunResponse.from_dict(run))
-                            else:
-                                self.memory.runs[run_session_id].append(RunResponse.from_dict(run))
+                        self.memory.load_session_runs(session.session_id, session.memory["runs"])
                     except Exception as e:
                         log_warning(f"Failed to load runs from memory: {e}")
                 if "memories" in session.memory:
@@ -4179,6 +4222,9 @@ class Agent:
                 AgentSession,
                 self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
             )
+            if self.agent_session is not None and isinstance(self.memory, Memory):
+                # Archived runs are in storage now
+                self.memory.release_archived_runs(session_id)
         return self.agent_session
 
     def add_introduction(self, introduction: str) -> None:
@@ -5086,6 +5132,58 @@ class Agent:
         log_debug(f"Created new {self.__class__.__name__}")
         return new_agent
 
+    def run_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create and return a cheap copy of this Agent for a single run, e.g. to serve one request.
+
+        The copy shares the configuration, model, tools, knowledge, storage and Memory v2 with this Agent,
+        and gets its own run and session state, so concurrent runs on copies of one Agent do not interfere.
+        Use deep_copy() for a fully independent Agent.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields to set on the copy.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        from copy import copy, deepcopy
+
+        # Memory v2 holds runs per session and memories per user, so the copies share it
+        if self.memory is None:
+            self.memory = Memory()
+            self._memory_deepcopy_done = True
+
+        new_agent = copy(self)
+        if isinstance(self.memory, AgentMemory):
+            # AgentMemory holds the messages of a single session
+            new_agent.memory = self.memory.deep_copy()
+        new_agent._memory_deepcopy_done = True
+
+        # Per-session state
+        new_agent.agent_session = None
+        new_agent.session_metrics = None
+        new_agent.session_state = deepcopy(self.session_state) if self.session_state is not None else None
+        new_agent.extra_data = deepcopy(self.extra_data) if self.extra_data is not None else None
+        new_agent.images = list(self.images) if self.images is not None else None
+        new_agent.videos = list(self.videos) if self.videos is not None else None
+        new_agent.audio = list(self.audio) if self.audio is not None else None
+
+        # Per-run state
+        new_agent.run_id = None
+        new_agent.run_input = None
+        new_agent.run_messages = None
+        new_agent.run_response = None
+        new_agent._tool_instructions = None
+        new_agent._tools_for_model = None
+        new_agent._functions_for_model = None
+        new_agent._rebuild_tools = True
+        new_agent._tools_key = None
+        new_agent._tool_context = ToolRunContext()
+
+        if update:
+            for field_name, value in update.items():
+                setattr(new_agent, field_name, value)
+        return new_agent
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Helper method to deep copy a field based on its type."""
         from copy import copy, deepcopy
@@ -5144,7 +5242,7 @@ class Agent:
                 member_agent.team_data = {}
 
             # Update the member agent team_data to include leader_session_id, leader_agent_id and leader_run_id
-            member_agent.team_data["leader_session_id"] = session_id
+            member_agent.team_data["leader_session_id"] = session_id or self._tool_context.session_id
             member_agent.team_data["leader_agent_id"] = self.agent_id
             member_agent.team_data["leader_run_id"] = self.run_id
 
@@ -6215,7 +6313,7 @@ class Agent:
                 str: A string indicating the status of the task.
             """
             self.memory = cast(Memory, self.memory)
-            response = self.memory.update_memory_task(task=task, user_id=user_id)
+            response = self.memory.update_memory_task(task=task, user_id=user_id or self._tool_context.user_id)
 
             return response
 
@@ -6231,7 +6329,9 @@ class Agent:
                 str: A string indicating the status of the task.
             """
             self.memory = cast(Memory, self.memory)
-            response = await self.memory.aupdate_memory_task(task=task, user_id=user_id)
+            response = await self.memory.aupdate_memory_task(
+                task=task, user_id=user_id or self._tool_context.user_id
+            )
             return response
 
         if async_mode:
@@ -6241,7 +6341,7 @@ class Agent:
 
         return Function.from_callable(update_user_memory_function, name="update_user_memory")
 
-    def get_chat_history_function(self, session_id: str) -> Callable:
+    def get_chat_history_function(self, session_id: Optional[str] = None) -> Callable:
         def get_chat_history(num_chats: Optional[int] = None) -> str:
             """Use this function to get the chat history between the user and agent.
 
@@ -6277,7 +6377,9 @@ class Agent:
                         break
 
             elif isinstance(self.memory, Memory):
-                all_chats = self.memory.get_messages_for_session(session_id=session_id)
+                all_chats = self.memory.get_messages_for_session(
+                    session_id=session_id or self._tool_context.session_id  # type: ignore
+                )
 
                 if len(all_chats) == 0:
                     return ""
@@ -6295,7 +6397,7 @@ class Agent:
 
         return get_chat_history
 
-    def get_tool_call_history_function(self, session_id: str) -> Callable:
+    def get_tool_call_history_function(self, session_id: Optional[str] = None) -> Callable:
         def get_tool_call_history(num_calls: int = 3) -> str:
             """Use this function to get the tools called by the agent in reverse chronological order.
 
@@ -6315,7 +6417,10 @@ class Agent:
             if isinstance(self.memory, AgentMemory):
                 tool_calls = self.memory.get_tool_calls(num_calls=num_calls)
             elif isinstance(self.memory, Memory):
-                tool_calls = self.memory.get_tool_calls(session_id=session_id, num_calls=num_calls)
+                tool_calls = self.memory.get_tool_calls(
+                    session_id=session_id or self._tool_context.session_id,  # type: ignore
+                    num_calls=num_calls,
+                )
             else:
                 return ""
             if len(tool_calls) == 0:
@@ -6344,7 +6449,9 @@ class Agent:
             self.run_response = cast(RunResponse, self.run_response)
             retrieval_timer = Timer()
             retrieval_timer.start()
-            docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=query, filters=knowledge_filters)
+            docs_from_knowledge = self.get_relevant_docs_from_knowledge(
+                query=query, filters=knowledge_filters or self._tool_context.knowledge_filters
+            )
             if docs_from_knowledge is not None:
                 references = MessageReferences(
                     query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
@@ -6376,7 +6483,9 @@ class Agent:
             self.run_response = cast(RunResponse, self.run_response)
             retrieval_timer = Timer()
             retrieval_timer.start()
-            docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(query=query, filters=knowledge_filters)
+            docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(
+                query=query, filters=knowledge_filters or self._tool_context.knowledge_filters
+            )
             if docs_from_knowledge is not None:
                 references = MessageReferences(
                     query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
@@ -6415,7 +6524,9 @@ class Agent:
             Returns:
                 str: A string containing the response from the knowledge base.
             """
-            search_filters = self._get_agentic_or_user_search_filters(filters, knowledge_filters)
+            search_filters = self._get_agentic_or_user_search_filters(
+                filters, knowledge_filters or self._tool_context.knowledge_filters
+            )
 
             # Get the relevant documents from the knowledge base, passing filters
             self.run_response = cast(RunResponse, self.run_response)
@@ -6451,7 +6562,9 @@ class Agent:
             Returns:
                 str: A string containing the response from the knowledge base.
             """
-            search_filters = self._get_agentic_or_user_search_filters(filters, knowledge_filters)
+            search_filters = self._get_agentic_or_user_search_filters(
+                filters, knowledge_filters or self._tool_context.knowledge_filters
+            )
 
             self.run_response = cast(RunResponse, self.run_response)
             retrieval_timer = Timer()
@@ -7727,7 +7840,7 @@ class Agent:
         """Factory function to create a get_previous_session_messages function.
 
         Args:
-            user_id: The user ID to get sessions for
+            user_id: The user ID to get sessions for. Defaults to the user of the current run.
             num_history_sessions: The last n sessions to be taken from db
 
         Returns:
@@ -7746,7 +7859,9 @@ class Agent:
             if self.storage is None:
                 return "Storage not available"
 
-            selected_sessions = self.storage.get_recent_sessions(limit=num_history_sessions, user_id=user_id)
+            selected_sessions = self.storage.get_recent_sessions(
+                limit=num_history_sessions, user_id=user_id or self._tool_context.user_id
+            )
 
             all_messages = []
             seen_message_pairs = set()
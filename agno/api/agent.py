@@ -1,4 +1,4 @@
-from agno.api.api import api
+from agno.api.exporter import get_telemetry_exporter
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.agent import AgentCreate, AgentRunCreate, AgentSessionCreate
 from agno.cli.settings import agno_cli_settings
@@ -10,75 +10,33 @@ def create_agent_session(session: AgentSessionCreate, monitor: bool = False) ->
         return
 
     log_debug("Logging Agent Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
-                json={"session": session.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent session: {e}")
-    return
+    get_telemetry_exporter().enqueue(
+        ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
+        {"session": session.model_dump(exclude_none=True)},
+    )
 
 
 def create_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
     if not agno_cli_settings.api_enabled:
         return
 
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent run: {e}")
-    return
+    get_telemetry_exporter().enqueue(
+        ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
+        {"run": run.model_dump(exclude_none=True)},
+    )
 
 
 async def acreate_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
-    if not agno_cli_settings.api_enabled:
-        return
-
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent run: {e}")
-    return
+    create_agent_run(run=run, monitor=monitor)
 
 
 def create_agent(agent: AgentCreate) -> None:
     if not agno_cli_settings.api_enabled:
         return
 
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_CREATE,
-                json=agent.model_dump(exclude_none=True),
-            )
-
-            log_debug(f"Created Agent on Platform. ID: {agent.agent_id}")
-        except Exception as e:
-            log_debug(f"Could not create Agent: {e}")
-    return
+    get_telemetry_exporter().enqueue(ApiRoutes.AGENT_CREATE, agent.model_dump(exclude_none=True))
+    log_debug(f"Queued Agent creation on Platform. ID: {agent.agent_id}")
 
 
 async def acreate_agent(agent: AgentCreate) -> None:
-    if not agno_cli_settings.api_enabled:
-        return
-
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.AGENT_CREATE,
-                json=agent.model_dump(exclude_none=True),
-            )
-            log_debug(f"Created Agent on Platform. ID: {agent.agent_id}")
-        except Exception as e:
-            log_debug(f"Could not create Agent: {e}")
-    return
+    create_agent(agent=agent)
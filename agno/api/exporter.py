@@ -0,0 +1,230 @@
+import atexit
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import Empty, Full, Queue
+from typing import Any, Dict, List, Optional, Union
+
+from agno.utils.log import log_debug, log_warning
+
+
+@dataclass
+class TelemetryEvent:
+    """A telemetry or monitoring payload waiting to be exported"""
+
+    # API route the payload is posted to
+    route: str
+    # JSON body of the request
+    payload: Dict[str, Any]
+    created_at: float = field(default_factory=time.time)
+
+
+class TelemetrySink(ABC):
+    """Destination for batches of telemetry events"""
+
+    @abstractmethod
+    def export(self, events: List[TelemetryEvent]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class HttpSink(TelemetrySink):
+    """Posts events to the Agno API, reusing one authenticated client and its connection pool.
+
+    Args:
+        base_url (Optional[str]): API url to post to. Defaults to the configured Agno API url.
+        timeout (float): Request timeout in seconds.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10):
+        self.base_url = base_url
+        self.timeout = timeout
+        self._client: Optional[Any] = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from httpx import Client as HttpxClient
+
+            from agno.api.api import api
+            from agno.cli.settings import agno_cli_settings
+
+            self._client = HttpxClient(
+                base_url=self.base_url or agno_cli_settings.api_url,
+                headers=api.authenticated_headers,
+                timeout=self.timeout,
+            )
+        return self._client
+
+    def export(self, events: List[TelemetryEvent]) -> None:
+        for event in events:
+            try:
+                response = self.client.post(event.route, json=event.payload)
+                response.raise_for_status()
+            except Exception as e:
+                log_debug(f"Could not export event to {event.route}: {e}")
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class JsonlSink(TelemetrySink):
+    """Appends events to a local JSON Lines file, one object per event"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def export(self, events: List[TelemetryEvent]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for event in events:
+                record = {"route": event.route, "created_at": event.created_at, "payload": event.payload}
+                f.write(json.dumps(record, default=str) + "\n")
+
+
+class OpenTelemetrySink(TelemetrySink):
+    """Records each event as a span on an OpenTelemetry tracer, with the payload as a JSON attribute"""
+
+    def __init__(self, tracer_name: str = "agno"):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("`opentelemetry-api` not installed. Please install using `pip install opentelemetry-api`")
+
+        self.tracer = trace.get_tracer(tracer_name)
+
+    def export(self, events: List[TelemetryEvent]) -> None:
+        for event in events:
+            start_time = int(event.created_at * 1e9)
+            span = self.tracer.start_span(event.route, start_time=start_time)
+            span.set_attribute("agno.payload", json.dumps(event.payload, default=str))
+            span.end(end_time=start_time)
+
+
+class TelemetryExporter:
+    """Exports telemetry events from a background thread, so runs never wait on the network.
+
+    Events are queued and sent to every sink in batches. When the queue is full, new events are dropped
+    rather than slowing down the run that produced them.
+
+    Args:
+        sinks (Optional[List[TelemetrySink]]): Where events are exported. Defaults to the Agno API.
+        max_queue_size (int): Number of events that can wait to be exported.
+        batch_size (int): Maximum number of events exported together.
+        flush_interval (float): Seconds to wait for a batch to fill up before exporting it.
+    """
+
+    def __init__(
+        self,
+        sinks: Optional[List[TelemetrySink]] = None,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+    ):
+        self.sinks: List[TelemetrySink] = sinks if sinks is not None else [HttpSink()]
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        self._queue: "Queue[TelemetryEvent]" = Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def enqueue(self, route: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event for export. Returns False if the queue was full and the event was dropped."""
+        try:
+            self._queue.put_nowait(TelemetryEvent(route=route, payload=payload))
+        except Full:
+            self.dropped += 1
+            log_debug(f"Telemetry queue is full, dropped event for {route}")
+            return False
+        self._start_worker()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event was exported. Returns False if the timeout expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5) -> None:
+        """Export the queued events and close the sinks"""
+        if not self.flush(timeout=timeout):
+            log_warning("Timed out exporting telemetry events")
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                log_debug(f"Error closing telemetry sink: {e}")
+
+    def _start_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._work, name="agno-telemetry", daemon=True)
+                self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except Empty:
+                    break
+
+            for sink in self.sinks:
+                try:
+                    sink.export(batch)
+                except Exception as e:
+                    log_debug(f"Could not export telemetry events: {e}")
+            for _ in batch:
+                self._queue.task_done()
+
+
+_exporter: Optional[TelemetryExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_telemetry_exporter() -> TelemetryExporter:
+    """Return the process-wide telemetry exporter"""
+    global _exporter
+
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = TelemetryExporter()
+    return _exporter
+
+
+def set_telemetry_exporter(exporter: TelemetryExporter) -> None:
+    """Replace the process-wide telemetry exporter, e.g. to export to a local file or collector"""
+    global _exporter
+
+    with _exporter_lock:
+        previous, _exporter = _exporter, exporter
+    if previous is not None:
+        previous.close()
+
+
+@atexit.register
+def _close_on_exit() -> None:
+    if _exporter is not None:
+        _exporter.close(timeout=5)
@@ -9,6 +9,7 @@ from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.utils import StreamEventEncoder
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.run.response import RunResponseErrorEvent
@@ -27,7 +28,9 @@ async def agent_chat_response_streamer(
     images: Optional[List[Image]] = None,
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
+    delta: bool = False,
 ) -> AsyncGenerator:
+    encoder = StreamEventEncoder(delta=delta)
     try:
         run_response = await agent.arun(
             message,
@@ -41,12 +44,12 @@ async def agent_chat_response_streamer(
         )
         async for run_response_chunk in run_response:
             run_response_chunk = cast(RunResponse, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -59,7 +62,9 @@ async def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    delta: bool = False,
 ) -> AsyncGenerator:
+    encoder = StreamEventEncoder(delta=delta)
     try:
         run_response = await team.arun(
             message,
@@ -74,12 +79,12 @@ async def team_chat_response_streamer(
         )
         async for run_response_chunk in run_response:
             run_response_chunk = cast(TeamRunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -253,6 +258,7 @@ def get_async_router(
     async def run_agent_or_team_or_workflow(
         message: str = Form(None),
         stream: bool = Form(False),
+        stream_delta: bool = Form(False),
         monitor: bool = Form(False),
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
@@ -306,6 +312,8 @@ def get_async_router(
                 pass
 
         if agent:
+            # Run on a copy, so concurrent requests to this agent do not share run state
+            agent = agent.run_copy()
             agent.monitoring = bool(monitor)
         elif team:
             team.monitoring = bool(monitor)
@@ -333,6 +341,7 @@ def get_async_router(
                         images=base64_images if base64_images else None,
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
+                        delta=stream_delta,
                     ),
                     media_type="text/event-stream",
                 )
@@ -347,6 +356,7 @@ def get_async_router(
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
                         files=document_files if document_files else None,
+                        delta=stream_delta,
                     ),
                     media_type="text/event-stream",
                 )
@@ -9,6 +9,7 @@ from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.utils import StreamEventEncoder
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.run.base import RunStatus
@@ -28,7 +29,9 @@ def agent_chat_response_streamer(
     images: Optional[List[Image]] = None,
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
+    delta: bool = False,
 ) -> Generator:
+    encoder = StreamEventEncoder(delta=delta)
     try:
         run_response = agent.run(
             message,
@@ -42,10 +45,10 @@ def agent_chat_response_streamer(
         )
         for run_response_chunk in run_response:
             run_response_chunk = cast(RunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         error_response = RunResponse(content=str(e), status=RunStatus.error)
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -58,7 +61,9 @@ def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    delta: bool = False,
 ) -> Generator:
+    encoder = StreamEventEncoder(delta=delta)
     try:
         run_response = team.run(
             message,
@@ -73,12 +78,12 @@ def team_chat_response_streamer(
         )
         for run_response_chunk in run_response:
             run_response_chunk = cast(TeamRunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -252,6 +257,7 @@ def get_sync_router(
     def run_agent_or_team_or_workflow(
         message: str = Form(None),
         stream: bool = Form(True),
+        stream_delta: bool = Form(False),
         monitor: bool = Form(False),
         agent_id: Optional[str] = Query(None),
         team_id: Optional[str] = Query(None),
@@ -298,6 +304,8 @@ def get_sync_router(
                 raise HTTPException(status_code=400, detail="Workflow input is required")
 
         if agent:
+            # Run on a copy, so concurrent requests to this agent do not share run state
+            agent = agent.run_copy()
             agent.monitoring = bool(monitor)
         elif team:
             team.monitoring = bool(monitor)
@@ -321,6 +329,7 @@ def get_sync_router(
                         images=base64_images if base64_images else None,
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
+                        delta=stream_delta,
                     ),
                     media_type="text/event-stream",
                 )
@@ -335,6 +344,7 @@ def get_sync_router(
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
                         files=document_files if document_files else None,
+                        delta=stream_delta,
                     ),
                     media_type="text/event-stream",
                 )
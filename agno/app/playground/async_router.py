@@ -33,6 +33,7 @@ from agno.app.playground.schemas import (
     WorkflowsGetResponse,
 )
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.utils import StreamEventEncoder
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.memory.agent import AgentMemory
@@ -56,7 +57,9 @@ async def chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    delta: bool = False,
 ) -> AsyncGenerator:
+    encoder = StreamEventEncoder(delta=delta)
     try:
         run_response = await agent.arun(
             message,
@@ -70,7 +73,7 @@ async def chat_response_streamer(
             stream_intermediate_steps=True,
         )
         async for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         import traceback
 
@@ -78,7 +81,7 @@ async def chat_response_streamer(
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -89,6 +92,7 @@ async def agent_acontinue_run_streamer(
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
 ) -> AsyncGenerator:
+    encoder = StreamEventEncoder()
     try:
         continue_response = await agent.acontinue_run(
             run_id=run_id,
@@ -100,7 +104,7 @@ async def agent_acontinue_run_streamer(
         )
         async for run_response_chunk in continue_response:
             run_response_chunk = cast(RunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         import traceback
 
@@ -108,7 +112,7 @@ async def agent_acontinue_run_streamer(
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -121,7 +125,9 @@ async def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    delta: bool = False,
 ) -> AsyncGenerator:
+    encoder = StreamEventEncoder(delta=delta)
     try:
         run_response = await team.arun(
             message,
@@ -135,7 +141,7 @@ async def team_chat_response_streamer(
             stream_intermediate_steps=True,
         )
         async for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+            yield encoder.encode(run_response_chunk)
     except Exception as e:
         import traceback
 
@@ -143,7 +149,7 @@ async def team_chat_response_streamer(
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield encoder.encode(error_response)
         return
 
 
@@ -248,6 +254,7 @@ def get_async_playground_router(
         agent_id: str,
         message: str = Form(...),
         stream: bool = Form(True),
+        stream_delta: bool = Form(False),
         monitor: bool = Form(False),
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
@@ -257,6 +264,8 @@ def get_async_playground_router(
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
+        # Run on a copy, so concurrent requests to this agent do not share run state
+        agent = agent.run_copy()
 
         if session_id is not None and session_id != "":
             logger.debug(f"Continuing session: {session_id}")
@@ -400,6 +409,7 @@ def get_async_playground_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=input_files if input_files else None,
+                    delta=stream_delta,
                 ),
                 media_type="text/event-stream",
             )
@@ -440,6 +450,7 @@ def get_async_playground_router(
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
+        agent = agent.run_copy()
 
         if session_id is None or session_id == "":
             logger.warning(
@@ -753,6 +764,7 @@ def get_async_playground_router(
         team_id: str,
         message: str = Form(...),
         stream: bool = Form(True),
+        stream_delta: bool = Form(False),
         monitor: bool = Form(True),
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
@@ -838,6 +850,7 @@ def get_async_playground_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=document_files if document_files else None,
+                    delta=stream_delta,
                 ),
                 media_type="text/event-stream",
             )
@@ -1,12 +1,22 @@
-from typing import Optional
+import json
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from fastapi import HTTPException, UploadFile
 
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
+from agno.run.base import BaseRunResponseEvent
 from agno.utils.log import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Encoder without indentation or spaces, built once instead of per event
+_compact_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 def process_image(file: UploadFile) -> Image:
     content = file.file.read()
@@ -52,3 +62,61 @@ def generate_id(name: Optional[str] = None) -> str:
         return name.lower().replace(" ", "-").replace("_", "-")
     else:
         return str(uuid4())
+
+
+def dumps_compact(data: Any) -> str:
+    """Serialize to JSON without whitespace, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            # e.g. non-string dict keys, which the standard encoder converts
+            pass
+    return _compact_json_encoder.encode(data)
+
+
+class StreamEventEncoder:
+    """Encodes the events of one streamed run as compact JSON.
+
+    With delta=True, envelope fields such as the run, session and agent ids are only sent when they change,
+    so each content event carries little more than its new content. Clients carry the last value forward,
+    and a field sent as null no longer has a value.
+
+    Args:
+        delta (bool): Leave out envelope fields that are unchanged since the previous event.
+    """
+
+    ENVELOPE_FIELDS = (
+        "agent_id",
+        "agent_name",
+        "team_id",
+        "team_name",
+        "run_id",
+        "session_id",
+        "team_session_id",
+        "content_type",
+    )
+
+    def __init__(self, delta: bool = False):
+        self.delta = delta
+        self._envelope: Dict[str, Any] = {}
+
+    def encode(self, event: BaseRunResponseEvent) -> str:
+        try:
+            _dict = event.to_dict()
+        except Exception:
+            logger.error("Failed to convert response event to json", exc_info=True)
+            raise
+
+        if self.delta:
+            for key in self.ENVELOPE_FIELDS:
+                if key in _dict:
+                    if key in self._envelope and self._envelope[key] == _dict[key]:
+                        del _dict[key]
+                    else:
+                        self._envelope[key] = _dict[key]
+                elif key in self._envelope:
+                    # to_dict leaves out None values, so a field that was sent before is cleared explicitly
+                    _dict[key] = None
+                    del self._envelope[key]
+        return dumps_compact(_dict)
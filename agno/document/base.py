@@ -46,3 +46,14 @@ class Document:
         import json
 
         return cls(**json.loads(document))
+
+
+def embed_documents(documents: List[Document], embedder: Embedder) -> None:
+    """Embed a batch of documents with a single call to the embedder"""
+    if not documents:
+        return
+
+    results = embedder.get_embeddings_and_usage([document.content for document in documents])
+    for document, (embedding, usage) in zip(documents, results):
+        document.embedding = embedding
+        document.usage = usage
@@ -7,6 +7,8 @@ from agno.document.chunking.strategy import ChunkingStrategy
 class DocumentChunking(ChunkingStrategy):
     """A chunking strategy that splits text based on document structure like paragraphs and sections"""
 
+    parallel_safe = True
+
     def __init__(self, chunk_size: int = 5000, overlap: int = 0):
         self.chunk_size = chunk_size
         self.overlap = overlap
@@ -7,6 +7,8 @@ from agno.document.chunking.strategy import ChunkingStrategy
 class FixedSizeChunking(ChunkingStrategy):
     """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
 
+    parallel_safe = True
+
     def __init__(self, chunk_size: int = 5000, overlap: int = 0):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
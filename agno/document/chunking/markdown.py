@@ -15,6 +15,8 @@ from agno.document.chunking.strategy import ChunkingStrategy
 class MarkdownChunking(ChunkingStrategy):
     """A chunking strategy that splits markdown based on structure like headers, paragraphs and sections"""
 
+    parallel_safe = True
+
     def __init__(self, chunk_size: int = 5000, overlap: int = 0):
         self.chunk_size = chunk_size
         self.overlap = overlap
@@ -0,0 +1,124 @@
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+from agno.utils.log import log_debug
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _chunk_batch(strategy: ChunkingStrategy, documents: List[Document]) -> List[Document]:
+    chunks: List[Document] = []
+    for document in documents:
+        chunks.extend(strategy.chunk(document))
+    return chunks
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    # Forking a process that runs threads (an event loop, http clients, executors) can deadlock the child,
+    # so workers are started from a clean forkserver process, or spawned where there is none
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_chunking_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process pool used for chunking, shared by every reader so workers are started only once"""
+    global _pool, _pool_workers
+
+    with _pool_lock:
+        # A pool whose worker died cannot be used again
+        broken = _pool is not None and getattr(_pool, "_broken", False)
+        if _pool is None or broken or _pool_workers < workers:
+            if _pool is not None:
+                # Work already submitted by other callers still completes on the old pool
+                _pool.shutdown(wait=False)
+            log_debug(f"Starting chunking process pool with {workers} workers")
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context())
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_chunking_pool() -> None:
+    """Stop the chunking process pool, if it was started"""
+    global _pool, _pool_workers
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool, _pool_workers = None, 0
+
+
+atexit.register(shutdown_chunking_pool)
+
+
+def _plan(
+    strategy: ChunkingStrategy, documents: List[Document], max_workers: Optional[int], min_parallel_size: int
+) -> Tuple[int, List[List[Document]]]:
+    """Return the number of workers and the batches to chunk on them, or no batches to chunk in-process"""
+    workers = max_workers or os.cpu_count() or 1
+    total_size = sum(len(document.content) for document in documents)
+    if workers <= 1 or len(documents) <= 1 or total_size < min_parallel_size or not strategy.parallel_safe:
+        return 1, []
+
+    workers = min(workers, len(documents))
+    # A few batches per worker keeps the pool busy when document sizes are uneven
+    num_batches = min(len(documents), workers * 4)
+    step = -(-len(documents) // num_batches)
+    log_debug(f"Chunking {len(documents)} documents ({total_size} chars) on {workers} processes")
+    return workers, [documents[i : i + step] for i in range(0, len(documents), step)]
+
+
+def _submit(strategy: ChunkingStrategy, workers: int, batches: List[List[Document]]) -> List[Future]:
+    pool = get_chunking_pool(workers)
+    # The strategy and documents are task arguments, so concurrent calls never share state
+    return [pool.submit(_chunk_batch, strategy, batch) for batch in batches]
+
+
+def chunk_documents_parallel(
+    strategy: ChunkingStrategy,
+    documents: List[Document],
+    max_workers: Optional[int] = None,
+    min_parallel_size: int = 1024 * 1024,
+) -> List[Document]:
+    """Chunk documents on a process pool, returning the chunks in input order.
+
+    Documents are dispatched in contiguous batches, a few per worker, rather than one task per document.
+    Inputs smaller than `min_parallel_size` characters, and strategies that are not `parallel_safe`,
+    are chunked on the calling thread since the pool would cost more than it saves.
+
+    Args:
+        strategy (ChunkingStrategy): The chunking strategy to apply.
+        documents (List[Document]): The documents to chunk.
+        max_workers (Optional[int]): Number of worker processes. Defaults to the number of CPUs.
+        min_parallel_size (int): Minimum total content length, in characters, worth parallelizing.
+    """
+    workers, batches = _plan(strategy, documents, max_workers, min_parallel_size)
+    if not batches:
+        return _chunk_batch(strategy, documents)
+
+    futures = _submit(strategy, workers, batches)
+    return [chunk for future in futures for chunk in future.result()]
+
+
+async def achunk_documents_parallel(
+    strategy: ChunkingStrategy,
+    documents: List[Document],
+    max_workers: Optional[int] = None,
+    min_parallel_size: int = 1024 * 1024,
+) -> List[Document]:
+    """Async version of `chunk_documents_parallel`, awaiting the process pool without blocking the event loop"""
+    workers, batches = _plan(strategy, documents, max_workers, min_parallel_size)
+    if not batches:
+        return await asyncio.to_thread(_chunk_batch, strategy, documents)
+
+    results = await asyncio.gather(*[asyncio.wrap_future(future) for future in _submit(strategy, workers, batches)])
+    return [chunk for result in results for chunk in result]
@@ -8,6 +8,8 @@ from agno.document.chunking.strategy import ChunkingStrategy
 class RecursiveChunking(ChunkingStrategy):
     """Chunking strategy that recursively splits text into chunks by finding natural break points"""
 
+    parallel_safe = True
+
     def __init__(self, chunk_size: int = 5000, overlap: int = 0):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
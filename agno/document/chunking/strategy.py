@@ -7,6 +7,9 @@ from agno.document.base import Document
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
 
+    # Whether the strategy is pure CPU work that can run in a worker process (see chunking/parallel.py)
+    parallel_safe: bool = False
+
     @abstractmethod
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
@@ -1,9 +1,10 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Iterable, Iterator, List, Optional
 
 from agno.document.base import Document
 from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.parallel import achunk_documents_parallel, chunk_documents_parallel
 from agno.document.chunking.strategy import ChunkingStrategy
 
 
@@ -15,13 +16,20 @@ class Reader:
     chunk_size: int = 5000
     separators: List[str] = field(default_factory=lambda: ["\n", "\n\n", "\r", "\r\n", "\n\r", "\t", " ", "  "])
     chunking_strategy: Optional[ChunkingStrategy] = None
+    # Number of worker processes used to chunk many documents at once. None chunks on the calling thread.
+    chunking_workers: Optional[int] = None
 
     def __init__(
-        self, chunk: bool = True, chunk_size: int = 5000, chunking_strategy: Optional[ChunkingStrategy] = None
+        self,
+        chunk: bool = True,
+        chunk_size: int = 5000,
+        chunking_strategy: Optional[ChunkingStrategy] = None,
+        chunking_workers: Optional[int] = None,
     ) -> None:
         self.chunk = chunk
         self.chunk_size = chunk_size
         self.chunking_strategy = chunking_strategy
+        self.chunking_workers = chunking_workers
 
     def read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
@@ -29,11 +37,67 @@ class Reader:
     async def async_read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
 
+    def read_stream(self, obj: Any) -> Iterator[List[Document]]:
+        """Read incrementally, yielding lists of (chunked) documents so large inputs are never fully in memory.
+        Readers that can stream should override this; by default the whole input is read at once.
+        """
+        yield self.read(obj)
+
     def chunk_document(self, document: Document) -> List[Document]:
         if self.chunking_strategy is None:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
         return self.chunking_strategy.chunk(document)  # type: ignore
 
+    def chunk_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Chunk a list of documents, on a process pool when `chunking_workers` is set.
+
+        Args:
+            documents: List of documents to be chunked.
+
+        Returns:
+            A flattened list of chunked documents, in input order.
+        """
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        if self.chunking_workers and self.chunking_workers > 1:
+            return chunk_documents_parallel(self.chunking_strategy, documents, max_workers=self.chunking_workers)
+        return [chunk for document in documents for chunk in self.chunk_document(document)]
+
+    def chunk_stream(
+        self, documents: Iterable[Document], batch_size: int = 4 * 1024 * 1024
+    ) -> Iterator[List[Document]]:
+        """
+        Chunk a stream of documents, such as the pages of a large file, yielding a list of chunks at a time.
+
+        With `chunking_workers` set, documents are gathered into batches of about `batch_size` characters, and each
+        batch goes through `chunk_documents` and so the process pool. Otherwise each document is chunked as it
+        arrives on the calling thread.
+
+        Args:
+            documents: The documents to chunk, in order.
+            batch_size: Content length, in characters, to gather before chunking a batch on the process pool.
+        """
+        if not self.chunk:
+            for document in documents:
+                yield [document]
+            return
+        if not (self.chunking_workers and self.chunking_workers > 1):
+            for document in documents:
+                yield self.chunk_document(document)
+            return
+
+        batch: List[Document] = []
+        size = 0
+        for document in documents:
+            batch.append(document)
+            size += len(document.content)
+            if size >= batch_size:
+                yield self.chunk_documents(batch)
+                batch, size = [], 0
+        if batch:
+            yield self.chunk_documents(batch)
+
     async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
         """
         Asynchronously chunk a list of documents using the instance's chunk_document method.
@@ -44,6 +108,13 @@ class Reader:
         Returns:
             A flattened list of chunked documents.
         """
+        if self.chunking_workers and self.chunking_workers > 1:
+            if self.chunking_strategy is None:
+                self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+            # Threads give no parallelism for CPU-bound chunking, hand the whole list to the process pool
+            return await achunk_documents_parallel(
+                self.chunking_strategy, documents, max_workers=self.chunking_workers
+            )
 
         async def _chunk_document_async(doc: Document) -> List[Document]:
             return await asyncio.to_thread(self.chunk_document, doc)
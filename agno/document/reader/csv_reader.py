@@ -3,7 +3,7 @@ import csv
 import io
 import os
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -35,11 +35,9 @@ class CSVReader(Reader):
                 file_content = io.StringIO(file.read().decode("utf-8"))  # type: ignore
 
             csv_name = Path(file.name).stem if isinstance(file, Path) else file.name.split(".")[0]
-            csv_content = ""
             with file_content as csvfile:
                 csv_reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
-                for row in csv_reader:
-                    csv_content += ", ".join(row) + "\n"
+                csv_content = "".join(", ".join(row) + "\n" for row in csv_reader)
 
             documents = [
                 Document(
@@ -49,15 +47,76 @@ class CSVReader(Reader):
                 )
             ]
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
             return documents
         except Exception as e:
             logger.error(f"Error reading: {file.name if isinstance(file, IO) else file}: {e}")
             return []
 
+    def read_stream(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', page_size: int = 1000
+    ) -> Iterator[List[Document]]:
+        """
+        Read a CSV file row group by row group, yielding the (chunked) documents of each group, or of each batch
+        of groups when chunking on a process pool. Only the groups being chunked are held in memory.
+
+        Args:
+            file: Path or file-like object
+            delimiter: CSV delimiter
+            quotechar: CSV quote character
+            page_size: Number of rows per group
+        """
+        yield from self.chunk_stream(self._read_pages(file, delimiter, quotechar, page_size))
+
+    def _read_pages(
+        self, file: Union[Path, IO[Any]], delimiter: str, quotechar: str, page_size: int
+    ) -> Iterator[Document]:
+        try:
+            if isinstance(file, Path):
+                if not file.exists():
+                    raise FileNotFoundError(f"Could not find file: {file}")
+                logger.info(f"Reading: {file}")
+                file_content = file.open(newline="", mode="r", encoding="utf-8")
+            else:
+                logger.info(f"Reading retrieved file: {file.name}")
+                file.seek(0)
+                file_content = io.TextIOWrapper(file, encoding="utf-8", newline="")  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading: {file.name if isinstance(file, IO) else file}: {e}")
+            return
+
+        csv_name = Path(file.name).stem if isinstance(file, Path) else file.name.split(".")[0]
+        try:
+            csv_reader = csv.reader(file_content, delimiter=delimiter, quotechar=quotechar)
+            page_rows: List[str] = []
+            page_number = 1
+            start_row = 1
+            for row in csv_reader:
+                page_rows.append(", ".join(row))
+                if len(page_rows) >= page_size:
+                    yield self._build_page(csv_name, page_number, start_row, page_rows)
+                    page_number += 1
+                    start_row += len(page_rows)
+                    page_rows = []
+            if page_rows:
+                yield self._build_page(csv_name, page_number, start_row, page_rows)
+        except Exception as e:
+            logger.error(f"Error reading: {file.name if isinstance(file, IO) else file}: {e}")
+        finally:
+            if isinstance(file, Path):
+                file_content.close()
+            else:
+                # Do not close the caller's file object along with the wrapper
+                file_content.detach()
+
+    def _build_page(self, csv_name: str, page_number: int, start_row: int, page_rows: List[str]) -> Document:
+        return Document(
+            name=csv_name,
+            id=str(uuid4()),
+            meta_data={"page": page_number, "start_row": start_row, "rows": len(page_rows)},
+            content="\n".join(page_rows),
+        )
+
     async def async_read(
         self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', page_size: int = 1000
     ) -> List[Document]:
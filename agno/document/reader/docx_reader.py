@@ -41,10 +41,7 @@ class DocxReader(Reader):
             ]
 
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
             return documents
 
         except Exception as e:
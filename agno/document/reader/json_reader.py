@@ -46,10 +46,7 @@ class JSONReader(Reader):
                 for page_number, content in enumerate(json_contents, start=1)
             ]
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
             return documents
         except Exception:
             raise
@@ -32,10 +32,7 @@ class MarkdownReader(Reader):
 
             documents = [Document(name=file_name, id=str({uuid.uuid4()}), content=file_contents)]
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
             return documents
         except Exception as e:
             logger.error(f"Error reading: {file}: {e}")
@@ -1,6 +1,6 @@
 import asyncio
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from agno.document.base import Document
@@ -85,10 +85,7 @@ async def async_process_image_page(doc_name: str, page_number: int, page: Any) -
 
 class BasePDFReader(Reader):
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
-        chunked_documents: List[Document] = []
-        for document in documents:
-            chunked_documents.extend(self.chunk_document(document))
-        return chunked_documents
+        return self.chunk_documents(documents)
 
 
 class PDFReader(BasePDFReader):
@@ -125,6 +122,35 @@ class PDFReader(BasePDFReader):
             return self._build_chunked_documents(documents)
         return documents
 
+    def read_stream(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[List[Document]]:
+        """Read a PDF page at a time, yielding the (chunked) documents of each page, or of each batch of pages"""
+        try:
+            if isinstance(pdf, str):
+                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+            else:
+                doc_name = pdf.name.split(".")[0]
+        except Exception:
+            doc_name = "pdf"
+
+        log_info(f"Reading: {doc_name}")
+
+        try:
+            doc_reader = DocumentReader(pdf)
+        except PdfStreamError as e:
+            logger.error(f"Error reading PDF: {e}")
+            return
+
+        pages = (
+            Document(
+                name=doc_name,
+                id=str(uuid4()),
+                meta_data={"page": page_number},
+                content=page.extract_text(),
+            )
+            for page_number, page in enumerate(doc_reader.pages, start=1)
+        )
+        yield from self.chunk_stream(pages)
+
     async def async_read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         try:
             if isinstance(pdf, str):
@@ -263,6 +289,30 @@ class PDFImageReader(BasePDFReader):
 
         return documents
 
+    def read_stream(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[List[Document]]:
+        """Read a PDF page at a time, with the text of its images, yielding the (chunked) documents of each page
+        or batch of pages
+        """
+        if not pdf:
+            raise ValueError("No pdf provided")
+
+        try:
+            if isinstance(pdf, str):
+                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+            else:
+                doc_name = pdf.name.split(".")[0]
+        except Exception:
+            doc_name = "pdf"
+
+        log_info(f"Reading: {doc_name}")
+        doc_reader = DocumentReader(pdf)
+
+        pages = (
+            process_image_page(doc_name, page_number, page)
+            for page_number, page in enumerate(doc_reader.pages, start=1)
+        )
+        yield from self.chunk_stream(pages)
+
     async def async_read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
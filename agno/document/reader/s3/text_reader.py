@@ -39,10 +39,7 @@ class S3TextReader(Reader):
                 )
             ]
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
 
             log_debug(f"Deleting: {temporary_file}")
             temporary_file.unlink()
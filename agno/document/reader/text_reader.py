@@ -1,7 +1,8 @@
 import asyncio
+import mmap
 import uuid
 from pathlib import Path
-from typing import IO, Any, List, Union
+from typing import IO, Any, Iterator, List, Union
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
@@ -33,15 +34,71 @@ class TextReader(Reader):
                 )
             ]
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
             return documents
         except Exception as e:
             logger.error(f"Error reading: {file}: {e}")
             return []
 
+    def read_stream(self, file: Union[Path, IO[Any]], block_size: int = 1024 * 1024) -> Iterator[List[Document]]:
+        """Read a text file in line-aligned blocks of about `block_size` bytes, yielding the (chunked) documents
+        of each block, or of each batch of blocks when chunking on a process pool. Files on disk are memory-mapped,
+        so only the blocks being chunked are decoded into memory.
+        """
+        yield from self.chunk_stream(self._read_blocks(file, block_size))
+
+    def _read_blocks(self, file: Union[Path, IO[Any]], block_size: int) -> Iterator[Document]:
+        try:
+            if isinstance(file, Path):
+                if not file.exists():
+                    raise FileNotFoundError(f"Could not find file: {file}")
+                log_info(f"Reading: {file}")
+                file_name = file.stem
+                with file.open("rb") as f:
+                    if file.stat().st_size == 0:
+                        return
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        for part, block in enumerate(self._iter_mmap_blocks(mapped, block_size), start=1):
+                            yield self._build_block(file_name, part, block)
+            else:
+                log_info(f"Reading uploaded file: {file.name}")
+                file_name = file.name.split(".")[0]
+                file.seek(0)
+                part = 1
+                lines: List[bytes] = []
+                size = 0
+                for line in file:
+                    lines.append(line)
+                    size += len(line)
+                    if size >= block_size:
+                        yield self._build_block(file_name, part, b"".join(lines))
+                        part += 1
+                        lines, size = [], 0
+                if lines:
+                    yield self._build_block(file_name, part, b"".join(lines))
+        except Exception as e:
+            logger.error(f"Error reading: {file}: {e}")
+
+    def _iter_mmap_blocks(self, mapped: mmap.mmap, block_size: int) -> Iterator[bytes]:
+        start = 0
+        length = len(mapped)
+        while start < length:
+            end = min(start + block_size, length)
+            if end < length:
+                # Extend the block to the end of the current line
+                newline = mapped.find(b"\n", end)
+                end = length if newline == -1 else newline + 1
+            yield mapped[start:end]
+            start = end
+
+    def _build_block(self, file_name: str, part: int, block: bytes) -> Document:
+        return Document(
+            name=file_name,
+            id=str(uuid.uuid4()),
+            meta_data={"part": part},
+            content=block.decode("utf-8", errors="replace"),
+        )
+
     async def async_read(self, file: Union[Path, IO[Any]]) -> List[Document]:
         try:
             if isinstance(file, Path):
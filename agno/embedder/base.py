@@ -1,6 +1,11 @@
+from collections import OrderedDict
 from dataclasses import dataclass
+from threading import Lock
 from typing import Dict, List, Optional, Tuple
 
+# Guards the query embedding caches, which searches on different threads share
+_query_embeddings_lock = Lock()
+
 
 @dataclass
 class Embedder:
@@ -8,8 +13,42 @@ class Embedder:
 
     dimensions: Optional[int] = 1536
 
+    # Number of recent query embeddings kept by get_query_embedding
+    query_cache_size = 256
+
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts. Embedders that support native batching should override this."""
+        return [self.get_embedding(text) for text in texts]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> List[Tuple[List[float], Optional[Dict]]]:
+        """Embed a batch of texts, returning the embedding and usage for each text"""
+        return [self.get_embedding_and_usage(text) for text in texts]
+
+    def get_query_embedding(self, query: str) -> List[float]:
+        """Embed a search query, reusing the embedding of a recent identical query.
+
+        Vector dbs embed the query to search with it, and search post-processing needs the same vector,
+        so both get it from here and the query is embedded once.
+        """
+        with _query_embeddings_lock:
+            cache: Optional[OrderedDict] = self.__dict__.get("_query_embeddings")
+            if cache is None:
+                cache = self.__dict__["_query_embeddings"] = OrderedDict()
+            embedding = cache.get(query)
+            if embedding is not None:
+                cache.move_to_end(query)
+                return embedding
+
+        embedding = self.get_embedding(query)
+        if embedding:
+            with _query_embeddings_lock:
+                cache[query] = embedding
+                while len(cache) > self.query_cache_size:
+                    cache.popitem(last=False)
+        return embedding
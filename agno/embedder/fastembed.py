@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
+from agno.utils.model_registry import get_or_load_model
 
 try:
     from fastembed import TextEmbedding  # type: ignore
@@ -17,14 +18,36 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    # Number of texts encoded per ONNX run when embedding a batch
+    batch_size: int = 256
+    # Number of ONNX runtime threads. Defaults to the onnxruntime default.
+    threads: Optional[int] = None
+    # Number of worker processes for data-parallel encoding of large batches. None disables it.
+    parallel: Optional[int] = None
+    cache_dir: Optional[str] = None
+    fastembed_client: Optional[Any] = None
 
-    def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)[0]
+    @property
+    def client(self) -> TextEmbedding:
+        if self.fastembed_client:
+            return self.fastembed_client
+
+        self.fastembed_client = get_or_load_model(("fastembed", self.id, self.threads, self.cache_dir), self._load_model)
+        return self.fastembed_client
+
+    def _load_model(self) -> TextEmbedding:
+        _model_params: Dict[str, Any] = {"model_name": self.id}
+        if self.threads is not None:
+            _model_params["threads"] = self.threads
+        if self.cache_dir is not None:
+            _model_params["cache_dir"] = self.cache_dir
+        return TextEmbedding(**_model_params)
 
+    def get_embedding(self, text: str) -> List[float]:
         try:
-            return list(embedding_list)
+            embeddings = self.client.embed(text)
+            embedding_list = list(embeddings)[0]
+            return embedding_list.tolist() if hasattr(embedding_list, "tolist") else list(embedding_list)
         except Exception as e:
             logger.warning(e)
             return []
@@ -35,3 +58,16 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        try:
+            embeddings = self.client.embed(texts, batch_size=self.batch_size, parallel=self.parallel)
+            return [e.tolist() if hasattr(e, "tolist") else list(e) for e in embeddings]
+        except Exception as e:
+            logger.warning(e)
+            return [[] for _ in texts]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> List[Tuple[List[float], Optional[Dict]]]:
+        return [(embedding, None) for embedding in self.get_embeddings(texts)]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -25,6 +25,8 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    # Maximum number of texts sent in one embeddings request when embedding a batch
+    batch_size: int = 100
 
     @property
     def client(self) -> OpenAIClient:
@@ -42,7 +44,7 @@ class OpenAIEmbedder(Embedder):
         self.openai_client = OpenAIClient(**_client_params)
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -72,3 +74,20 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [embedding for embedding, _ in self.get_embeddings_and_usage(texts)]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> List[Tuple[List[float], Optional[Dict]]]:
+        """Embed texts in requests of up to `batch_size` inputs.
+        The usage of each request is attached to its first text, so summing usage over documents stays correct.
+        """
+        results: List[Tuple[List[float], Optional[Dict]]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch = texts[i : i + self.batch_size]
+            response: CreateEmbeddingResponse = self.response(text=batch)
+            usage = response.usage.model_dump() if response.usage else None
+            embeddings = [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+            for j, embedding in enumerate(embeddings):
+                results.append((embedding, usage if j == 0 else None))
+        return results
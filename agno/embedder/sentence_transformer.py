@@ -3,6 +3,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
+from agno.utils.model_registry import get_or_load_model
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -18,18 +19,65 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Device to load the model on, e.g. "cpu" or "cuda". Defaults to the sentence-transformers choice.
+    device: Optional[str] = None
+    # Number of texts encoded per forward pass when embedding a batch
+    batch_size: int = 32
+    # Number of CPU threads used by torch for inference. Defaults to the torch default.
+    num_threads: Optional[int] = None
+    # Apply dynamic int8 quantization to the Linear layers (CPU only)
+    quantize: bool = False
+
+    @property
+    def client(self) -> SentenceTransformer:
+        if self.sentence_transformer_client:
+            return self.sentence_transformer_client
+
+        self.sentence_transformer_client = get_or_load_model(
+            ("sentence_transformer", self.id, self.device, self.quantize), self._load_model
+        )
+        return self.sentence_transformer_client
+
+    def _load_model(self) -> SentenceTransformer:
+        model = SentenceTransformer(model_name_or_path=self.id, device=self.device)
+        if self.num_threads is not None or self.quantize:
+            import torch
+
+            if self.num_threads is not None:
+                torch.set_num_threads(self.num_threads)
+            if self.quantize:
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return model
+
+    def _encode(self, text: Union[str, List[str]]):
+        return self.client.encode(
+            text,
+            prompt=self.prompt,
+            normalize_embeddings=self.normalize_embeddings,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+        )
 
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        if not self.sentence_transformer_client:
-            model = SentenceTransformer(model_name_or_path=self.id)
-        else:
-            model = self.sentence_transformer_client
-        embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
-            return embedding  # type: ignore
+            embedding = self._encode(text)
+            return embedding.tolist() if hasattr(embedding, "tolist") else embedding
         except Exception as e:
             logger.warning(e)
             return []
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        try:
+            embeddings = self._encode(texts)
+            return embeddings.tolist() if hasattr(embeddings, "tolist") else [list(e) for e in embeddings]
+        except Exception as e:
+            logger.warning(e)
+            return [[] for _ in texts]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> List[Tuple[List[float], Optional[Dict]]]:
+        return [(embedding, None) for embedding in self.get_embeddings(texts)]
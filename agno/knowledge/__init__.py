@@ -1,5 +1,17 @@
-from agno.knowledge.agent import AgentKnowledge
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
 
 __all__ = [
     "AgentKnowledge",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.knowledge.agent": ["AgentKnowledge"],
+    },
+)
@@ -1,6 +1,8 @@
 import asyncio
+import json
+import time
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -8,6 +10,16 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.knowledge.manifest import (
+    KnowledgeManifest,
+    ManifestEntry,
+    ManifestKey,
+    content_sha256,
+    document_chunk_id,
+    document_source,
+    vector_content_hash,
+)
+from agno.knowledge.postprocess import SearchPostProcessor
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb import VectorDb
 
@@ -23,6 +35,14 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Number of documents checked, embedded and written to the vector db per batch during load
+    load_batch_size: int = 100
+    # Maximum number of batches written to the vector db concurrently during aload
+    max_concurrent_loads: int = 4
+    # Path of the manifest used by sync() to track which chunks are in the vector db
+    manifest_path: Optional[Union[str, Path]] = None
+    # Post-retrieval pipeline (dedupe, similarity cutoff, MMR, token budget) applied to search results
+    post_processor: Optional[SearchPostProcessor] = None
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -61,7 +81,18 @@ class AgentKnowledge(BaseModel):
 
             _num_documents = num_documents or self.num_documents
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if self.post_processor is None:
+                return self.vector_db.search(
+                    query=query, limit=_num_documents, filters=filters, return_embeddings=self._search_embeddings()
+                )
+
+            documents = self.vector_db.search(
+                query=query,
+                limit=self.post_processor.candidate_limit(_num_documents),
+                filters=filters,
+                return_embeddings=self._search_embeddings(),
+            )
+            return self._post_process(query, documents, _num_documents)
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -77,15 +108,32 @@ class AgentKnowledge(BaseModel):
 
             _num_documents = num_documents or self.num_documents
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
+            _limit = _num_documents
+            if self.post_processor is not None:
+                _limit = self.post_processor.candidate_limit(_num_documents)
             try:
-                return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                documents = await self.vector_db.async_search(
+                    query=query, limit=_limit, filters=filters, return_embeddings=self._search_embeddings()
+                )
             except NotImplementedError:
                 logger.info("Vector db does not support async search")
                 return self.search(query=query, num_documents=_num_documents, filters=filters)
+            if self.post_processor is None:
+                return documents
+            # Post-processing may embed search results, so keep it off the event loop
+            return await asyncio.to_thread(self._post_process, query, documents, _num_documents)
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
 
+    def _search_embeddings(self) -> bool:
+        """Whether searches return the stored vectors: only the similarity stages of the post processor need them"""
+        return self.post_processor is not None and self.post_processor.requires_embeddings
+
+    def _post_process(self, query: str, documents: List[Document], limit: int) -> List[Document]:
+        embedder = getattr(self.vector_db, "embedder", None)
+        return self.post_processor.process(query, documents, limit, embedder=embedder)  # type: ignore
+
     def load(
         self,
         recreate: bool = False,
@@ -94,6 +142,10 @@ class AgentKnowledge(BaseModel):
     ) -> None:
         """Load the knowledge base to the vector db
 
+        Documents are written in batches of `load_batch_size`: one existence check, one embedding call
+        and one vector db write per batch. With skip_existing, an interrupted load can simply be re-run
+        and resumes by skipping the batches that were already written.
+
         Args:
             recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
             upsert (bool): If True, upserts documents to the vector db. Defaults to False.
@@ -113,31 +165,10 @@ class AgentKnowledge(BaseModel):
 
         log_info("Loading knowledge base")
         num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
-
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                for doc in document_list:
-                    self.vector_db.upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
-
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        self.vector_db.insert(documents=[doc], filters=doc.meta_data)
-
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+        start_time = time.perf_counter()
+        for batch in self._batch_document_lists(self.document_lists):
+            num_documents += self._load_batch(batch, upsert=upsert, skip_existing=skip_existing)
+            self._log_load_progress(num_documents, start_time)
 
     async def aload(
         self,
@@ -147,6 +178,8 @@ class AgentKnowledge(BaseModel):
     ) -> None:
         """Load the knowledge base to the vector db asynchronously
 
+        Batches of `load_batch_size` documents are written with at most `max_concurrent_loads` batches in flight.
+
         Args:
             recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
             upsert (bool): If True, upserts documents to the vector db. Defaults to False.
@@ -167,31 +200,208 @@ class AgentKnowledge(BaseModel):
 
         log_info("Loading knowledge base")
         num_documents = 0
+        start_time = time.perf_counter()
+        pending: Set[asyncio.Task] = set()
+
+        async def drain(max_pending: int) -> None:
+            nonlocal num_documents, pending
+            while len(pending) > max_pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    num_documents += task.result()
+                self._log_load_progress(num_documents, start_time)
+
+        batch: List[Document] = []
         document_iterator = self.async_document_lists
         async for document_list in document_iterator:  # type: ignore
-            documents_to_load = document_list
-            # Track metadata for filtering capabilities
-            for doc in document_list:
+            batch.extend(document_list)
+            while len(batch) >= self.load_batch_size:
+                pending.add(
+                    asyncio.create_task(
+                        self._aload_batch(batch[: self.load_batch_size], upsert=upsert, skip_existing=skip_existing)
+                    )
+                )
+                batch = batch[self.load_batch_size :]
+                await drain(self.max_concurrent_loads - 1)
+        if batch:
+            pending.add(asyncio.create_task(self._aload_batch(batch, upsert=upsert, skip_existing=skip_existing)))
+        await drain(0)
+
+    def sync(self, manifest_path: Optional[Union[str, Path]] = None) -> None:
+        """Incrementally sync the knowledge base to the vector db using a persistent manifest
+
+        The manifest records (source, chunk id, content sha256, embedder) for every chunk written.
+        Only chunks that are new, or whose content or embedder changed, are embedded and written.
+        Chunks in the manifest that changed or no longer appear in the knowledge base are deleted from the vector db.
+        Every batch is checkpointed to the manifest journal, so an interrupted sync resumes where it stopped.
+
+        Args:
+            manifest_path (Optional[Union[str, Path]]): Path of the manifest file. Defaults to `manifest_path`.
+        """
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return
+
+        _manifest_path = manifest_path or self.manifest_path
+        if _manifest_path is None:
+            logger.error("No manifest path provided, use load() for a full load")
+            return
+
+        if not self.vector_db.exists():
+            log_info("Creating collection")
+            self.vector_db.create()
+
+        log_info("Syncing knowledge base")
+        manifest = KnowledgeManifest(_manifest_path)
+        embedder_id = self._embedder_id()
+        upsert = self.vector_db.upsert_available()
+        seen: Set[ManifestKey] = set()
+        num_documents = 0
+        start_time = time.perf_counter()
+
+        for batch in self._batch_document_lists(self.document_lists):
+            to_write: List[Tuple[Document, ManifestEntry]] = []
+            rewrite_hashes: List[str] = []
+            for doc in batch:
                 if doc.meta_data:
                     self._track_metadata_structure(doc.meta_data)
 
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                for doc in document_list:
-                    await self.vector_db.async_upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                key = (document_source(doc), document_chunk_id(doc), content_sha256(doc.content))
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                entry = manifest.get(key)
+                if entry is not None and entry.embedder == embedder_id:
+                    continue
+
+                new_entry = ManifestEntry(
+                    source=key[0],
+                    chunk_id=key[1],
+                    content_sha256=key[2],
+                    embedder=embedder_id,
+                    vector_content_hash=vector_content_hash(doc.content),
+                )
+                if entry is not None:
+                    # Same content with a new embedder: the old vector must go before the new one is inserted
+                    rewrite_hashes.append(entry.vector_content_hash)
+                to_write.append((doc, new_entry))
+
+            if rewrite_hashes and not upsert:
+                self._delete_from_vector_db(rewrite_hashes)
+
+            documents = [doc for doc, _ in to_write]
+            for filters, group in self._group_by_metadata(documents):
+                if upsert:
+                    self.vector_db.upsert(documents=group, filters=filters)
+                else:
+                    self.vector_db.insert(documents=group, filters=filters)
+            manifest.append(entry for _, entry in to_write)
+
+            num_documents += len(to_write)
+            self._log_load_progress(num_documents, start_time)
+
+        # Chunks that changed or disappeared from the knowledge base. They stay in the manifest until their vectors
+        # are deleted, so a sync interrupted before this point deletes them the next time it runs.
+        removed = [entry for entry in manifest if entry.key not in seen]
+        # Never delete a vector that a chunk still in the knowledge base shares
+        live_hashes = {entry.vector_content_hash for entry in manifest if entry.key in seen}
+        hashes_to_delete = list({entry.vector_content_hash for entry in removed} - live_hashes)
+        if not hashes_to_delete or self._delete_from_vector_db(hashes_to_delete):
+            for entry in removed:
+                manifest.remove(entry.key)
+        manifest.write()
+        log_info(
+            f"Synced knowledge base: {num_documents} documents written, {len(hashes_to_delete)} stale documents deleted"
+        )
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        await self.vector_db.async_insert(documents=[doc], filters=doc.meta_data)
+    def _embedder_id(self) -> str:
+        """Identify the embedding model of the vector db, so chunks are re-embedded when it changes"""
+        embedder = getattr(self.vector_db, "embedder", None)
+        if embedder is None:
+            return ""
+        return f"{embedder.__class__.__name__}:{getattr(embedder, 'id', '')}"
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+    def _delete_from_vector_db(self, content_hashes: List[str]) -> bool:
+        try:
+            return self.vector_db.delete_by_content_hashes(content_hashes)  # type: ignore
+        except NotImplementedError:
+            logger.warning("Vector db does not support deleting documents, stale documents are kept")
+            return False
+
+    def _batch_document_lists(self, document_lists: Iterator[List[Document]]) -> Iterator[List[Document]]:
+        """Regroup the document lists yielded by the knowledge base into batches of `load_batch_size`"""
+        batch: List[Document] = []
+        for document_list in document_lists:
+            batch.extend(document_list)
+            while len(batch) >= self.load_batch_size:
+                yield batch[: self.load_batch_size]
+                batch = batch[self.load_batch_size :]
+        if batch:
+            yield batch
+
+    def _group_by_metadata(self, documents: List[Document]) -> List[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        """Group documents sharing the same metadata, so each group is written with one call using it as filters"""
+        groups: Dict[str, Tuple[Optional[Dict[str, Any]], List[Document]]] = {}
+        for doc in documents:
+            key = json.dumps(doc.meta_data, sort_keys=True, default=str) if doc.meta_data else ""
+            if key not in groups:
+                groups[key] = (doc.meta_data or None, [])
+            groups[key][1].append(doc)
+        return list(groups.values())
+
+    def _load_batch(self, documents: List[Document], upsert: bool, skip_existing: bool) -> int:
+        """Write one batch of documents to the vector db and return the number of documents written"""
+        # Track metadata for filtering capabilities
+        for doc in documents:
+            if doc.meta_data:
+                self._track_metadata_structure(doc.meta_data)
+
+        # Upsert documents if upsert is True and vector db supports upsert
+        if upsert and self.vector_db.upsert_available():  # type: ignore
+            for filters, group in self._group_by_metadata(documents):
+                self.vector_db.upsert(documents=group, filters=filters)  # type: ignore
+            return len(documents)
+
+        # Filter out documents which already exist in the vector db
+        documents_to_load = documents
+        if skip_existing:
+            log_debug("Filtering out existing documents before insertion.")
+            documents_to_load = self.filter_existing_documents(documents)
+
+        for filters, group in self._group_by_metadata(documents_to_load):
+            self.vector_db.insert(documents=group, filters=filters)  # type: ignore
+        log_debug(f"Added {len(documents_to_load)} documents to knowledge base")
+        return len(documents_to_load)
+
+    async def _aload_batch(self, documents: List[Document], upsert: bool, skip_existing: bool) -> int:
+        """Write one batch of documents to the vector db asynchronously and return the number of documents written"""
+        # Track metadata for filtering capabilities
+        for doc in documents:
+            if doc.meta_data:
+                self._track_metadata_structure(doc.meta_data)
+
+        # Upsert documents if upsert is True and vector db supports upsert
+        if upsert and self.vector_db.upsert_available():  # type: ignore
+            for filters, group in self._group_by_metadata(documents):
+                await self.vector_db.async_upsert(documents=group, filters=filters)  # type: ignore
+            return len(documents)
+
+        # Filter out documents which already exist in the vector db
+        documents_to_load = documents
+        if skip_existing:
+            log_debug("Filtering out existing documents before insertion.")
+            documents_to_load = await self.async_filter_existing_documents(documents)
+
+        for filters, group in self._group_by_metadata(documents_to_load):
+            await self.vector_db.async_insert(documents=group, filters=filters)  # type: ignore
+        log_debug(f"Added {len(documents_to_load)} documents to knowledge base")
+        return len(documents_to_load)
+
+    def _log_load_progress(self, num_documents: int, start_time: float) -> None:
+        elapsed = time.perf_counter() - start_time
+        rate = num_documents / elapsed if elapsed > 0 else 0.0
+        log_info(f"Loaded {num_documents} documents to knowledge base ({rate:.1f} documents/s)")
 
     def load_documents(
         self,
@@ -224,7 +434,11 @@ class AgentKnowledge(BaseModel):
         else:
             # Filter out documents which already exist in the vector db
             documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
+                [
+                    document
+                    for document, exists in zip(documents, self.vector_db.docs_exist(documents))
+                    if not exists
+                ]
                 if skip_existing
                 else documents
             )
@@ -275,19 +489,11 @@ class AgentKnowledge(BaseModel):
             # Filter out documents which already exist in the vector db
             if skip_existing:
                 try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
+                    existence_checks = await self.vector_db.async_docs_exist(documents)
                 except NotImplementedError:
                     logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
+                    existence_checks = self.vector_db.docs_exist(documents)
+                documents_to_load = [doc for doc, exists in zip(documents, existence_checks) if not exists]
             else:
                 documents_to_load = documents
 
@@ -406,7 +612,8 @@ class AgentKnowledge(BaseModel):
         """Filter out documents that already exist in the vector database.
 
         This helper method is used across various knowledge base implementations
-        to avoid inserting duplicate documents.
+        to avoid inserting duplicate documents. Existence is checked for the whole
+        list at once via `VectorDb.docs_exist`.
 
         Args:
             documents (List[Document]): List of documents to filter
@@ -414,28 +621,58 @@ class AgentKnowledge(BaseModel):
         Returns:
             List[Document]: Filtered list of documents that don't exist in the database
         """
-        from agno.utils.log import log_debug, log_info
-
         if not self.vector_db:
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
-        seen_content = set()
-        original_count = len(documents)
-        filtered_documents = []
+        unique_documents = self._dedupe_documents(documents)
+        exists = self.vector_db.docs_exist(unique_documents)
+        return self._drop_existing(documents, unique_documents, exists)
 
+    async def async_filter_existing_documents(self, documents: List[Document]) -> List[Document]:
+        """Filter out documents that already exist in the vector database asynchronously.
+
+        Args:
+            documents (List[Document]): List of documents to filter
+
+        Returns:
+            List[Document]: Filtered list of documents that don't exist in the database
+        """
+        if not self.vector_db:
+            log_debug("No vector database configured, skipping document filtering")
+            return documents
+
+        unique_documents = self._dedupe_documents(documents)
+        try:
+            exists = await self.vector_db.async_docs_exist(unique_documents)
+        except NotImplementedError:
+            logger.warning("Vector db does not support async doc_exists")
+            exists = self.vector_db.docs_exist(unique_documents)
+        return self._drop_existing(documents, unique_documents, exists)
+
+    def _dedupe_documents(self, documents: List[Document]) -> List[Document]:
+        """Drop documents whose content duplicates an earlier document in the list"""
+        seen_hashes = set()
+        unique_documents = []
         for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
-                seen_content.add(content_hash)
-                filtered_documents.append(doc)
+            content_hash = content_sha256(doc.content)
+            if content_hash not in seen_hashes:
+                seen_hashes.add(content_hash)
+                unique_documents.append(doc)
+        return unique_documents
+
+    def _drop_existing(
+        self, documents: List[Document], unique_documents: List[Document], exists: List[bool]
+    ) -> List[Document]:
+        filtered_documents = []
+        for doc, doc_exists in zip(unique_documents, exists):
+            if doc_exists:
+                log_debug(f"Skipping existing document: {doc.name}")
             else:
-                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+                filtered_documents.append(doc)
 
-        if len(filtered_documents) < original_count:
-            log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
+        if len(filtered_documents) < len(documents):
+            log_info(f"Skipped {len(documents) - len(filtered_documents)} existing/duplicate documents.")
 
         return filtered_documents
 
@@ -655,7 +892,7 @@ class AgentKnowledge(BaseModel):
             documents_to_insert = documents
             if skip_existing:
                 log_debug("Filtering out existing documents before insertion.")
-                documents_to_insert = self.filter_existing_documents(documents)
+                documents_to_insert = await self.async_filter_existing_documents(documents)
 
             if documents_to_insert:  # type: ignore
                 log_debug(f"Inserting {len(documents_to_insert)} new documents.")
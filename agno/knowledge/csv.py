@@ -29,21 +29,21 @@ class CSVKnowledgeBase(AgentKnowledge):
                     config = item.get("metadata", {})
                     _csv_path = Path(file_path)  # type: ignore
                     if self._is_valid_csv(_csv_path):
-                        documents = self.reader.read(file=_csv_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        for documents in self.reader.read_stream(_csv_path):
+                            if config:
+                                for doc in documents:
+                                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                                    doc.meta_data.update(config)  # type: ignore
+                            yield documents
         else:
             # Handle single path
             _csv_path = Path(self.path)
             if _csv_path.is_dir():
                 for _csv in _csv_path.glob("**/*.csv"):
                     if _csv.name not in self.exclude_files:
-                        yield self.reader.read(file=_csv)
+                        yield from self.reader.read_stream(_csv)
             elif self._is_valid_csv(_csv_path):
-                yield self.reader.read(file=_csv_path)
+                yield from self.reader.read_stream(_csv_path)
 
     def _is_valid_csv(self, path: Path) -> bool:
         """Helper to check if path is a valid CSV file."""
@@ -0,0 +1,141 @@
+import json
+from dataclasses import asdict, dataclass
+from hashlib import md5, sha256
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from agno.document import Document
+from agno.utils.log import log_debug, logger
+
+ManifestKey = Tuple[str, str, str]
+
+
+def content_sha256(content: str) -> str:
+    """Hash used by the manifest to detect changed chunks"""
+    return sha256(content.encode()).hexdigest()
+
+
+def vector_content_hash(content: str) -> str:
+    """Hash the vector dbs use to identify a document by its content"""
+    return md5(content.replace("\x00", "\ufffd").encode()).hexdigest()
+
+
+def document_source(document: Document) -> str:
+    """The source a document was read from: its url if known, otherwise its name"""
+    meta_data = document.meta_data or {}
+    url = meta_data.get("url") or meta_data.get("pdf_url") or meta_data.get("video_url")
+    return str(url or meta_data.get("source") or document.name or "")
+
+
+# Metadata keys the readers and chunking strategies set to locate a chunk within its source
+POSITION_KEYS = ("page", "part", "start_row", "chunk")
+
+
+def document_chunk_id(document: Document) -> str:
+    """The position of a chunk within its source, stable across re-reads of the same source.
+
+    Readers assign random ids to documents, so the position metadata is used instead.
+    Chunks without position metadata are identified by their content.
+    """
+    meta_data = document.meta_data or {}
+    position = [f"{key}={meta_data[key]}" for key in POSITION_KEYS if key in meta_data]
+    if position:
+        return ",".join(position)
+    return content_sha256(document.content)
+
+
+@dataclass
+class ManifestEntry:
+    """A chunk recorded in the manifest.
+
+    Entries are keyed by source, chunk id and content. Sources are only names for most readers, so two documents
+    with the same name share chunk ids and are told apart by their content. A changed chunk is a new entry, and
+    its old entry stays in the manifest until the sync that no longer sees it deletes its vector.
+    """
+
+    source: str
+    chunk_id: str
+    content_sha256: str
+    embedder: str
+    # Content hash the vector db identifies the chunk by, used to delete it
+    vector_content_hash: str
+
+    @property
+    def key(self) -> ManifestKey:
+        return (self.source, self.chunk_id, self.content_sha256)
+
+
+class KnowledgeManifest:
+    """Persistent record of the chunks written to a knowledge base, stored as a JSON file.
+
+    Entries recorded with `append` go to a JSONL journal next to the file, so checkpointing a batch costs as much
+    as the batch rather than the whole manifest. `write` folds the journal into the JSON file.
+
+    Used by `AgentKnowledge.sync` to write only new or changed chunks and to delete chunks that disappeared.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.journal_path = self.path.with_suffix(self.path.suffix + ".journal")
+        self.entries: Dict[ManifestKey, ManifestEntry] = {}
+        self.read()
+
+    def read(self) -> None:
+        """Read the manifest and its journal from disk, starting empty if they do not exist"""
+        self.entries = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                for row in data.get("entries", []):
+                    entry = ManifestEntry(**row)
+                    self.entries[entry.key] = entry
+            except Exception as e:
+                logger.warning(f"Could not read knowledge manifest {self.path}, starting empty: {e}")
+        if self.journal_path.exists():
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = ManifestEntry(**json.loads(line))
+                    except Exception:
+                        # A partial line from an interrupted checkpoint
+                        logger.warning(f"Skipping corrupt entry in knowledge manifest journal {self.journal_path}")
+                        continue
+                    self.entries[entry.key] = entry
+        log_debug(f"Read {len(self.entries)} entries from knowledge manifest: {self.path}")
+
+    def append(self, entries: Iterable[ManifestEntry]) -> None:
+        """Record entries and checkpoint them to the journal"""
+        lines = []
+        for entry in entries:
+            self.entries[entry.key] = entry
+            lines.append(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+        if not lines:
+            return
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+
+    def write(self) -> None:
+        """Write the manifest to disk atomically and clear the journal"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        data = {"entries": [asdict(entry) for entry in self.entries.values()]}
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
+        # The journal is in the manifest now. Replaying it again after a crash here is harmless.
+        self.journal_path.unlink(missing_ok=True)
+
+    def get(self, key: ManifestKey) -> Optional[ManifestEntry]:
+        return self.entries.get(key)
+
+    def set(self, entry: ManifestEntry) -> None:
+        self.entries[entry.key] = entry
+
+    def remove(self, key: ManifestKey) -> Optional[ManifestEntry]:
+        return self.entries.pop(key, None)
+
+    def __iter__(self) -> Iterator[ManifestEntry]:
+        return iter(list(self.entries.values()))
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -29,21 +29,21 @@ class PDFKnowledgeBase(AgentKnowledge):
                     config = item.get("metadata", {})
                     _pdf_path = Path(file_path)  # type: ignore
                     if self._is_valid_pdf(_pdf_path):
-                        documents = self.reader.read(pdf=_pdf_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        for documents in self.reader.read_stream(_pdf_path):
+                            if config:
+                                for doc in documents:
+                                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                                    doc.meta_data.update(config)  # type: ignore
+                            yield documents
         else:
             # Handle single path
             _pdf_path = Path(self.path)
             if _pdf_path.is_dir():
                 for _pdf in _pdf_path.glob("**/*.pdf"):
                     if _pdf.name not in self.exclude_files:
-                        yield self.reader.read(pdf=_pdf)
+                        yield from self.reader.read_stream(_pdf)
             elif self._is_valid_pdf(_pdf_path):
-                yield self.reader.read(pdf=_pdf_path)
+                yield from self.reader.read_stream(_pdf_path)
 
     def _is_valid_pdf(self, path: Path) -> bool:
         """Helper to check if path is a valid PDF file."""
@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+from typing import Any, Callable, FrozenSet, List, Optional, Set, Tuple
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.knowledge.manifest import content_sha256
+from agno.utils.log import log_debug
+
+
+def approximate_tokens(text: str) -> int:
+    """Rough token count, about 4 characters per token for English text"""
+    return len(text) // 4 + 1
+
+
+def maximal_marginal_relevance(query_embedding: Any, embeddings: Any, k: int, lambda_mult: float = 0.5) -> List[int]:
+    """Select `k` rows of `embeddings` that are relevant to the query and diverse among themselves.
+
+    Args:
+        query_embedding: The query vector, shape (dim,).
+        embeddings: The candidate vectors, shape (n, dim).
+        k (int): Number of candidates to select.
+        lambda_mult (float): Trade-off between relevance (1.0) and diversity (0.0).
+
+    Returns:
+        List[int]: Indices of the selected candidates, in selection order.
+    """
+    import numpy as np
+
+    if len(embeddings) == 0 or k <= 0:
+        return []
+
+    relevance = cosine_similarities(query_embedding, embeddings)
+    candidates = normalize_rows(np.asarray(embeddings, dtype=np.float32))
+    pairwise = candidates @ candidates.T
+
+    selected: List[int] = []
+    # Highest similarity of each candidate to any selected candidate
+    redundancy = np.zeros(len(candidates), dtype=np.float32)
+    available = np.ones(len(candidates), dtype=bool)
+    for _ in range(min(k, len(candidates))):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        redundancy = pairwise[best] if len(selected) == 1 else np.maximum(redundancy, pairwise[best])
+    return selected
+
+
+def normalize_rows(matrix: Any) -> Any:
+    import numpy as np
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_similarities(query_embedding: Any, embeddings: Any) -> Any:
+    """Cosine similarity between the query vector and each row of `embeddings`"""
+    import numpy as np
+
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query_norm = np.linalg.norm(query) or 1.0
+    return normalize_rows(np.asarray(embeddings, dtype=np.float32)) @ (query / query_norm)
+
+
+def word_shingles(text: str, size: int = 3) -> FrozenSet[Tuple[str, ...]]:
+    """The set of runs of `size` consecutive words in the text, ignoring case and whitespace"""
+    words = text.lower().split()
+    if len(words) <= size:
+        return frozenset([tuple(words)]) if words else frozenset()
+    return frozenset(tuple(words[i : i + size]) for i in range(len(words) - size + 1))
+
+
+def containment(a: FrozenSet, b: FrozenSet) -> float:
+    """Share of the smaller of two shingle sets that is also in the other"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+@dataclass
+class SearchPostProcessor:
+    """Post-retrieval pipeline applied to vector db results, the same way for every backend.
+
+    The stages run in order: duplicate and overlap collapsing, minimum-similarity cutoff, maximal marginal
+    relevance and token-budget truncation. Similarity stages use the document embeddings, so vector dbs return
+    them when a post processor that needs them is attached to the knowledge base.
+    """
+
+    # Drop documents whose id, or content, was already returned
+    dedupe: bool = True
+    # With dedupe, also drop documents that mostly overlap a document already returned, such as near-duplicate
+    # or overlapping chunks: the share of the smaller document's word trigrams found in the other.
+    # None only drops exact duplicates.
+    overlap_threshold: Optional[float] = 0.8
+    # Minimum cosine similarity between the query and a document. None disables the cutoff.
+    min_similarity: Optional[float] = None
+    # Diversify results with maximal marginal relevance: 1.0 ranks by relevance only, 0.0 by diversity only.
+    # None disables MMR.
+    mmr_lambda: Optional[float] = None
+    # Maximum number of tokens across the returned documents. None disables the budget.
+    max_tokens: Optional[int] = None
+    # Function used to count tokens for the budget. Defaults to an approximation.
+    count_tokens: Optional[Callable[[str], int]] = None
+    # Number of candidates fetched from the vector db per document returned
+    fetch_factor: int = 3
+
+    @property
+    def requires_embeddings(self) -> bool:
+        return self.min_similarity is not None or self.mmr_lambda is not None
+
+    def candidate_limit(self, limit: int) -> int:
+        """Number of candidates to fetch from the vector db to return `limit` documents"""
+        if self.requires_embeddings or self.dedupe or self.max_tokens is not None:
+            return limit * max(self.fetch_factor, 1)
+        return limit
+
+    def process(
+        self, query: str, documents: List[Document], limit: int, embedder: Optional[Embedder] = None
+    ) -> List[Document]:
+        """Run the pipeline on search results, returning at most `limit` documents.
+
+        Args:
+            query (str): The search query.
+            documents (List[Document]): Search results, in ranked order.
+            limit (int): Maximum number of documents to return.
+            embedder (Optional[Embedder]): Embedder for the query and for documents returned without embeddings.
+                Required by the similarity stages.
+        """
+        if not documents:
+            return []
+
+        results = self.collapse_duplicates(documents) if self.dedupe else list(documents)
+
+        if self.requires_embeddings and embedder is not None:
+            results = self.apply_similarity(query, results, limit, embedder)
+        elif self.requires_embeddings:
+            log_debug("No embedder available, skipping similarity post-processing")
+
+        results = results[:limit]
+        if self.max_tokens is not None:
+            results = self.truncate_to_budget(results)
+
+        log_debug(f"Post-processed {len(documents)} search results into {len(results)} documents")
+        return results
+
+    def collapse_duplicates(self, documents: List[Document]) -> List[Document]:
+        """Keep the first occurrence of each document id, and of each distinct content. With `overlap_threshold`,
+        also drop documents whose content overlaps that much with a document already kept.
+
+        Names and chunk positions are not used: distinct documents often share a name, such as files with the
+        same stem, and their chunks at the same position are different results.
+        """
+        seen_ids: Set[str] = set()
+        seen_content: Set[str] = set()
+        kept_shingles: List[FrozenSet[Tuple[str, ...]]] = []
+        results: List[Document] = []
+        for document in documents:
+            content_key = content_sha256(document.content)
+            if content_key in seen_content or (document.id is not None and document.id in seen_ids):
+                continue
+            if self.overlap_threshold is not None:
+                shingles = word_shingles(document.content)
+                if any(containment(shingles, kept) >= self.overlap_threshold for kept in kept_shingles):
+                    continue
+                kept_shingles.append(shingles)
+            seen_content.add(content_key)
+            if document.id is not None:
+                seen_ids.add(document.id)
+            results.append(document)
+        return results
+
+    def apply_similarity(self, query: str, documents: List[Document], limit: int, embedder: Embedder) -> List[Document]:
+        """Apply the minimum-similarity cutoff and MMR using the document embeddings"""
+        import numpy as np
+
+        # The vector db embedded the same query to search, so this is usually served from the embedder's cache
+        query_embedding = embedder.get_query_embedding(query)
+        if query_embedding is None or len(query_embedding) == 0:
+            return documents
+
+        # Some backends return numpy arrays, so check the length rather than truthiness
+        missing = [document for document in documents if document.embedding is None or len(document.embedding) == 0]
+        if missing:
+            log_debug(f"Embedding {len(missing)} search results returned without embeddings")
+            for document, embedding in zip(missing, embedder.get_embeddings([d.content for d in missing])):
+                document.embedding = embedding
+        documents = [document for document in documents if document.embedding is not None and len(document.embedding)]
+        if not documents:
+            return []
+
+        embeddings = np.asarray([document.embedding for document in documents], dtype=np.float32)
+        if self.min_similarity is not None:
+            similarities = cosine_similarities(query_embedding, embeddings)
+            keep = np.nonzero(similarities >= self.min_similarity)[0]
+            documents = [documents[i] for i in keep]
+            embeddings = embeddings[keep]
+
+        if self.mmr_lambda is not None and documents:
+            selected = maximal_marginal_relevance(query_embedding, embeddings, limit, self.mmr_lambda)
+            documents = [documents[i] for i in selected]
+        return documents
+
+    def truncate_to_budget(self, documents: List[Document]) -> List[Document]:
+        """Keep documents in order until the token budget is used up. The first document is always kept."""
+        count_tokens = self.count_tokens or approximate_tokens
+        results: List[Document] = []
+        used = 0
+        for document in documents:
+            tokens = count_tokens(document.content)
+            if results and used + tokens > self.max_tokens:  # type: ignore
+                break
+            results.append(document)
+            used += tokens
+        return results
@@ -26,21 +26,21 @@ class TextKnowledgeBase(AgentKnowledge):
                     config = item.get("metadata", {})
                     _file_path = Path(file_path)  # type: ignore
                     if self._is_valid_text(_file_path):
-                        documents = self.reader.read(file=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        for documents in self.reader.read_stream(_file_path):
+                            if config:
+                                for doc in documents:
+                                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                                    doc.meta_data.update(config)  # type: ignore
+                            yield documents
         else:
             # Handle single path
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
                     if self._is_valid_text(_file):
-                        yield self.reader.read(file=_file)
+                        yield from self.reader.read_stream(_file)
             elif self._is_valid_text(_file_path):
-                yield self.reader.read(file=_file_path)
+                yield from self.reader.read_stream(_file_path)
 
     def _is_valid_text(self, path: Path) -> bool:
         """Helper to check if path is a valid text file."""
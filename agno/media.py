@@ -181,10 +181,10 @@ class Audio(BaseModel):
 
     @property
     def audio_url_content(self) -> Optional[bytes]:
-        import httpx
+        from agno.utils.media_cache import get_media_cache
 
         if self.url:
-            return httpx.get(self.url).content
+            return get_media_cache().fetch(self.url)[0]
         else:
             return None
 
@@ -248,10 +248,10 @@ class Image(BaseModel):
 
     @property
     def image_url_content(self) -> Optional[bytes]:
-        import httpx
+        from agno.utils.media_cache import get_media_cache
 
         if self.url:
-            return httpx.get(self.url).content
+            return get_media_cache().fetch(self.url)[0]
         else:
             return None
 
@@ -355,12 +355,10 @@ class File(BaseModel):
 
     @property
     def file_url_content(self) -> Optional[Tuple[bytes, str]]:
-        import httpx
+        from agno.utils.media_cache import get_media_cache
 
         if self.url:
-            response = httpx.get(self.url)
-            content = response.content
-            mime_type = response.headers.get("Content-Type", "").split(";")[0]
-            return content, mime_type
+            content, mime_type = get_media_cache().fetch(self.url)
+            return content, mime_type or ""
         else:
             return None
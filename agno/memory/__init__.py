@@ -1,7 +1,12 @@
-from agno.memory.agent import AgentMemory
-from agno.memory.memory import Memory
-from agno.memory.row import MemoryRow
-from agno.memory.team import TeamMemory
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.memory.agent import AgentMemory
+    from agno.memory.memory import Memory
+    from agno.memory.row import MemoryRow
+    from agno.memory.team import TeamMemory
 
 __all__ = [
     "AgentMemory",
@@ -9,3 +14,13 @@ __all__ = [
     "MemoryRow",
     "TeamMemory",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.memory.agent": ["AgentMemory"],
+        "agno.memory.memory": ["Memory"],
+        "agno.memory.row": ["MemoryRow"],
+        "agno.memory.team": ["TeamMemory"],
+    },
+)
@@ -20,7 +20,7 @@ class AgentRun(BaseModel):
     messages: Optional[List[Message]] = None
     response: Optional[RunResponse] = None
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     def to_dict(self) -> Dict[str, Any]:
         response = {
@@ -67,7 +67,7 @@ class AgentMemory(BaseModel):
 
     version: int = 1
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     def to_dict(self) -> Dict[str, Any]:
         _memory_dict = self.model_dump(
@@ -25,7 +25,7 @@ class MemoryManager(BaseModel):
     _tools_for_model: Optional[List[Dict]] = None
     _functions_for_model: Optional[Dict[str, Function]] = None
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     def update_model(self) -> None:
         # Use the default Model (OpenAIChat) if no model is provided
@@ -1,2 +1,15 @@
-from agno.memory.v2.memory import Memory, MemoryManager, MemoryRow, SessionSummarizer
-from agno.memory.v2.schema import SessionSummary, UserMemory
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory, MemoryManager, MemoryRow, SessionSummarizer
+    from agno.memory.v2.schema import SessionSummary, UserMemory
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.memory.v2.memory": ["Memory", "MemoryManager", "MemoryRow", "SessionSummarizer"],
+        "agno.memory.v2.schema": ["SessionSummary", "UserMemory"],
+    },
+)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from agno.memory.v2.db.schema import MemoryRow
 
@@ -21,6 +21,13 @@ class MemoryDb(ABC):
     ) -> List[MemoryRow]:
         raise NotImplementedError
 
+    def get_version(self, user_id: Optional[str] = None) -> Optional[Any]:
+        """Return a stamp that changes whenever the memories of the user change, or None if the db cannot tell.
+
+        Memory skips re-reading memories while the stamp is unchanged.
+        """
+        return None
+
     @abstractmethod
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -6,8 +6,8 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
-    from sqlalchemy.types import DateTime, String
+    from sqlalchemy.sql.expression import delete, func, select, text
+    from sqlalchemy.types import BigInteger, DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
 
@@ -52,6 +52,9 @@ class PostgresMemoryDb(MemoryDb):
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         self.table: Table = self.get_table()
+        # Table for the version of each user's memories
+        self.version_table: Table = self.get_version_table()
+        self._version_table_ready = False
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -84,6 +87,33 @@ class PostgresMemoryDb(MemoryDb):
             except Exception as e:
                 logger.error(f"Error creating table '{self.table.fullname}': {e}")
                 raise
+        self._create_version_table()
+
+    def get_version_table(self) -> Table:
+        return Table(
+            f"{self.table_name}_versions",
+            self.metadata,
+            Column("user_id", String, primary_key=True),
+            Column("version", BigInteger, nullable=False),
+            extend_existing=True,
+        )
+
+    def _create_version_table(self) -> None:
+        # Tables created before memory versions existed get their version table on first use
+        if not self._version_table_ready:
+            self.version_table.create(self.db_engine, checkfirst=True)
+            self._version_table_ready = True
+
+    def _bump_versions(self, sess: Any, user_ids: Iterable[Optional[str]]) -> None:
+        """Increment the version of each user's memories, in the transaction that changes them"""
+        rows = [{"user_id": user_id or "", "version": 1} for user_id in set(user_ids)]
+        if not rows:
+            return
+        stmt = postgresql.insert(self.version_table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"], set_={"version": self.version_table.c.version + 1}
+        )
+        sess.execute(stmt)
 
     def memory_exists(self, memory: MemoryRow) -> bool:
         columns = [self.table.c.id]
@@ -120,11 +150,28 @@ class PostgresMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def get_version(self, user_id: Optional[str] = None) -> Optional[Any]:
+        """Return the version of the user's memories, a counter incremented by every write that changes them"""
+        try:
+            self._create_version_table()
+            with self.Session() as session:
+                stmt = select(func.coalesce(func.sum(self.version_table.c.version), 0))
+                if user_id is not None:
+                    stmt = stmt.where(self.version_table.c.user_id == user_id)
+                return session.execute(stmt).scalar()
+        except Exception as e:
+            log_debug(f"Exception reading memory version: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
 
         try:
+            self._create_version_table()
             with self.Session() as sess, sess.begin():
+                existing_user_ids = (
+                    sess.execute(select(self.table.c.user_id).where(self.table.c.id == memory.id)).scalars().all()
+                )
                 # Create an insert statement
                 stmt = postgresql.insert(self.table).values(
                     id=memory.id,
@@ -143,6 +190,7 @@ class PostgresMemoryDb(MemoryDb):
                 )
 
                 sess.execute(stmt)
+                self._bump_versions(sess, [memory.user_id] + existing_user_ids)
         except Exception as e:
             log_debug(f"Exception upserting into table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -153,12 +201,17 @@ class PostgresMemoryDb(MemoryDb):
             return None
 
     def delete_memory(self, memory_id: str) -> None:
+        self._create_version_table()
         with self.Session() as sess, sess.begin():
+            user_ids = sess.execute(select(self.table.c.user_id).where(self.table.c.id == memory_id)).scalars().all()
+            self._bump_versions(sess, user_ids)
             stmt = delete(self.table).where(self.table.c.id == memory_id)
             sess.execute(stmt)
 
     def drop_table(self) -> None:
         if self.table_exists():
+            # The version table is kept, so the versions of the dropped memories keep increasing
+            self.clear()
             log_debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
 
@@ -172,7 +225,10 @@ class PostgresMemoryDb(MemoryDb):
 
     def clear(self) -> bool:
         if self.table_exists():
+            self._create_version_table()
             with self.Session() as sess, sess.begin():
+                user_ids = sess.execute(select(self.table.c.user_id).distinct()).scalars().all()
+                self._bump_versions(sess, user_ids)
                 stmt = delete(self.table)
                 log_info(f"Clearing table: {self.table.name}")
                 sess.execute(stmt)
@@ -210,5 +266,7 @@ class PostgresMemoryDb(MemoryDb):
         # Recreate metadata and table for the copied instance
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.version_table = copied_obj.get_version_table()
+        copied_obj._version_table_ready = False
 
         return copied_obj
@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 try:
     from sqlalchemy import (
+        BigInteger,
         Column,
         DateTime,
         Engine,
@@ -11,10 +12,12 @@ try:
         Table,
         create_engine,
         delete,
+        func,
         inspect,
         select,
         text,
     )
+    from sqlalchemy.dialects import sqlite
     from sqlalchemy.exc import SQLAlchemyError
     from sqlalchemy.orm import scoped_session, sessionmaker
 except ImportError:
@@ -75,6 +78,9 @@ class SqliteMemoryDb(MemoryDb):
         self.Session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for memories
         self.table: Table = self.get_table()
+        # Database table for the version of each user's memories
+        self.version_table: Table = self.get_version_table()
+        self._version_table_ready = False
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -97,6 +103,15 @@ class SqliteMemoryDb(MemoryDb):
             extend_existing=True,
         )
 
+    def get_version_table(self) -> Table:
+        return Table(
+            f"{self.table_name}_versions",
+            self.metadata,
+            Column("user_id", String, primary_key=True),
+            Column("version", BigInteger, nullable=False),
+            extend_existing=True,
+        )
+
     def create(self) -> None:
         if not self.table_exists():
             try:
@@ -105,6 +120,24 @@ class SqliteMemoryDb(MemoryDb):
             except Exception as e:
                 logger.error(f"Error creating table '{self.table_name}': {e}")
                 raise
+        self._create_version_table()
+
+    def _create_version_table(self) -> None:
+        # Tables created before memory versions existed get their version table on first use
+        if not self._version_table_ready:
+            self.version_table.create(self.db_engine, checkfirst=True)
+            self._version_table_ready = True
+
+    def _bump_versions(self, session: Any, user_ids: Iterable[Optional[str]]) -> None:
+        """Increment the version of each user's memories, in the transaction that changes them"""
+        rows = [{"user_id": user_id or "", "version": 1} for user_id in set(user_ids)]
+        if not rows:
+            return
+        stmt = sqlite.insert(self.version_table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"], set_={"version": self.version_table.c.version + 1}
+        )
+        session.execute(stmt)
 
     def memory_exists(self, memory: MemoryRow) -> bool:
         with self.Session() as session:
@@ -147,8 +180,22 @@ class SqliteMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def get_version(self, user_id: Optional[str] = None) -> Optional[Any]:
+        """Return the version of the user's memories, a counter incremented by every write that changes them"""
+        try:
+            self._create_version_table()
+            with self.Session() as session:
+                stmt = select(func.coalesce(func.sum(self.version_table.c.version), 0))
+                if user_id is not None:
+                    stmt = stmt.where(self.version_table.c.user_id == user_id)
+                return session.execute(stmt).scalar()
+        except Exception as e:
+            log_debug(f"Exception reading memory version: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         try:
+            self._create_version_table()
             with self.Session() as session:
                 # Check if the memory already exists
                 existing = session.execute(select(self.table).where(self.table.c.id == memory.id)).first()
@@ -165,6 +212,7 @@ class SqliteMemoryDb(MemoryDb):
                     stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
 
                 session.execute(stmt)
+                self._bump_versions(session, [memory.user_id] + ([existing.user_id] if existing else []))
                 session.commit()
         except SQLAlchemyError as e:
             logger.error(f"Exception upserting into table: {e}")
@@ -178,20 +226,25 @@ class SqliteMemoryDb(MemoryDb):
                 raise
 
     def delete_memory(self, memory_id: str) -> None:
+        self._create_version_table()
         with self.Session() as session:
+            user_ids = session.execute(select(self.table.c.user_id).where(self.table.c.id == memory_id)).scalars().all()
+            self._bump_versions(session, user_ids)
             stmt = delete(self.table).where(self.table.c.id == memory_id)
             session.execute(stmt)
             session.commit()
 
     def drop_table(self) -> None:
         if self.table_exists():
+            # The version table is kept, so the versions of the dropped memories keep increasing
+            self.clear()
             log_debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
 
     def table_exists(self) -> bool:
         log_debug(f"Checking if table exists: {self.table.name}")
         try:
-            return self.inspector.has_table(self.table.name)
+            return inspect(self.db_engine).has_table(self.table.name)
         except Exception as e:
             logger.error(e)
             return False
@@ -199,6 +252,9 @@ class SqliteMemoryDb(MemoryDb):
     def clear(self) -> bool:
         with self.Session() as session:
             if self.table_exists():
+                self._create_version_table()
+                user_ids = session.execute(select(self.table.c.user_id).distinct()).scalars().all()
+                self._bump_versions(session, user_ids)
                 stmt = delete(self.table)
                 session.execute(stmt)
                 session.commit()
@@ -0,0 +1,131 @@
+from hashlib import md5
+from threading import RLock
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.memory.v2.schema import UserMemory
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug
+from agno.utils.lru_cache import LRUCache
+
+
+def memory_text(memory: UserMemory) -> str:
+    """The text a memory is embedded from"""
+    if memory.topics:
+        return f"{memory.memory}\nTopics: {', '.join(memory.topics)}"
+    return memory.memory
+
+
+class MemoryIndex:
+    """In-process embedding index over user memories, searched by cosine similarity.
+
+    Memories are embedded once per distinct text: embeddings are cached by content hash, so re-reading
+    memories from the db, or the same memory for another user, does not call the embedder again. Each user
+    has a normalized matrix of memory embeddings that is rebuilt only when their memories change.
+
+    Args:
+        embedder (Embedder): Embedder used for memories and queries.
+        reranker (Optional[Reranker]): Reranker applied to the nearest memories.
+        cache_size (int): Number of memory embeddings kept in the cache.
+    """
+
+    def __init__(self, embedder: Embedder, reranker: Optional[Reranker] = None, cache_size: int = 10000):
+        self.embedder = embedder
+        self.reranker = reranker
+        self._embeddings: LRUCache[List[float]] = LRUCache(maxsize=cache_size)
+        # user_id -> (memory ids, content keys, normalized embedding matrix)
+        self._matrices: Dict[str, Tuple[List[str], List[str], Any]] = {}
+        self._lock = RLock()
+
+    def embed(self, memories: List[UserMemory]) -> None:
+        """Embed the memories whose text is not cached yet, in a single batch"""
+        missing: Dict[str, str] = {}
+        for memory in memories:
+            text = memory_text(memory)
+            key = md5(text.encode()).hexdigest()
+            if key not in self._embeddings and key not in missing:
+                missing[key] = text
+        if not missing:
+            return
+
+        log_debug(f"Embedding {len(missing)} memories")
+        for key, embedding in zip(missing, self.embedder.get_embeddings(list(missing.values()))):
+            if embedding is not None and len(embedding) > 0:
+                self._embeddings.set(key, embedding)
+
+    def _matrix(self, user_id: str, memories: Dict[str, UserMemory]) -> Tuple[List[str], Any]:
+        import numpy as np
+
+        from agno.knowledge.postprocess import normalize_rows
+
+        keys = {memory_id: md5(memory_text(memory).encode()).hexdigest() for memory_id, memory in memories.items()}
+        with self._lock:
+            cached = self._matrices.get(user_id)
+            if cached is not None and cached[0] == list(keys) and cached[1] == list(keys.values()):
+                return cached[0], cached[2]
+
+            self.embed(list(memories.values()))
+            memory_ids: List[str] = []
+            rows: List[List[float]] = []
+            for memory_id, key in keys.items():
+                embedding = self._embeddings.get(key)
+                if embedding is None:
+                    # Evicted from the cache, or the embedder failed for this memory
+                    self.embed([memories[memory_id]])
+                    embedding = self._embeddings.get(key)
+                if embedding is not None:
+                    memory_ids.append(memory_id)
+                    rows.append(embedding)
+
+            matrix = normalize_rows(np.asarray(rows, dtype=np.float32)) if rows else None
+            if len(memory_ids) == len(keys):
+                self._matrices[user_id] = (list(keys), list(keys.values()), matrix)
+            return memory_ids, matrix
+
+    def search(
+        self, user_id: str, memories: Dict[str, UserMemory], query: str, limit: Optional[int] = None
+    ) -> List[UserMemory]:
+        """Return the memories most similar to the query, best first.
+
+        Args:
+            user_id (str): The user the memories belong to.
+            memories (Dict[str, UserMemory]): The user's memories by memory id.
+            query (str): The search query.
+            limit (Optional[int]): Maximum number of memories to return.
+        """
+        import numpy as np
+
+        if not memories:
+            return []
+
+        memory_ids, matrix = self._matrix(user_id, memories)
+        if matrix is None:
+            return []
+
+        query_embedding = np.asarray(self.embedder.get_embedding(query), dtype=np.float32)
+        if query_embedding.size == 0:
+            return []
+        scores = matrix @ (query_embedding / (np.linalg.norm(query_embedding) or 1.0))
+
+        top_k = len(memory_ids) if limit is None or limit <= 0 else min(limit, len(memory_ids))
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        result_ids = [memory_ids[i] for i in top]
+
+        if self.reranker is not None:
+            documents = [
+                Document(content=memory_text(memories[memory_id]), meta_data={"memory_id": memory_id})
+                for memory_id in result_ids
+            ]
+            reranked = self.reranker.rerank(query=query, documents=documents)
+            result_ids = [document.meta_data["memory_id"] for document in reranked]
+        return [memories[memory_id] for memory_id in result_ids]
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Forget the cached matrix of a user, or of every user"""
+        with self._lock:
+            if user_id is None:
+                self._matrices.clear()
+            else:
+                self._matrices.pop(user_id, None)
@@ -7,14 +7,17 @@ from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from agno.embedder import Embedder
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.index import MemoryIndex
 from agno.memory.v2.manager import MemoryManager
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.memory.v2.summarizer import SessionSummarizer
 from agno.models.base import Model
 from agno.models.message import Message
+from agno.reranker.base import Reranker
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
@@ -77,6 +80,44 @@ class TeamContext:
         )
 
 
+class _SessionRunIndex:
+    """Positions of the runs of a session by run_id, and history views built from those runs.
+
+    The index is trusted only while it describes the list it was built for, because agents and teams
+    also fill `Memory.runs` directly when loading a session.
+    """
+
+    __slots__ = ("runs", "positions", "offset", "size", "views")
+
+    def __init__(self, runs: List[Union[RunResponse, TeamRunResponse]]):
+        self.runs = runs
+        # run_id -> number of runs added to the session before it, including archived runs
+        self.positions: Dict[str, int] = {}
+        # Number of runs archived from the front of the list
+        self.offset = 0
+        self.size = 0
+        # Cached message lists, cleared whenever a run is added or replaced
+        self.views: Dict[Any, List[Message]] = {}
+        for run in runs:
+            self.append(run)
+
+    def is_valid(self, runs: List[Union[RunResponse, TeamRunResponse]]) -> bool:
+        return self.runs is runs and self.size == len(runs)
+
+    def append(self, run: Union[RunResponse, TeamRunResponse]) -> None:
+        run_id = getattr(run, "run_id", None)
+        if run_id:
+            self.positions[run_id] = self.offset + self.size
+        self.size += 1
+        self.views.clear()
+
+    def find(self, run_id: str) -> Optional[int]:
+        position = self.positions.get(run_id)
+        if position is None or position < self.offset:
+            return None
+        return position - self.offset
+
+
 @dataclass
 class Memory:
     # Model used for memories and summaries
@@ -94,8 +135,16 @@ class Memory:
 
     db: Optional[MemoryDb] = None
 
+    # Embedder used for semantic memory search. Memories are embedded when they are read or written.
+    embedder: Optional[Embedder] = None
+    # Reranker applied to the results of semantic memory search
+    reranker: Optional[Reranker] = None
+
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
+    # Maximum number of runs kept in memory per session. Older runs are archived in serialized form,
+    # so they are still written to storage but no longer walked when building history.
+    max_runs: Optional[int] = None
 
     # Team context per session
     team_context: Optional[Dict[str, TeamContext]] = None
@@ -114,9 +163,12 @@ class Memory:
         memory_manager: Optional[MemoryManager] = None,
         summarizer: Optional[SessionSummarizer] = None,
         db: Optional[MemoryDb] = None,
+        embedder: Optional[Embedder] = None,
+        reranker: Optional[Reranker] = None,
         memories: Optional[Dict[str, Dict[str, UserMemory]]] = None,
         summaries: Optional[Dict[str, Dict[str, SessionSummary]]] = None,
         runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None,
+        max_runs: Optional[int] = None,
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
@@ -124,6 +176,12 @@ class Memory:
         self.memories = memories or {}
         self.summaries = summaries or {}
         self.runs = runs or {}
+        self.max_runs = max_runs
+        # Runs archived once a session holds more than max_runs runs, serialized, per session
+        self._archived_runs: Dict[str, List[Dict[str, Any]]] = {}
+        # Number of older runs per session that are only kept in session storage
+        self._stored_runs: Dict[str, int] = {}
+        self._run_indexes: Dict[str, _SessionRunIndex] = {}
 
         self.debug_mode = debug_mode
 
@@ -141,6 +199,14 @@ class Memory:
 
         self.db = db
 
+        self.embedder = embedder
+        self.reranker = reranker
+        self.memory_index: Optional[MemoryIndex] = (
+            MemoryIndex(embedder=embedder, reranker=reranker) if embedder is not None else None
+        )
+        # Version stamp of the memories last read from the db, per user
+        self._db_versions: Dict[str, Any] = {}
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -182,19 +248,54 @@ class Memory:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
-    def refresh_from_db(self, user_id: Optional[str] = None):
+    def refresh_from_db(self, user_id: Optional[str] = None, force: bool = False):
+        """Re-read memories from the db. The memories of a user are only re-read when the db version stamp changed.
+
+        Args:
+            user_id (Optional[str]): The user to refresh. If not provided, all memories are read.
+            force (bool): Read even if the version stamp is unchanged.
+        """
         if self.db:
             # If no user_id is provided, read all memories
             if user_id is None:
                 all_memories = self.db.read_memories()
+                # Reset the memories
+                self.memories = {}
+                self._db_versions = {}
             else:
+                version = self.db.get_version(user_id=user_id)
+                if (
+                    not force
+                    and version is not None
+                    and self.memories is not None
+                    and user_id in self.memories
+                    and self._db_versions.get(user_id) == version
+                ):
+                    return
                 all_memories = self.db.read_memories(user_id=user_id)
-            # Reset the memories
-            self.memories = {}
+                # Reset the memories of the user
+                if self.memories is None:
+                    self.memories = {}
+                self.memories[user_id] = {}
+                if version is not None:
+                    self._db_versions[user_id] = version
+                else:
+                    self._db_versions.pop(user_id, None)
             for memory in all_memories:
                 if memory.user_id is not None and memory.id is not None:
                     self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
 
+            # Embed new memories now, so searches only embed the query
+            if self.memory_index is not None:
+                if user_id is None:
+                    new_memories = [memory for memories in self.memories.values() for memory in memories.values()]
+                else:
+                    new_memories = list(self.memories[user_id].values())
+                try:
+                    self.memory_index.embed(new_memories)
+                except Exception as e:
+                    log_warning(f"Error embedding memories: {e}")
+
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
             self.debug_mode = True
@@ -225,7 +326,7 @@ class Memory:
             _memory_dict["runs"] = {}
             for session_id, runs in self.runs.items():
                 if session_id is not None:
-                    _memory_dict["runs"][session_id] = [run.to_dict() for run in runs]  # type: ignore
+                    _memory_dict["runs"][session_id] = self.get_session_runs(session_id)
 
         if self.team_context is not None:
             _memory_dict["team_context"] = {}
@@ -307,6 +408,7 @@ class Memory:
             memory.last_updated = datetime.now()
 
         self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        self._index_memory(memory)
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -350,6 +452,7 @@ class Memory:
             return None
 
         self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        self._index_memory(memory)
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -388,6 +491,13 @@ class Memory:
         if self.db:
             self._delete_db_memory(memory_id=memory_id)
 
+    def _index_memory(self, memory: UserMemory) -> None:
+        if self.memory_index is not None:
+            try:
+                self.memory_index.embed([memory])
+            except Exception as e:
+                log_warning(f"Error embedding memory: {e}")
+
     def delete_session_summary(self, user_id: str, session_id: str) -> None:
         """Delete a session summary for a given user id
         Args:
@@ -490,7 +600,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        self.refresh_from_db(user_id=user_id, force=True)
         return response
 
     async def acreate_user_memories(
@@ -572,7 +682,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
@@ -606,7 +716,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
@@ -646,9 +756,17 @@ class Memory:
         if assistant_role is None:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
+        if not self.runs or session_id not in self.runs:
+            return []
+
+        index = self._get_run_index(session_id)
+        view_key = ("session", user_role, tuple(assistant_role), skip_history_messages)
+        cached = index.views.get(view_key)
+        if cached is not None:
+            return list(cached)
+
         final_messages: List[Message] = []
-        session_runs = self.runs.get(session_id, []) if self.runs else []
-        for run_response in session_runs:
+        for run_response in self.runs[session_id]:
             if run_response and run_response.messages:
                 user_message_from_run = None
                 assistant_message_from_run = None
@@ -672,30 +790,113 @@ class Memory:
                 if user_message_from_run and assistant_message_from_run:
                     final_messages.append(user_message_from_run)
                     final_messages.append(assistant_message_from_run)
-        return final_messages
+        index.views[view_key] = final_messages
+        return list(final_messages)
+
+    def _get_run_index(self, session_id: str) -> _SessionRunIndex:
+        """Return the run index of the session, rebuilding it if the runs list was changed outside add_run"""
+        session_runs = self.runs.setdefault(session_id, [])  # type: ignore
+        index = self._run_indexes.get(session_id)
+        if index is None or not index.is_valid(session_runs):
+            index = _SessionRunIndex(session_runs)
+            self._run_indexes[session_id] = index
+        return index
 
     def add_run(self, session_id: str, run: Union[RunResponse, TeamRunResponse]) -> None:
         """Adds a RunResponse to the runs list."""
         if not self.runs:
             self.runs = {}
 
-        if session_id not in self.runs:
-            self.runs[session_id] = []
+        index = self._get_run_index(session_id)
+        session_runs = self.runs[session_id]
 
         # Check if run already exists with the same run_id
         if hasattr(run, "run_id") and run.run_id:
             run_id = run.run_id
-            # Look for existing run with same ID
-            for i, existing_run in enumerate(self.runs[session_id]):
-                if hasattr(existing_run, "run_id") and existing_run.run_id == run_id:
-                    # Replace existing run
-                    self.runs[session_id][i] = run
-                    log_debug(f"Replaced existing run with run_id {run_id} in memory")
-                    return
-
-        self.runs[session_id].append(run)
+            position = index.find(run_id)
+            if position is not None and getattr(session_runs[position], "run_id", None) == run_id:
+                # Replace existing run
+                session_runs[position] = run
+                index.views.clear()
+                log_debug(f"Replaced existing run with run_id {run_id} in memory")
+                return
+
+        session_runs.append(run)
+        index.append(run)
         log_debug("Added RunResponse to Memory")
 
+        if self.max_runs is not None and self.max_runs > 0 and len(session_runs) > self.max_runs:
+            self._archive_runs(session_id, index)
+
+    def _archive_runs(self, session_id: str, index: _SessionRunIndex) -> None:
+        session_runs = self.runs[session_id]  # type: ignore
+        num_archived = len(session_runs) - self.max_runs  # type: ignore
+        self._archived_runs.setdefault(session_id, []).extend(
+            run.to_dict() for run in session_runs[:num_archived]  # type: ignore
+        )
+        del session_runs[:num_archived]
+        index.offset += num_archived
+        index.size -= num_archived
+        log_debug(f"Archived {num_archived} runs of session {session_id}")
+
+    def get_session_runs(self, session_id: str) -> List[Dict[str, Any]]:
+        """Serialize the archived and live runs of a session, oldest first.
+
+        Runs released with `release_archived_runs` are not included, `get_num_stored_runs` tells how many
+        runs precede these in session storage.
+        """
+        runs = (self.runs or {}).get(session_id, [])
+        return self._archived_runs.get(session_id, []) + [run.to_dict() for run in runs]  # type: ignore
+
+    def get_num_stored_runs(self, session_id: str) -> int:
+        """Return the number of oldest runs of a session that are only kept in session storage"""
+        return self._stored_runs.get(session_id, 0)
+
+    def release_archived_runs(self, session_id: str) -> None:
+        """Drop the archived runs of a session once they have been written to session storage"""
+        archived = self._archived_runs.pop(session_id, None)
+        if archived:
+            self._stored_runs[session_id] = self._stored_runs.get(session_id, 0) + len(archived)
+            log_debug(f"Released {len(archived)} archived runs of session {session_id}")
+
+    def load_session_runs(self, session_id: str, runs: List[Dict[str, Any]]) -> None:
+        """Load the serialized runs of a session, oldest first, as read from session storage.
+
+        Nothing is loaded when memory already holds the same runs, so the run index and its history views
+        stay valid between turns. Otherwise only the latest max_runs runs are deserialized, and the older ones
+        are counted as stored.
+        """
+        if self.runs is None:
+            self.runs = {}
+        if self._holds_session_runs(session_id, runs):
+            log_debug(f"Runs of session {session_id} are up to date")
+            return
+
+        num_stored = 0
+        if self.max_runs is not None and 0 < self.max_runs < len(runs):
+            num_stored = len(runs) - self.max_runs
+        self._archived_runs.pop(session_id, None)
+        self._stored_runs.pop(session_id, None)
+        if num_stored > 0:
+            self._stored_runs[session_id] = num_stored
+        self.runs[session_id] = [
+            TeamRunResponse.from_dict(run) if "team_id" in run else RunResponse.from_dict(run)
+            for run in runs[num_stored:]
+        ]
+
+    def _holds_session_runs(self, session_id: str, runs: List[Dict[str, Any]]) -> bool:
+        """Whether the stored, archived and live runs of a session are the given serialized runs"""
+        session_runs = (self.runs or {}).get(session_id)
+        if session_runs is None:
+            return False
+        num_runs = self._stored_runs.get(session_id, 0) + len(self._archived_runs.get(session_id, []))
+        if num_runs + len(session_runs) != len(runs):
+            return False
+        if len(session_runs) == 0:
+            return True
+        last_run_id = getattr(session_runs[-1], "run_id", None)
+        return last_run_id is not None and runs[-1].get("run_id") == last_run_id
+
     def get_messages_from_last_n_runs(
         self,
         session_id: str,
@@ -716,15 +917,28 @@ class Memory:
         Returns:
             A list of Messages from the specified runs, excluding history messages.
         """
-        if not self.runs:
+        if not self.runs or session_id not in self.runs:
             return []
 
-        session_runs = self.runs.get(session_id, [])
-        if agent_id:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
-        runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
+        index = self._get_run_index(session_id)
+        view_key = ("last_n_runs", agent_id, team_id, last_n, skip_role, skip_history_messages)
+        cached = index.views.get(view_key)
+        if cached is not None:
+            log_debug(f"Getting messages from previous runs: {len(cached)}")
+            return list(cached)
+
+        # Walk back from the latest run, so only the last_n matching runs are visited
+        runs_to_process: List[Union[RunResponse, TeamRunResponse]] = []
+        for run in reversed(self.runs[session_id]):
+            if last_n is not None and len(runs_to_process) >= last_n:
+                break
+            if agent_id and getattr(run, "agent_id", None) != agent_id:
+                continue
+            if team_id and getattr(run, "team_id", None) != team_id:
+                continue
+            runs_to_process.append(run)
+        runs_to_process.reverse()
+
         messages_from_history = []
         system_message = None
         for run_response in runs_to_process:
@@ -746,8 +960,9 @@ class Memory:
                 else:
                     messages_from_history.append(message)
 
+        index.views[view_key] = messages_from_history
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
-        return messages_from_history
+        return list(messages_from_history)
 
     def get_tool_calls(self, session_id: str, num_calls: Optional[int] = None) -> List[Dict[str, Any]]:
         """Returns a list of tool calls from the messages"""
@@ -768,19 +983,22 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
-            retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
+            retrieval_method: The method to use for retrieving memories. Defaults to "semantic" when an embedder is
+                set and a query is given, and to "last_n" otherwise.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
-                - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "agentic": Return memories most similar to the query, but using an agentic approach. Uses
+                  "semantic" instead when an embedder is set.
+                - "semantic": Return memories most similar to the query by embedding similarity. Requires an embedder.
             user_id: The user to search for. Optional.
 
         Returns:
@@ -803,6 +1021,11 @@ class Memory:
         # Use default limit if not specified
         limit = limit
 
+        # Semantic search replaces the agentic one when memories can be embedded: it ranks memories by embedding
+        # similarity instead of sending all of them to a model
+        if self.memory_index is not None and query and retrieval_method in (None, "agentic"):
+            retrieval_method = "semantic"
+
         # Handle different retrieval methods
         if retrieval_method == "agentic":
             if not query:
@@ -810,6 +1033,16 @@ class Memory:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+            if self.memory_index is None:
+                raise ValueError("An embedder is required for semantic search")
+
+            return self.memory_index.search(
+                user_id=user_id, memories=self.memories.get(user_id, {}), query=query, limit=limit
+            )
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -973,6 +1206,12 @@ class Memory:
         self.memories = {}
         self.summaries = {}
         self.runs = {}
+        self._archived_runs = {}
+        self._stored_runs = {}
+        self._run_indexes = {}
+        self._db_versions = {}
+        if self.memory_index is not None:
+            self.memory_index.invalidate()
 
     def deep_copy(self) -> "Memory":
         from copy import deepcopy
@@ -982,7 +1221,7 @@ class Memory:
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "memory_manager", "summary_manager"]:
+            if field_name not in ["db", "memory_manager", "summary_manager", "embedder", "reranker", "memory_index"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -992,6 +1231,9 @@ class Memory:
         copied_obj.db = self.db
         copied_obj.memory_manager = self.memory_manager
         copied_obj.summary_manager = self.summary_manager
+        copied_obj.embedder = self.embedder
+        copied_obj.reranker = self.reranker
+        copied_obj.memory_index = self.memory_index
 
         return copied_obj
 
@@ -1105,7 +1347,7 @@ class Memory:
         # Deep copy attributes
         for k, v in self.__dict__.items():
             # Reuse db
-            if k in {"db", "memory_manager", "summary_manager"}:
+            if k in {"db", "memory_manager", "summary_manager", "embedder", "reranker", "memory_index"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
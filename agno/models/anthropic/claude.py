@@ -2,7 +2,7 @@ import json
 from collections.abc import AsyncIterator
 from dataclasses import asdict, dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -65,6 +65,9 @@ class Claude(Model):
     name: str = "Claude"
     provider: str = "Anthropic"
 
+    # Image and file urls are sent to Anthropic as urls
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ()
+
     # Request parameters
     max_tokens: Optional[int] = 4096
     thinking: Optional[Dict[str, Any]] = None
@@ -241,17 +244,18 @@ class Claude(Model):
             request_kwargs = self._prepare_request_kwargs(system_message, tools)
 
             if self.mcp_servers is not None:
-                return self.get_client().beta.messages.create(
+                raw_response = self.get_client().beta.messages.with_raw_response.create(
                     model=self.id,
                     messages=chat_messages,  # type: ignore
                     **self.request_kwargs,
                 )
             else:
-                return self.get_client().messages.create(
+                raw_response = self.get_client().messages.with_raw_response.create(
                     model=self.id,
                     messages=chat_messages,  # type: ignore
                     **request_kwargs,
                 )
+            return self._parse_raw_response(raw_response)
         except APIConnectionError as e:
             log_error(f"Connection error while calling Claude API: {str(e)}")
             raise ModelProviderError(message=e.message, model_name=self.name, model_id=self.id) from e
@@ -293,7 +297,7 @@ class Claude(Model):
 
         try:
             if self.mcp_servers is not None:
-                return (
+                stream = (
                     self.get_client()
                     .beta.messages.stream(
                         model=self.id,
@@ -303,7 +307,7 @@ class Claude(Model):
                     .__enter__()
                 )
             else:
-                return (
+                stream = (  # type: ignore
                     self.get_client()
                     .messages.stream(
                         model=self.id,
@@ -312,6 +316,8 @@ class Claude(Model):
                     )
                     .__enter__()
                 )
+            self._update_rate_limit(stream.response.headers)
+            return stream
         except APIConnectionError as e:
             log_error(f"Connection error while calling Claude API: {str(e)}")
             raise ModelProviderError(message=e.message, model_name=self.name, model_id=self.id) from e
@@ -342,17 +348,18 @@ class Claude(Model):
             request_kwargs = self._prepare_request_kwargs(system_message, tools)
 
             if self.mcp_servers is not None:
-                return await self.get_async_client().beta.messages.create(
+                raw_response = await self.get_async_client().beta.messages.with_raw_response.create(
                     model=self.id,
                     messages=chat_messages,  # type: ignore
                     **self.request_kwargs,
                 )
             else:
-                return await self.get_async_client().messages.create(
+                raw_response = await self.get_async_client().messages.with_raw_response.create(
                     model=self.id,
                     messages=chat_messages,  # type: ignore
                     **request_kwargs,
                 )
+            return await self._aparse_raw_response(raw_response)
         except APIConnectionError as e:
             log_error(f"Connection error while calling Claude API: {str(e)}")
             raise ModelProviderError(message=e.message, model_name=self.name, model_id=self.id) from e
@@ -399,6 +406,7 @@ class Claude(Model):
                     messages=chat_messages,  # type: ignore
                     **request_kwargs,
                 ) as stream:
+                    self._update_rate_limit(stream.response.headers)
                     async for chunk in stream:
                         yield chunk
             else:
@@ -407,6 +415,7 @@ class Claude(Model):
                     messages=chat_messages,  # type: ignore
                     **request_kwargs,
                 ) as stream:
+                    self._update_rate_limit(stream.response.headers)
                     async for chunk in stream:  # type: ignore
                         yield chunk
         except APIConnectionError as e:
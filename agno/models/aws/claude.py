@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union
+from typing import Any, AsyncIterator, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -34,6 +34,8 @@ class Claude(AnthropicClaude):
     name: str = "AwsBedrockAnthropicClaude"
     provider: str = "AwsBedrock"
 
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ("images",)
+
     aws_access_key: Optional[str] = None
     aws_secret_key: Optional[str] = None
     aws_region: Optional[str] = None
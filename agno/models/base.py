@@ -2,15 +2,18 @@ import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from inspect import isawaitable
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     Any,
     AsyncGenerator,
     AsyncIterator,
+    ClassVar,
     Dict,
     Iterator,
     List,
     Literal,
+    Mapping,
     Optional,
     Tuple,
     Type,
@@ -21,15 +24,16 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
-from agno.exceptions import AgentRunException
+from agno.exceptions import AgentRunException, ModelProviderError
 from agno.media import AudioResponse, ImageArtifact
 from agno.models.message import Citations, Message, MessageMetrics
+from agno.models.rate_limit import RateLimiter, RateLimitPermit, error_headers, estimate_tokens, get_rate_limiter
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
-from agno.utils.log import log_debug, log_error, log_warning
+from agno.utils.log import is_log_level_enabled, log_debug, log_error, log_warning
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
@@ -56,11 +60,36 @@ def _log_messages(messages: List[Message]) -> None:
     """
     Log messages for debugging.
     """
+    if not is_log_level_enabled():
+        return
     for m in messages:
         # Don't log metrics for input messages
         m.log(metrics=False)
 
 
+def _usage_tokens(response: Any) -> Optional[int]:
+    """Total tokens of a provider response or stream, when the provider reports them"""
+    usage = getattr(response, "usage", None) or getattr(response, "response_usage", None)
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        usage = type("Usage", (), usage)
+    total = getattr(usage, "total_tokens", None)
+    if total is None:
+        total = (getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", None) or 0) + (
+            getattr(usage, "output_tokens", None) or getattr(usage, "completion_tokens", None) or 0
+        )
+    return total if isinstance(total, int) and total > 0 else None
+
+
+def _add_rate_limit_wait_time(assistant_message: Message, wait_time: float) -> None:
+    if wait_time <= 0.001:
+        return
+    if assistant_message.metrics.additional_metrics is None:
+        assistant_message.metrics.additional_metrics = {}
+    assistant_message.metrics.additional_metrics["rate_limit_wait_time"] = round(wait_time, 4)
+
+
 def _add_usage_metrics_to_assistant_message(assistant_message: Message, response_usage: Any) -> None:
     """
     Add usage metrics from the model provider to the assistant message.
@@ -121,7 +150,11 @@ def _add_usage_metrics_to_assistant_message(assistant_message: Message, response
 
     # Additional metrics (e.g., from Groq, Ollama)
     if isinstance(response_usage, dict) and "additional_metrics" in response_usage:
-        assistant_message.metrics.additional_metrics = response_usage["additional_metrics"]
+        # Merged, so metrics recorded while sending the request (e.g. rate_limit_wait_time) are kept
+        assistant_message.metrics.additional_metrics = {
+            **(assistant_message.metrics.additional_metrics or {}),
+            **(response_usage["additional_metrics"] or {}),
+        }
 
     # Token details (e.g., from OpenAI)
     if hasattr(response_usage, "prompt_tokens_details"):
@@ -257,6 +290,22 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # Client-side rate limiting. Requests to the same provider, model and api key share one limiter,
+    # and wait until it has capacity for them instead of failing with a rate limit error.
+    # Requests and tokens allowed per minute. The tokens limit is also learned from the provider's response headers.
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    # Requests allowed in flight at once. Halved when the provider rate limits a request, then grown back.
+    max_concurrency: Optional[int] = None
+    # Enable the rate limiter without configured limits, so it only follows the provider's rate limit errors
+    rate_limit: bool = False
+    # Times a request the provider rate limited is retried, after waiting for the limit to reset
+    rate_limit_retries: int = 2
+
+    # Kinds of media ("images", "audio", "files") whose urls are downloaded and sent inline to this Model.
+    # Async runs download them concurrently before formatting the request.
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ("audio", "files")
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -269,6 +318,140 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limiter shared with every model of this provider, id and api key, if rate limiting is on"""
+        if not (self.rate_limit or self.requests_per_minute or self.tokens_per_minute or self.max_concurrency):
+            return None
+        return get_rate_limiter(
+            provider=self.__class__.__name__,
+            model_id=self.id,
+            api_key=self._rate_limit_api_key(),
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def _rate_limit_api_key(self) -> Optional[str]:
+        """The api key requests are sent with, resolved the way the client resolves it.
+
+        Providers read the key from the environment when the client is built, so a model whose client does not
+        exist yet would otherwise use a different limiter for its first request than for the next ones.
+        """
+        client_params = getattr(self, "client_params", None)
+        if client_params and client_params.get("api_key"):
+            return client_params["api_key"]
+        api_key = getattr(self, "api_key", None)
+        if not api_key:
+            get_client_params = getattr(self, "_get_client_params", None) or getattr(self, "get_client_params", None)
+            if get_client_params is not None:
+                # Also stores the key from the environment on the model, so this runs once
+                params = get_client_params()
+                api_key = getattr(self, "api_key", None) or params.get("api_key")
+        return api_key
+
+    def _estimate_request_tokens(self, messages: List[Message]) -> int:
+        max_output_tokens = getattr(self, "max_completion_tokens", None) or getattr(self, "max_tokens", None)
+        return estimate_tokens(messages, max_output_tokens=max_output_tokens)
+
+    def _release_rate_limit(
+        self,
+        rate_limiter: RateLimiter,
+        permit: RateLimitPermit,
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Hand the permit back to the rate limiter. Returns True if the provider rate limited the request."""
+        headers, rate_limited = error_headers(error) if error is not None else (None, False)
+        rate_limiter.release(permit, used_tokens=_usage_tokens(response), headers=headers, rate_limited=rate_limited)
+        return rate_limited
+
+    def _update_rate_limit(self, headers: Mapping[str, str]) -> None:
+        """Update the rate limiter from the rate limit headers of a successful response.
+
+        This way the limiter tracks the capacity the provider has left from every response, not only from
+        rate limited ones.
+        """
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            rate_limiter.update_from_headers(headers)
+
+    def _parse_raw_response(self, raw_response: Any) -> Any:
+        """Parse a response requested with the client library's `with_raw_response`, reading its rate limit headers"""
+        self._update_rate_limit(raw_response.headers)
+        return raw_response.parse()
+
+    async def _aparse_raw_response(self, raw_response: Any) -> Any:
+        """Async version of `_parse_raw_response`. Some client libraries parse async raw responses in a coroutine."""
+        self._update_rate_limit(raw_response.headers)
+        parsed = raw_response.parse()
+        if isawaitable(parsed):
+            parsed = await parsed
+        return parsed
+
+    def _invoke(self, assistant_message: Message, **kwargs: Any) -> Any:
+        """Call invoke(), pacing it with the rate limiter and retrying it if the provider rate limits it"""
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is None:
+            assistant_message.metrics.start_timer()
+            response = self.invoke(**kwargs)
+            assistant_message.metrics.stop_timer()
+            return response
+
+        tokens = self._estimate_request_tokens(kwargs["messages"])
+        wait_time = 0.0
+        for attempt in range(self.rate_limit_retries + 1):
+            permit = rate_limiter.acquire(tokens)
+            wait_time += permit.wait_time
+            assistant_message.metrics.start_timer()
+            try:
+                response = self.invoke(**kwargs)
+            except ModelProviderError as e:
+                if not self._release_rate_limit(rate_limiter, permit, error=e) or attempt == self.rate_limit_retries:
+                    raise
+                log_warning(
+                    f"Rate limited by {self.get_provider()}, retrying ({attempt + 1}/{self.rate_limit_retries})"
+                )
+                continue
+            except BaseException:
+                self._release_rate_limit(rate_limiter, permit)
+                raise
+            assistant_message.metrics.stop_timer()
+            self._release_rate_limit(rate_limiter, permit, response=response)
+            _add_rate_limit_wait_time(assistant_message, wait_time)
+            return response
+
+    async def _ainvoke(self, assistant_message: Message, **kwargs: Any) -> Any:
+        """Call ainvoke(), pacing it with the rate limiter and retrying it if the provider rate limits it"""
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is None:
+            assistant_message.metrics.start_timer()
+            response = await self.ainvoke(**kwargs)
+            assistant_message.metrics.stop_timer()
+            return response
+
+        tokens = self._estimate_request_tokens(kwargs["messages"])
+        wait_time = 0.0
+        for attempt in range(self.rate_limit_retries + 1):
+            permit = await rate_limiter.aacquire(tokens)
+            wait_time += permit.wait_time
+            assistant_message.metrics.start_timer()
+            try:
+                response = await self.ainvoke(**kwargs)
+            except ModelProviderError as e:
+                if not self._release_rate_limit(rate_limiter, permit, error=e) or attempt == self.rate_limit_retries:
+                    raise
+                log_warning(
+                    f"Rate limited by {self.get_provider()}, retrying ({attempt + 1}/{self.rate_limit_retries})"
+                )
+                continue
+            except BaseException:
+                self._release_rate_limit(rate_limiter, permit)
+                raise
+            assistant_message.metrics.stop_timer()
+            self._release_rate_limit(rate_limiter, permit, response=response)
+            _add_rate_limit_wait_time(assistant_message, wait_time)
+            return response
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> Any:
         pass
@@ -415,6 +598,25 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response End", center=True, symbol="-")
         return model_response
 
+    async def _aprefetch_media(self, messages: List[Message]) -> None:
+        """Download the media urls this Model sends inline, so formatting the request reads them from the cache"""
+        if not self.prefetch_media_urls:
+            return
+
+        urls: List[str] = []
+        for message in messages:
+            for kind in self.prefetch_media_urls:
+                for media in getattr(message, kind, None) or []:
+                    url = getattr(media, "url", None)
+                    if isinstance(url, str) and url.startswith(("http://", "https://")):
+                        urls.append(url)
+        if not urls:
+            return
+
+        from agno.utils.media_cache import get_media_cache
+
+        await get_media_cache().aprefetch(urls)
+
     async def aresponse(
         self,
         messages: List[Message],
@@ -431,6 +633,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        await self._aprefetch_media(messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -535,14 +738,13 @@ class Model(ABC):
         assistant_message = Message(role=self.assistant_message_role)
 
         # Generate response
-        assistant_message.metrics.start_timer()
-        response = self.invoke(
+        response = self._invoke(
+            assistant_message,
             messages=messages,
             response_format=response_format,
             tools=tools,
             tool_choice=tool_choice or self._tool_choice,
         )
-        assistant_message.metrics.stop_timer()
 
         # Parse provider response
         provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
@@ -601,14 +803,13 @@ class Model(ABC):
         assistant_message = Message(role=self.assistant_message_role)
 
         # Generate response
-        assistant_message.metrics.start_timer()
-        response = await self.ainvoke(
+        response = await self._ainvoke(
+            assistant_message,
             messages=messages,
             response_format=response_format,
             tools=tools,
             tool_choice=tool_choice or self._tool_choice,
         )
-        assistant_message.metrics.stop_timer()
 
         # Parse provider response
         provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
@@ -724,16 +925,29 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):
-            model_response_delta = self.parse_provider_response_delta(response_delta)
-            yield from self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
-            )
+        rate_limiter = self.get_rate_limiter()
+        permit = rate_limiter.acquire(self._estimate_request_tokens(messages)) if rate_limiter is not None else None
+        error: Optional[BaseException] = None
+        try:
+            for response_delta in self.invoke_stream(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            ):
+                model_response_delta = self.parse_provider_response_delta(response_delta)
+                yield from self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=model_response_delta,
+                )
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if rate_limiter is not None and permit is not None:
+                self._release_rate_limit(rate_limiter, permit, response=stream_data, error=error)
+                _add_rate_limit_wait_time(assistant_message, permit.wait_time)
 
     def response_stream(
         self,
@@ -858,17 +1072,32 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):  # type: ignore
-            model_response_delta = self.parse_provider_response_delta(response_delta)
-            for model_response in self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
-            ):
-                yield model_response
+        rate_limiter = self.get_rate_limiter()
+        permit = (
+            await rate_limiter.aacquire(self._estimate_request_tokens(messages)) if rate_limiter is not None else None
+        )
+        error: Optional[BaseException] = None
+        try:
+            async for response_delta in self.ainvoke_stream(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            ):  # type: ignore
+                model_response_delta = self.parse_provider_response_delta(response_delta)
+                for model_response in self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=model_response_delta,
+                ):
+                    yield model_response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if rate_limiter is not None and permit is not None:
+                self._release_rate_limit(rate_limiter, permit, response=stream_data, error=error)
+                _add_rate_limit_wait_time(assistant_message, permit.wait_time)
 
     async def aresponse_stream(
         self,
@@ -886,6 +1115,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        await self._aprefetch_media(messages)
 
         function_call_count = 0
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Type, Union
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -32,6 +32,8 @@ class Cohere(Model):
     name: str = "cohere"
     provider: str = "Cohere"
 
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ("images",)
+
     # -*- Request parameters
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
@@ -3,7 +3,7 @@ import time
 from dataclasses import dataclass
 from os import getenv
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -57,6 +57,8 @@ class Gemini(Model):
     name: str = "Gemini"
     provider: str = "Google"
 
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ("images", "audio", "files")
+
     supports_native_structured_outputs: bool = True
 
     # Request parameters
@@ -353,116 +355,127 @@ class Gemini(Model):
         """
         Converts a list of Message objects to the Gemini-compatible format.
 
+        Messages are formatted once and reused by later requests while they are unchanged.
+
         Args:
             messages (List[Message]): The list of messages to convert.
         """
         formatted_messages: List = []
-        file_content: Optional[Union[GeminiFile, Part]] = None
         system_message = None
+        key = (type(self), tuple(self.reverse_role_map.items()))
         for message in messages:
-            role = message.role
-            if role in ["system", "developer"]:
+            if message.role in ["system", "developer"]:
                 system_message = message.content
                 continue
+            formatted_messages.extend(message.get_formatted(key, self._format_message))
 
-            # Set the role for the message according to Gemini's requirements
-            role = self.reverse_role_map.get(role, role)
-
-            # Add content to the message for the model
-            content = message.content
-            # Initialize message_parts to be used for Gemini
-            message_parts: List[Any] = []
-
-            # Function calls
-            if (not content or role == "model") and message.tool_calls is not None and len(message.tool_calls) > 0:
-                for tool_call in message.tool_calls:
-                    message_parts.append(
-                        Part.from_function_call(
-                            name=tool_call["function"]["name"],
-                            args=json.loads(tool_call["function"]["arguments"]),
-                        )
-                    )
-            # Function results
-            elif message.tool_calls is not None and len(message.tool_calls) > 0:
-                for tool_call in message.tool_calls:
-                    message_parts.append(
-                        Part.from_function_response(
-                            name=tool_call["tool_name"], response={"result": tool_call["content"]}
-                        )
-                    )
-            # Regular text content
-            else:
-                if isinstance(content, str):
-                    message_parts = [Part.from_text(text=content)]
-
-            if role == "user" and message.tool_calls is None:
-                # Add images to the message for the model
-                if message.images is not None:
-                    for image in message.images:
-                        if image.content is not None and isinstance(image.content, GeminiFile):
-                            # Google recommends that if using a single image, place the text prompt after the image.
-                            message_parts.insert(0, image.content)
-                        else:
-                            image_content = format_image_for_message(image)
-                            if image_content:
-                                message_parts.append(Part.from_bytes(**image_content))
-
-                # Add videos to the message for the model
-                if message.videos is not None:
-                    try:
-                        for video in message.videos:
-                            # Case 1: Video is a file_types.File object (Recommended)
-                            # Add it as a File object
-                            if video.content is not None and isinstance(video.content, GeminiFile):
-                                # Google recommends that if using a single video, place the text prompt after the video.
-                                if video.content.uri and video.content.mime_type:
-                                    message_parts.insert(
-                                        0, Part.from_uri(file_uri=video.content.uri, mime_type=video.content.mime_type)
-                                    )
-                            else:
-                                video_file = self._format_video_for_message(video)
-                                if video_file is not None:
-                                    message_parts.insert(0, video_file)
-                    except Exception as e:
-                        log_warning(f"Failed to load video from {message.videos}: {e}")
-                        continue
-
-                # Add audio to the message for the model
-                if message.audio is not None:
-                    try:
-                        for audio_snippet in message.audio:
-                            if audio_snippet.content is not None and isinstance(audio_snippet.content, GeminiFile):
-                                # Google recommends that if using a single audio file, place the text prompt after the audio file.
-                                if audio_snippet.content.uri and audio_snippet.content.mime_type:
-                                    message_parts.insert(
-                                        0,
-                                        Part.from_uri(
-                                            file_uri=audio_snippet.content.uri,
-                                            mime_type=audio_snippet.content.mime_type,
-                                        ),
-                                    )
-                            else:
-                                audio_content = self._format_audio_for_message(audio_snippet)
-                                if audio_content:
-                                    message_parts.append(audio_content)
-                    except Exception as e:
-                        log_warning(f"Failed to load audio from {message.audio}: {e}")
-                        continue
+        return formatted_messages, system_message
 
-                # Add files to the message for the model
-                if message.files is not None:
-                    for file in message.files:
-                        file_content = self._format_file_for_message(file)
-                        if isinstance(file_content, Part):
-                            formatted_messages.append(file_content)
+    def _format_message(self, message: Message) -> List[Any]:
+        """
+        Converts a user, model or tool message to Gemini contents.
 
-            final_message = Content(role=role, parts=message_parts)
-            formatted_messages.append(final_message)
+        Args:
+            message (Message): The message to convert.
 
-            if isinstance(file_content, GeminiFile):
-                formatted_messages.insert(0, file_content)
+        Returns:
+            List[Any]: The files attached to the message, followed by the message content.
+        """
+        contents: List[Any] = []
+
+        # Set the role for the message according to Gemini's requirements
+        role = self.reverse_role_map.get(message.role, message.role)
+
+        # Add content to the message for the model
+        content = message.content
+        # Initialize message_parts to be used for Gemini
+        message_parts: List[Any] = []
+
+        # Function calls
+        if (not content or role == "model") and message.tool_calls is not None and len(message.tool_calls) > 0:
+            for tool_call in message.tool_calls:
+                message_parts.append(
+                    Part.from_function_call(
+                        name=tool_call["function"]["name"],
+                        args=json.loads(tool_call["function"]["arguments"]),
+                    )
+                )
+        # Function results
+        elif message.tool_calls is not None and len(message.tool_calls) > 0:
+            for tool_call in message.tool_calls:
+                message_parts.append(
+                    Part.from_function_response(
+                        name=tool_call["tool_name"], response={"result": tool_call["content"]}
+                    )
+                )
+        # Regular text content
+        else:
+            if isinstance(content, str):
+                message_parts = [Part.from_text(text=content)]
+
+        if role == "user" and message.tool_calls is None:
+            # Add images to the message for the model
+            if message.images is not None:
+                for image in message.images:
+                    if image.content is not None and isinstance(image.content, GeminiFile):
+                        # Google recommends that if using a single image, place the text prompt after the image.
+                        message_parts.insert(0, image.content)
+                    else:
+                        image_content = format_image_for_message(image)
+                        if image_content:
+                            message_parts.append(Part.from_bytes(**image_content))
 
-        return formatted_messages, system_message
+            # Add videos to the message for the model
+            if message.videos is not None:
+                try:
+                    for video in message.videos:
+                        # Case 1: Video is a file_types.File object (Recommended)
+                        # Add it as a File object
+                        if video.content is not None and isinstance(video.content, GeminiFile):
+                            # Google recommends that if using a single video, place the text prompt after the video.
+                            if video.content.uri and video.content.mime_type:
+                                message_parts.insert(
+                                    0, Part.from_uri(file_uri=video.content.uri, mime_type=video.content.mime_type)
+                                )
+                        else:
+                            video_file = self._format_video_for_message(video)
+                            if video_file is not None:
+                                message_parts.insert(0, video_file)
+                except Exception as e:
+                    log_warning(f"Failed to load video from {message.videos}: {e}")
+                    return []
+
+            # Add audio to the message for the model
+            if message.audio is not None:
+                try:
+                    for audio_snippet in message.audio:
+                        if audio_snippet.content is not None and isinstance(audio_snippet.content, GeminiFile):
+                            # Google recommends that if using a single audio file, place the text prompt after the audio file.
+                            if audio_snippet.content.uri and audio_snippet.content.mime_type:
+                                message_parts.insert(
+                                    0,
+                                    Part.from_uri(
+                                        file_uri=audio_snippet.content.uri,
+                                        mime_type=audio_snippet.content.mime_type,
+                                    ),
+                                )
+                        else:
+                            audio_content = self._format_audio_for_message(audio_snippet)
+                            if audio_content:
+                                message_parts.append(audio_content)
+                except Exception as e:
+                    log_warning(f"Failed to load audio from {message.audio}: {e}")
+                    return []
+
+            # Add files to the message for the model
+            if message.files is not None:
+                for file in message.files:
+                    file_content = self._format_file_for_message(file)
+                    if isinstance(file_content, Part):
+                        contents.append(file_content)
+
+        contents.append(Content(role=role, parts=message_parts))
+        return contents
 
     def _format_audio_for_message(self, audio: Audio) -> Optional[Union[Part, GeminiFile]]:
         # Case 1: Audio is a bytes object
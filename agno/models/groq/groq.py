@@ -193,6 +193,18 @@ class Groq(Model):
         cleaned_dict = {k: v for k, v in model_dict.items() if v is not None}
         return cleaned_dict
 
+    def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by Groq, reusing the formatted messages of earlier requests.
+
+        Args:
+            messages (List[Message]): The messages to format.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        return [message.get_formatted((type(self), "chat"), self.format_message) for message in messages]
+
     def format_message(
         self,
         message: Message,
@@ -255,11 +267,12 @@ class Groq(Model):
         Send a chat completion request to the Groq API.
         """
         try:
-            return self.get_client().chat.completions.create(
+            raw_response = self.get_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self.format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            return self._parse_raw_response(raw_response)
         except (APIResponseValidationError, APIStatusError) as e:
             log_error(f"Error calling Groq API: {str(e)}")
             raise ModelProviderError(
@@ -283,11 +296,12 @@ class Groq(Model):
         Sends an asynchronous chat completion request to the Groq API.
         """
         try:
-            return await self.get_async_client().chat.completions.create(
+            raw_response = await self.get_async_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self.format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            return await self._aparse_raw_response(raw_response)
         except (APIResponseValidationError, APIStatusError) as e:
             log_error(f"Error calling Groq API: {str(e)}")
             raise ModelProviderError(
@@ -311,12 +325,13 @@ class Groq(Model):
         Send a streaming chat completion request to the Groq API.
         """
         try:
-            return self.get_client().chat.completions.create(
+            raw_response = self.get_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self.format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 stream=True,
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            return self._parse_raw_response(raw_response)
         except (APIResponseValidationError, APIStatusError) as e:
             log_error(f"Error calling Groq API: {str(e)}")
             raise ModelProviderError(
@@ -341,12 +356,13 @@ class Groq(Model):
         """
 
         try:
-            stream = await self.get_async_client().chat.completions.create(
+            raw_response = await self.get_async_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self.format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 stream=True,
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            stream = await self._aparse_raw_response(raw_response)
             async for chunk in stream:  # type: ignore
                 yield chunk
         except (APIResponseValidationError, APIStatusError) as e:
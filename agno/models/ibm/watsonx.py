@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Type, Union
+from typing import Any, AsyncGenerator, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -32,6 +32,8 @@ class WatsonX(Model):
     name: str = "WatsonX"
     provider: str = "IBM"
 
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ("images",)
+
     # Request parameters
     frequency_penalty: Optional[float] = None
     presence_penalty: Optional[float] = None
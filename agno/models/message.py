@@ -1,12 +1,14 @@
 import json
+import logging
 from dataclasses import asdict, dataclass
+from itertools import count
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
-from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.log import is_log_level_enabled, log_debug, log_error, log_info, log_warning
 from agno.utils.timer import Timer
 
 
@@ -161,6 +163,15 @@ class MessageMetrics:
         return self + other
 
 
+T = TypeVar("T")
+
+# Fields that are never sent to a Model, so setting them keeps the formatted forms of a message
+_UNFORMATTED_FIELDS = frozenset(
+    {"metrics", "from_history", "add_to_agent_memory", "stop_after_tool_call", "created_at"}
+)
+_format_versions = count(1)
+
+
 class Message(BaseModel):
     """Message sent to the Model"""
 
@@ -221,6 +232,70 @@ class Message(BaseModel):
 
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    # Provider-formatted forms of this message by format key, see `get_formatted`
+    _formatted: Dict[Hashable, Tuple[Tuple[Any, ...], Any]] = PrivateAttr(default_factory=dict)
+    # Changes whenever a field sent to the Model is set
+    _format_version: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_") and name not in _UNFORMATTED_FIELDS:
+            # Private attributes are read through the private dict directly, which is much faster than getattr
+            private = self.__pydantic_private__
+            private["_format_version"] = next(_format_versions)
+            private["_formatted"] = {}
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "Message":
+        # A copy formats the same way, so it shares the formatted forms instead of copying them.
+        # History messages are deep-copied on every run, and would otherwise be formatted again each time.
+        memo = {} if memo is None else memo
+        formatted = self.__pydantic_private__["_formatted"]
+        memo[id(formatted)] = formatted
+        return super().__deepcopy__(memo)
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "Message":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__pydantic_private__["_format_version"] = next(_format_versions)
+            copied.__pydantic_private__["_formatted"] = {}
+        return copied
+
+    def _format_state(self) -> Tuple[Any, ...]:
+        # Setting a field changes the version, growing a list field in place changes its length
+        fields = self.__dict__
+        content = fields["content"]
+        return (
+            self.__pydantic_private__["_format_version"],
+            len(content) if isinstance(content, list) else -1,
+            len(fields["tool_calls"] or ()),
+            len(fields["images"] or ()),
+            len(fields["audio"] or ()),
+            len(fields["videos"] or ()),
+            len(fields["files"] or ()),
+        )
+
+    def get_formatted(self, key: Hashable, format_fn: Callable[["Message"], T]) -> T:
+        """Return format_fn(self), reusing the result of an earlier call with the same key if the message is unchanged.
+
+        Models convert the whole history on every request, although earlier messages do not change. The result is
+        shared between requests, so it must be treated as read-only.
+
+        Args:
+            key (Hashable): Identifies the format, e.g. the Model class and the options the format depends on.
+            format_fn (Callable[[Message], T]): Converts the message to the provider format.
+        """
+        formatted_forms = self.__pydantic_private__["_formatted"]
+        state = self._format_state()
+        cached = formatted_forms.get(key)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        formatted = format_fn(self)
+        # Formatters that change the message while formatting it are not cached
+        if self._format_state() == state:
+            self.__pydantic_private__["_formatted"][key] = (state, formatted)
+        return formatted
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -294,12 +369,20 @@ class Message(BaseModel):
                 Defaults to debug.
         """
         _logger = log_debug
+        _level = logging.DEBUG
         if level == "info":
             _logger = log_info
+            _level = logging.INFO
         elif level == "warning":
             _logger = log_warning
+            _level = logging.WARNING
         elif level == "error":
             _logger = log_error
+            _level = logging.ERROR
+
+        # Nothing below would be emitted, so skip formatting the message
+        if not is_log_level_enabled(_level):
+            return
 
         try:
             import shutil
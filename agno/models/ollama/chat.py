@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Type, Union
+from typing import Any, ClassVar, Dict, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -30,6 +30,8 @@ class Ollama(Model):
     name: str = "Ollama"
     provider: str = "Ollama"
 
+    prefetch_media_urls: ClassVar[Tuple[str, ...]] = ("images",)
+
     supports_native_structured_outputs: bool = True
 
     # Request parameters
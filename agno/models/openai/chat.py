@@ -307,6 +307,20 @@ class OpenAIChat(Model):
             message_dict["content"] = None
         return message_dict
 
+    def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by OpenAI, reusing the formatted messages of earlier requests.
+
+        Args:
+            messages (List[Message]): The messages to format.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        role_map = self.role_map if self.role_map else self.default_role_map
+        key = (type(self), "chat", tuple(role_map.items()))
+        return [message.get_formatted(key, self._format_message) for message in messages]
+
     def invoke(
         self,
         messages: List[Message],
@@ -325,11 +339,12 @@ class OpenAIChat(Model):
         """
 
         try:
-            return self.get_client().chat.completions.create(
+            raw_response = self.get_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            return self._parse_raw_response(raw_response)
         except RateLimitError as e:
             log_error(f"Rate limit error from OpenAI API: {e}")
             error_message = e.response.json().get("error", {})
@@ -385,11 +400,12 @@ class OpenAIChat(Model):
             ChatCompletion: The chat completion response from the API.
         """
         try:
-            return await self.get_async_client().chat.completions.create(
+            raw_response = await self.get_async_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            return await self._aparse_raw_response(raw_response)
         except RateLimitError as e:
             log_error(f"Rate limit error from OpenAI API: {e}")
             error_message = e.response.json().get("error", {})
@@ -446,13 +462,14 @@ class OpenAIChat(Model):
         """
 
         try:
-            yield from self.get_client().chat.completions.create(
+            raw_response = self.get_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 stream=True,
                 stream_options={"include_usage": True},
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
-            )  # type: ignore
+            )
+            yield from self._parse_raw_response(raw_response)
         except RateLimitError as e:
             log_error(f"Rate limit error from OpenAI API: {e}")
             error_message = e.response.json().get("error", {})
@@ -509,13 +526,14 @@ class OpenAIChat(Model):
         """
 
         try:
-            async_stream = await self.get_async_client().chat.completions.create(
+            raw_response = await self.get_async_client().chat.completions.with_raw_response.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 stream=True,
                 stream_options={"include_usage": True},
                 **self.get_request_kwargs(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
+            async_stream = await self._aparse_raw_response(raw_response)
             async for chunk in async_stream:
                 yield chunk
         except RateLimitError as e:
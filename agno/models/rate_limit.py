@@ -0,0 +1,594 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Deque, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+# Requests waiting for the rate limiter are served round-robin across keys, so one busy session cannot hold up the
+# others. Agents and Teams set this to the session id around their model calls. When not set, each thread or asyncio
+# task is its own key.
+rate_limit_key: ContextVar[Optional[Hashable]] = ContextVar("rate_limit_key", default=None)
+
+# Longest time a waiting request sleeps before it checks for capacity again
+_POLL_INTERVAL = 0.25
+
+T = TypeVar("T")
+
+
+@contextmanager
+def rate_limit_context(key: Optional[Hashable]) -> Iterator[None]:
+    """Set `rate_limit_key` while the block runs"""
+    token = rate_limit_key.set(key)
+    try:
+        yield
+    finally:
+        rate_limit_key.reset(token)
+
+
+def iterate_with_rate_limit_key(key: Optional[Hashable], iterator: Iterator[T]) -> Iterator[T]:
+    """Iterate with `rate_limit_key` set while each item is produced.
+
+    The key is never held across a yield, since a stream can be resumed from another context, e.g. a thread pool.
+    """
+    try:
+        while True:
+            with rate_limit_context(key):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+async def aiterate_with_rate_limit_key(key: Optional[Hashable], iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Async version of `iterate_with_rate_limit_key`"""
+    try:
+        while True:
+            with rate_limit_context(key):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+@dataclass
+class RateLimitMetrics:
+    """Counters of a rate limiter, for monitoring how long requests wait for capacity"""
+
+    # Requests that went through the limiter
+    requests: int = 0
+    # Requests that had to wait for capacity
+    delayed_requests: int = 0
+    # Seconds spent waiting, summed over all requests
+    total_wait_time: float = 0.0
+    # Longest wait of a single request
+    max_wait_time: float = 0.0
+    # Responses where the provider reported the rate limit was exceeded
+    rate_limited_responses: int = 0
+    # Tokens estimated before the requests, and reported by the provider after them
+    estimated_tokens: int = 0
+    used_tokens: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _TokenBucket:
+    """Refills at `limit` per minute, up to `limit`. A None limit never runs out."""
+
+    __slots__ = ("limit", "level", "updated")
+
+    def __init__(self, limit: Optional[float] = None):
+        self.limit = limit
+        self.level: float = limit or 0.0
+        self.updated = time.monotonic()
+
+    def set_limit(self, limit: Optional[float]) -> None:
+        if limit == self.limit:
+            return
+        if limit is None:
+            self.level = 0.0
+        elif self.limit is None:
+            # A new limit starts with a full bucket
+            self.level = limit
+        else:
+            self.level = min(self.level, limit)
+        self.limit = limit
+
+    def refill(self, now: float) -> None:
+        if self.limit is not None:
+            self.level = min(self.limit, self.level + (now - self.updated) * self.limit / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be taken. Amounts over the limit wait for a full bucket."""
+        if self.limit is None or self.limit <= 0:
+            return 0.0
+        missing = min(amount, self.limit) - self.level
+        return max(0.0, missing * 60 / self.limit)
+
+    def take(self, amount: float) -> None:
+        if self.limit is not None:
+            self.level -= amount
+
+
+class _Waiter:
+    __slots__ = ("tokens", "key", "granted", "event", "loop", "future")
+
+    def __init__(self, tokens: int, key: Hashable, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.tokens = tokens
+        self.key = key
+        self.granted = False
+        self.loop = loop
+        self.event: Optional[threading.Event] = threading.Event() if loop is None else None
+        self.future: Optional[asyncio.Future] = loop.create_future() if loop is not None else None
+
+    def grant(self) -> None:
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            self.loop.call_soon_threadsafe(_set_future_result, self.future)
+
+
+def _set_future_result(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+@dataclass
+class RateLimitPermit:
+    """Capacity granted to one request, handed back to the limiter with `release` when the request is done"""
+
+    tokens: int
+    wait_time: float
+    # time.monotonic() when the request was let through
+    granted_at: float = 0.0
+
+
+class RateLimiter:
+    """Client-side token-bucket limiter for the requests and tokens sent to a model provider.
+
+    Requests wait until both the requests-per-minute and tokens-per-minute buckets have capacity for them, and for
+    a free slot when `max_concurrency` is set. Waiting requests are served round-robin across `rate_limit_key`s.
+    Responses correct the limiter: token estimates are replaced by the usage the provider reports, `x-ratelimit-*`
+    (or Anthropic's `anthropic-ratelimit-*`) headers lower the buckets to what the provider has left, and a rate limited
+    response pauses every request until the limit resets and halves the concurrency, which then grows back by one per
+    `concurrency` successes.
+
+    Args:
+        requests_per_minute (Optional[int]): Requests allowed per minute. None does not limit requests.
+        tokens_per_minute (Optional[int]): Tokens allowed per minute. None does not limit tokens, unless the
+            provider reports its limit in the response headers.
+        max_concurrency (Optional[int]): Requests allowed in flight at once. None does not limit concurrency.
+        name (str): Name used in logs.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        name: str = "rate-limiter",
+    ):
+        self.name = name
+        self.metrics = RateLimitMetrics()
+
+        self._requests = _TokenBucket(requests_per_minute)
+        self._tokens = _TokenBucket(tokens_per_minute)
+        self._tokens_configured = tokens_per_minute is not None
+        self.max_concurrency = max_concurrency
+        self._concurrency: float = float(max_concurrency or 0)
+        self._in_flight = 0
+        # No request is sent before this time, set when the provider rate limits a request
+        self._blocked_until = 0.0
+        # Last time the provider reported the tokens it has left
+        self._tokens_reported_at = 0.0
+        # key -> requests waiting for capacity
+        self._queues: "OrderedDict[Hashable, Deque[_Waiter]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """Change the configured limits. Waiting requests are re-evaluated against them."""
+        with self._lock:
+            now = time.monotonic()
+            self._requests.refill(now)
+            self._tokens.refill(now)
+            self._requests.set_limit(requests_per_minute)
+            if tokens_per_minute is not None or self._tokens_configured:
+                self._tokens.set_limit(tokens_per_minute)
+            self._tokens_configured = tokens_per_minute is not None
+            if max_concurrency != self.max_concurrency:
+                self.max_concurrency = max_concurrency
+                self._concurrency = float(max_concurrency or 0)
+            self._dispatch(now)
+
+    def acquire(self, tokens: int = 0, key: Optional[Hashable] = None) -> RateLimitPermit:
+        """Wait until a request of `tokens` tokens can be sent"""
+        waiter = _Waiter(tokens, self._key(key))
+        start = time.monotonic()
+        delay = self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                waiter.event.wait(timeout=delay)  # type: ignore
+                delay = self._redispatch()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return self._permit(tokens, time.monotonic() - start)
+
+    async def aacquire(self, tokens: int = 0, key: Optional[Hashable] = None) -> RateLimitPermit:
+        """Wait until a request of `tokens` tokens can be sent, without blocking the event loop"""
+        waiter = _Waiter(tokens, self._key(key), loop=asyncio.get_running_loop())
+        start = time.monotonic()
+        delay = self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), timeout=delay)  # type: ignore
+                except asyncio.TimeoutError:
+                    pass
+                delay = self._redispatch()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return self._permit(tokens, time.monotonic() - start)
+
+    def release(
+        self,
+        permit: RateLimitPermit,
+        used_tokens: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        rate_limited: bool = False,
+    ) -> None:
+        """Hand back the capacity of a finished request.
+
+        Args:
+            permit (RateLimitPermit): The permit returned by `acquire`.
+            used_tokens (Optional[int]): Tokens the provider counted for the request, replacing the estimate.
+            headers (Optional[Mapping[str, str]]): Response headers with the provider's rate limit state.
+            rate_limited (bool): True if the provider rejected the request for exceeding its rate limit.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._in_flight = max(0, self._in_flight - 1)
+            self._tokens.refill(now)
+            if used_tokens is not None:
+                self.metrics.used_tokens += used_tokens
+                # Tokens the provider reported as left since the request was sent already count it
+                if self._tokens_reported_at < permit.granted_at:
+                    self._tokens.take(used_tokens - permit.tokens)
+            if headers is not None:
+                self._update_from_headers(headers, now)
+            if rate_limited:
+                self.metrics.rate_limited_responses += 1
+                retry_after = _parse_retry_after(headers) if headers is not None else None
+                self._blocked_until = max(self._blocked_until, now + (retry_after or 1.0))
+                if self.max_concurrency:
+                    self._concurrency = max(1.0, self._concurrency / 2)
+                log_warning(
+                    f"{self.name}: rate limited by the provider, pausing requests for "
+                    f"{self._blocked_until - now:.1f}s"
+                )
+            elif self.max_concurrency and self._concurrency < self.max_concurrency:
+                self._concurrency = min(float(self.max_concurrency), self._concurrency + 1 / self._concurrency)
+            self._dispatch(now)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Lower the buckets to the capacity the provider reports as remaining"""
+        with self._lock:
+            self._update_from_headers(headers, time.monotonic())
+
+    def _key(self, key: Optional[Hashable]) -> Hashable:
+        if key is not None:
+            return key
+        key = rate_limit_key.get()
+        if key is not None:
+            return key
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return ("task", id(task)) if task is not None else ("thread", threading.get_ident())
+
+    def _permit(self, tokens: int, wait_time: float) -> RateLimitPermit:
+        with self._lock:
+            self.metrics.requests += 1
+            self.metrics.estimated_tokens += tokens
+            if wait_time > 0.001:
+                self.metrics.delayed_requests += 1
+                self.metrics.total_wait_time += wait_time
+                self.metrics.max_wait_time = max(self.metrics.max_wait_time, wait_time)
+                log_debug(f"{self.name}: request waited {wait_time:.3f}s for capacity")
+        return RateLimitPermit(tokens=tokens, wait_time=wait_time, granted_at=time.monotonic())
+
+    def _enqueue(self, waiter: _Waiter) -> float:
+        with self._lock:
+            queue = self._queues.get(waiter.key)
+            if queue is None:
+                queue = self._queues[waiter.key] = deque()
+            queue.append(waiter)
+            now = time.monotonic()
+            self._dispatch(now)
+            return self._delay(now)
+
+    def _redispatch(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._dispatch(now)
+            return self._delay(now)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Forget a waiter that stopped waiting, e.g. because its task was cancelled"""
+        with self._lock:
+            if waiter.granted:
+                # Granted just before it stopped waiting, hand its slot to the next request
+                self._in_flight = max(0, self._in_flight - 1)
+            else:
+                queue = self._queues.get(waiter.key)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[waiter.key]
+            self._dispatch(time.monotonic())
+
+    def _dispatch(self, now: float) -> None:
+        """Grant waiting requests, round-robin across keys, while there is capacity for them"""
+        self._requests.refill(now)
+        self._tokens.refill(now)
+        while self._queues and now >= self._blocked_until:
+            if self.max_concurrency and self._in_flight >= int(self._concurrency):
+                return
+            key, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+            if self._requests.wait_time(1) > 0 or self._tokens.wait_time(waiter.tokens) > 0:
+                return
+
+            queue.popleft()
+            if queue:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+            self._requests.take(1)
+            self._tokens.take(waiter.tokens)
+            self._in_flight += 1
+            waiter.grant()
+
+    def _delay(self, now: float) -> float:
+        """Seconds a waiting request sleeps before it checks for capacity again"""
+        if not self._queues:
+            return _POLL_INTERVAL
+        if now < self._blocked_until:
+            delay = self._blocked_until - now
+        elif self.max_concurrency and self._in_flight >= int(self._concurrency):
+            # Finished requests grant the next one themselves
+            delay = _POLL_INTERVAL
+        else:
+            waiter = next(iter(self._queues.values()))[0]
+            delay = max(self._requests.wait_time(1), self._tokens.wait_time(waiter.tokens))
+        # Waiters that are not next in line only estimate, so they check again at least every poll interval
+        return min(max(delay, 0.001), _POLL_INTERVAL)
+
+    def _update_from_headers(self, headers: Mapping[str, str], now: float) -> None:
+        headers = _normalize_headers(headers)
+
+        # The tokens limit is per minute for every provider that reports it, the requests limit is per minute for
+        # some and per day for others, so only the remaining requests are used.
+        token_limit = _parse_number(headers.get("x-ratelimit-limit-tokens"))
+        if token_limit is not None and not self._tokens_configured and token_limit != self._tokens.limit:
+            log_debug(f"{self.name}: using the provider's limit of {token_limit:.0f} tokens per minute")
+            self._tokens.set_limit(token_limit)
+
+        for bucket, kind in ((self._requests, "requests"), (self._tokens, "tokens")):
+            remaining = _parse_number(headers.get(f"x-ratelimit-remaining-{kind}"))
+            if remaining is None:
+                continue
+            if bucket.limit is not None:
+                bucket.level = min(bucket.level, remaining)
+            if bucket is self._tokens:
+                self._tokens_reported_at = now
+            if remaining < 1:
+                reset = _parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                if reset is not None:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse a reset duration such as "1s", "6m0s", "2m59.56s" or "120ms" into seconds"""
+    if not value:
+        return None
+    number = _parse_number(value)
+    if number is not None:
+        return number
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(amount) * units[unit] for amount, unit in parts)
+
+
+# Anthropic header -> the equivalent `x-ratelimit-*` header
+_ANTHROPIC_HEADERS = {
+    "anthropic-ratelimit-requests-remaining": "x-ratelimit-remaining-requests",
+    "anthropic-ratelimit-requests-reset": "x-ratelimit-reset-requests",
+    "anthropic-ratelimit-tokens-limit": "x-ratelimit-limit-tokens",
+    "anthropic-ratelimit-tokens-remaining": "x-ratelimit-remaining-tokens",
+    "anthropic-ratelimit-tokens-reset": "x-ratelimit-reset-tokens",
+}
+
+
+def _normalize_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Lowercase the header names and map Anthropic's rate limit headers to the `x-ratelimit-*` ones"""
+    normalized = {k.lower(): v for k, v in headers.items()}
+    for name, equivalent in _ANTHROPIC_HEADERS.items():
+        value = normalized.get(name)
+        if value is None or equivalent in normalized:
+            continue
+        if name.endswith("-reset"):
+            # Anthropic reports when the limit resets as an RFC 3339 time, not as a duration
+            try:
+                reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            value = str(max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds()))
+        normalized[equivalent] = value
+    return normalized
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    headers = _normalize_headers(headers)
+    for name in ("retry-after-ms", "retry-after"):
+        seconds = _parse_number(headers.get(name))
+        if seconds is not None:
+            return seconds / 1000 if name == "retry-after-ms" else seconds
+    resets = [_parse_duration(headers.get(f"x-ratelimit-reset-{kind}")) for kind in ("requests", "tokens")]
+    resets = [reset for reset in resets if reset is not None]
+    return min(resets) if resets else None
+
+
+def error_headers(error: BaseException) -> Tuple[Optional[Mapping[str, str]], bool]:
+    """Return the response headers of a provider error and whether it is a rate limit error.
+
+    Providers raise ModelProviderError from the exception of their client library, which carries the http response.
+    """
+    status_code = getattr(error, "status_code", None)
+    headers = None
+    cause: Optional[BaseException] = error
+    while cause is not None and headers is None:
+        response = getattr(cause, "response", None)
+        headers = getattr(response, "headers", None)
+        status_code = getattr(response, "status_code", None) or status_code
+        cause = cause.__cause__
+    return headers, status_code == 429
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except ImportError:
+        log_debug("`tiktoken` not installed, estimating 4 characters per token")
+    except Exception as e:
+        log_warning(f"Could not load the tiktoken encoding: {e}")
+    return None
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens of a text with tiktoken, or estimate them when it is not installed"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def _count_message_tokens(message: Message) -> int:
+    # Every message costs a few tokens for its role and separators
+    tokens = 4
+    if isinstance(message.content, str):
+        tokens += count_tokens(message.content)
+    elif isinstance(message.content, list):
+        for part in message.content:
+            if isinstance(part, str):
+                tokens += count_tokens(part)
+            elif isinstance(part, dict) and isinstance(part.get("text"), str):
+                tokens += count_tokens(part["text"])
+    if message.tool_calls:
+        tokens += count_tokens(str(message.tool_calls))
+    return tokens
+
+
+def estimate_tokens(messages: List[Message], max_output_tokens: Optional[int] = None) -> int:
+    """Estimate the tokens a request counts against a tokens-per-minute limit: its prompt and the output it allows.
+
+    Token counts are cached on the messages, so the history is not tokenized again on every request.
+    """
+    tokens = sum(message.get_formatted("rate_limit_tokens", _count_message_tokens) for message in messages)
+    return tokens + (max_output_tokens or 0)
+
+
+_rate_limiters: Dict[Tuple[str, str, str], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str,
+    model_id: str,
+    api_key: Optional[str] = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+) -> RateLimiter:
+    """Return the rate limiter shared by every model with the same provider, model id and api key.
+
+    The limits of an existing limiter are updated when they differ from the ones passed in.
+    """
+    # Only a digest of the api key is kept
+    api_key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] if api_key else ""
+    key = (provider, model_id, api_key_digest)
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(key)
+            if limiter is None:
+                limiter = _rate_limiters[key] = RateLimiter(
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                    max_concurrency=max_concurrency,
+                    name=f"{provider} ({model_id})",
+                )
+                return limiter
+
+    configured = (limiter._requests.limit, limiter._tokens.limit if limiter._tokens_configured else None)
+    if configured != (requests_per_minute, tokens_per_minute) or limiter.max_concurrency != max_concurrency:
+        limiter.configure(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            max_concurrency=max_concurrency,
+        )
+    return limiter
+
+
+def get_rate_limit_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return the metrics of every shared rate limiter, by limiter name"""
+    with _rate_limiters_lock:
+        limiters = list(_rate_limiters.values())
+    return {limiter.name: limiter.metrics.to_dict() for limiter in limiters}
+
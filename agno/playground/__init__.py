@@ -1,6 +1,11 @@
-from agno.playground.deploy import deploy_playground_app
-from agno.playground.playground import Playground, PlaygroundSettings
-from agno.playground.serve import serve_playground_app
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.playground.deploy import deploy_playground_app
+    from agno.playground.playground import Playground, PlaygroundSettings
+    from agno.playground.serve import serve_playground_app
 
 __all__ = [
     "deploy_playground_app",
@@ -8,3 +13,12 @@ __all__ = [
     "PlaygroundSettings",
     "serve_playground_app",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.playground.deploy": ["deploy_playground_app"],
+        "agno.playground.playground": ["Playground", "PlaygroundSettings"],
+        "agno.playground.serve": ["serve_playground_app"],
+    },
+)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import ClassVar, List
 
 from pydantic import BaseModel, ConfigDict
 
@@ -10,5 +10,8 @@ class Reranker(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
 
+    # Whether rerank() uses the document embeddings, so vector dbs fetch them with the search results
+    requires_embeddings: ClassVar[bool] = False
+
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         raise NotImplementedError
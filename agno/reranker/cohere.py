@@ -24,7 +24,9 @@ class CohereReranker(Reranker):
         _client_params: Dict[str, Any] = {}
         if self.api_key:
             _client_params["api_key"] = self.api_key
-        return CohereClient(**_client_params)
+        # Keep the client so its connection pool is reused across rerank calls
+        self.cohere_client = CohereClient(**_client_params)
+        return self.cohere_client
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         # Validate input documents and top_n
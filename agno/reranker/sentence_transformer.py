@@ -0,0 +1,118 @@
+import asyncio
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, logger
+from agno.utils.lru_cache import LRUCache
+from agno.utils.model_registry import get_or_load_model
+
+try:
+    from sentence_transformers import CrossEncoder
+except ImportError:
+    raise ImportError("`sentence-transformers` not installed, please run `pip install sentence-transformers`")
+
+
+class SentenceTransformerReranker(Reranker):
+    """Reranks documents locally with a sentence-transformers cross-encoder.
+
+    The model is loaded once per process and shared between instances. Scores are cached per
+    (query, document content), so re-ranking the same candidates skips the forward pass.
+    """
+
+    model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    # Device to load the model on, e.g. "cpu" or "cuda". Defaults to the sentence-transformers choice.
+    device: Optional[str] = None
+    # Inference backend, e.g. "torch" or "onnx". Defaults to the sentence-transformers choice.
+    backend: Optional[str] = None
+    # Maximum number of tokens per (query, document) pair
+    max_length: Optional[int] = None
+    # Number of (query, document) pairs scored per forward pass
+    batch_size: int = 32
+    top_n: Optional[int] = None
+    # Number of scores kept in the LRU cache. 0 disables the cache.
+    cache_size: int = 4096
+    cross_encoder: Optional[Any] = None
+    _score_cache: Optional[LRUCache[float]] = None
+
+    @property
+    def client(self) -> CrossEncoder:
+        if self.cross_encoder:
+            return self.cross_encoder
+
+        self.cross_encoder = get_or_load_model(
+            ("cross_encoder", self.model, self.device, self.backend, self.max_length), self._load_model
+        )
+        return self.cross_encoder
+
+    def _load_model(self) -> CrossEncoder:
+        _model_params: Dict[str, Any] = {"device": self.device}
+        if self.max_length is not None:
+            _model_params["max_length"] = self.max_length
+        if self.backend is not None:
+            _model_params["backend"] = self.backend
+        return CrossEncoder(self.model, **_model_params)
+
+    @property
+    def score_cache(self) -> LRUCache[float]:
+        if self._score_cache is None:
+            self._score_cache = LRUCache(maxsize=self.cache_size)
+        return self._score_cache
+
+    def _score(self, query: str, documents: List[Document]) -> List[float]:
+        """Score documents against the query, running the model only for pairs missing from the cache"""
+        keys: List[Tuple[str, str]] = [(query, md5(doc.content.encode()).hexdigest()) for doc in documents]
+        scores: List[Optional[float]] = [self.score_cache.get(key) for key in keys]
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            log_debug(f"Scoring {len(missing)} of {len(documents)} documents with {self.model}")
+            predictions = self.client.predict(
+                [(query, documents[i].content) for i in missing],
+                batch_size=self.batch_size,
+                show_progress_bar=False,
+            )
+            for i, prediction in zip(missing, predictions):
+                scores[i] = float(prediction)
+                self.score_cache.set(keys[i], scores[i])  # type: ignore
+
+        return scores  # type: ignore
+
+    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        # Validate input documents and top_n
+        if not documents:
+            return []
+
+        top_n = self.top_n
+        if top_n and not (0 < top_n):
+            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
+            top_n = None
+
+        scores = self._score(query=query, documents=documents)
+        for doc, score in zip(documents, scores):
+            doc.reranking_score = score
+
+        # Order by relevance score
+        compressed_docs = sorted(
+            documents,
+            key=lambda x: x.reranking_score if x.reranking_score is not None else float("-inf"),
+            reverse=True,
+        )
+
+        # Limit to top_n if specified
+        if top_n:
+            compressed_docs = compressed_docs[:top_n]
+
+        return compressed_docs
+
+    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        try:
+            return self._rerank(query=query, documents=documents)
+        except Exception as e:
+            logger.error(f"Error reranking documents: {e}. Returning original documents")
+            return documents
+
+    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        """Async version of rerank, scoring on a worker thread so the event loop is not blocked"""
+        return await asyncio.to_thread(self.rerank, query, documents)
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -11,27 +11,47 @@ from agno.reasoning.step import ReasoningStep
 from agno.utils.log import log_error
 
 
+# Event fields that to_dict() serializes separately
+_SPECIAL_EVENT_FIELDS = frozenset(
+    [
+        "tools",
+        "tool",
+        "extra_data",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+    ]
+)
+
+
+def _to_plain(value: Any) -> Any:
+    """Like dataclasses.asdict for a single value, but leaf values are shared instead of deep-copied"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_to_plain(v) for v in value)
+    if isinstance(value, dict):
+        return {_to_plain(k): _to_plain(v) for k, v in value.items()}
+    return value
+
+
 @dataclass
 class BaseRunResponseEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "extra_data",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-            ]
-        }
+        # Only the serialized fields are converted. Events are built per streamed chunk, so this is a hot path.
+        _dict = {}
+        for f in fields(self):
+            if f.name in _SPECIAL_EVENT_FIELDS:
+                continue
+            value = getattr(self, f.name)
+            if value is not None:
+                _dict[f.name] = _to_plain(value)
 
         if hasattr(self, "extra_data") and self.extra_data is not None:
             _dict["extra_data"] = (
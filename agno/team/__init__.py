@@ -1,21 +1,27 @@
-from agno.run.team import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunResponseCancelledEvent,
-    RunResponseCompletedEvent,
-    RunResponseContentEvent,
-    RunResponseErrorEvent,
-    RunResponseStartedEvent,
-    TeamRunEvent,
-    TeamRunResponse,
-    TeamRunResponseEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
-)
-from agno.team.team import RunResponse, Team
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.run.response import RunResponse
+    from agno.run.team import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunResponseCancelledEvent,
+        RunResponseCompletedEvent,
+        RunResponseContentEvent,
+        RunResponseErrorEvent,
+        RunResponseStartedEvent,
+        TeamRunEvent,
+        TeamRunResponse,
+        TeamRunResponseEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
+    from agno.team.team import Team
 
 __all__ = [
     "Team",
@@ -36,3 +42,28 @@ __all__ = [
     "ToolCallStartedEvent",
     "ToolCallCompletedEvent",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.run.response": ["RunResponse"],
+        "agno.run.team": [
+            "MemoryUpdateCompletedEvent",
+            "MemoryUpdateStartedEvent",
+            "ReasoningCompletedEvent",
+            "ReasoningStartedEvent",
+            "ReasoningStepEvent",
+            "RunResponseCancelledEvent",
+            "RunResponseCompletedEvent",
+            "RunResponseContentEvent",
+            "RunResponseErrorEvent",
+            "RunResponseStartedEvent",
+            "TeamRunEvent",
+            "TeamRunResponse",
+            "TeamRunResponseEvent",
+            "ToolCallCompletedEvent",
+            "ToolCallStartedEvent",
+        ],
+        "agno.team.team": ["Team"],
+    },
+)
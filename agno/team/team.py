@@ -1,15 +1,19 @@
 import asyncio
 import json
 from collections import ChainMap, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from copy import deepcopy
 from dataclasses import asdict, dataclass, replace
 from os import getenv
+from queue import Queue
 from textwrap import dedent
 from typing import (
     Any,
     AsyncIterator,
     Callable,
     Dict,
+    Hashable,
     Iterator,
     List,
     Literal,
@@ -37,6 +41,7 @@ from agno.memory.team import TeamMemory, TeamRun
 from agno.memory.v2.memory import Memory, SessionSummary
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageReferences
+from agno.models.rate_limit import aiterate_with_rate_limit_key, iterate_with_rate_limit_key, rate_limit_context
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
@@ -72,7 +77,7 @@ from agno.utils.log import (
     use_agent_logger,
     use_team_logger,
 )
-from agno.utils.merge_dict import merge_dictionaries
+from agno.utils.merge_dict import apply_dictionary_changes, merge_dictionaries
 from agno.utils.message import get_text_from_message
 from agno.utils.response import (
     check_if_run_cancelled,
@@ -185,6 +190,8 @@ class Team:
     enable_agentic_context: bool = False
     # If True, send all previous member interactions to members
     share_member_interactions: bool = False
+    # Maximum number of members run concurrently in collaborate mode. Defaults to the number of members.
+    max_member_workers: Optional[int] = None
     # If True, add a tool to get information about the team members
     get_member_information_tool: bool = False
     # Add a tool to search the knowledge base (aka Agentic RAG)
@@ -233,6 +240,9 @@ class Team:
     enable_session_summaries: bool = False
     # If True, the agent adds a reference to the session summaries in the response
     add_session_summary_references: Optional[bool] = None
+    # If True, memories and summaries are created by background workers after the run returns.
+    # Set to False to have the run wait for them, so they are visible to the next run
+    background_memory_updates: bool = True
 
     # --- Team History ---
     # If True, enable the team history (Deprecated in favor of add_history_to_messages)
@@ -316,6 +326,7 @@ class Team:
         references_format: Literal["json", "yaml"] = "json",
         enable_agentic_context: bool = False,
         share_member_interactions: bool = False,
+        max_member_workers: Optional[int] = None,
         get_member_information_tool: bool = False,
         search_knowledge: bool = True,
         read_team_history: bool = False,
@@ -333,6 +344,7 @@ class Team:
         add_memory_references: Optional[bool] = None,
         enable_session_summaries: bool = False,
         add_session_summary_references: Optional[bool] = None,
+        background_memory_updates: bool = True,
         enable_team_history: bool = False,
         add_history_to_messages: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
@@ -394,6 +406,7 @@ class Team:
 
         self.enable_agentic_context = enable_agentic_context
         self.share_member_interactions = share_member_interactions
+        self.max_member_workers = max_member_workers
         self.get_member_information_tool = get_member_information_tool
         self.search_knowledge = search_knowledge
         self.read_team_history = read_team_history
@@ -415,6 +428,7 @@ class Team:
         self.add_memory_references = add_memory_references
         self.enable_session_summaries = enable_session_summaries
         self.add_session_summary_references = add_session_summary_references
+        self.background_memory_updates = background_memory_updates
 
         self.enable_team_history = enable_team_history
         self.add_history_to_messages = add_history_to_messages
@@ -924,14 +938,15 @@ class Team:
 
         # 2. Get the model response for the team leader
         self.model = cast(Model, self.model)
-        model_response: ModelResponse = self.model.response(
-            messages=run_messages.messages,
-            response_format=response_format,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-        )
+        with rate_limit_context(run_response.session_id):
+            model_response: ModelResponse = self.model.response(
+                messages=run_messages.messages,
+                response_format=response_format,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+            )
 
         #  Update TeamRunResponse
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -1329,14 +1344,15 @@ class Team:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Get the model response for the team leader
-        model_response = await self.model.aresponse(
-            messages=run_messages.messages,
-            response_format=response_format,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-        )  # type: ignore
+        with rate_limit_context(run_response.session_id):
+            model_response = await self.model.aresponse(
+                messages=run_messages.messages,
+                response_format=response_format,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+            )  # type: ignore
 
         # Update TeamRunResponse
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -1649,14 +1665,15 @@ class Team:
         }
 
         full_model_response = ModelResponse()
-        for model_response_event in self.model.response_stream(
+        model_response_stream = self.model.response_stream(
             messages=run_messages.messages,
             response_format=response_format,
             tools=self._tools_for_model,
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
-        ):
+        )
+        for model_response_event in iterate_with_rate_limit_key(run_response.session_id, model_response_stream):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
                 full_model_response=full_model_response,
@@ -1729,6 +1746,7 @@ class Team:
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
         )  # type: ignore
+        model_stream = aiterate_with_rate_limit_key(run_response.session_id, model_stream)
         async for model_response_event in model_stream:
             for chunk in self._handle_model_response_chunk(
                 run_response=run_response,
@@ -2007,52 +2025,69 @@ class Team:
     def _make_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> Iterator[TeamRunResponseEvent]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
+
+        from agno.utils.background import get_background_executor
 
         self.run_response = cast(TeamRunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
-        # Create a thread pool with a reasonable number of workers
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = []
-            user_message_str = (
-                run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
-            )
-            if self.enable_user_memories and user_message_str is not None and user_message_str:
-                futures.append(
-                    executor.submit(self.memory.create_user_memories, message=user_message_str, user_id=user_id)
-                )
+        # (function, kwargs, coalescing key) of each update
+        jobs: List[Tuple[Callable[..., Any], Dict[str, Any], Optional[Hashable]]] = []
+        user_message_str = (
+            run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+        )
+        if self.enable_user_memories and user_message_str is not None and user_message_str:
+            jobs.append((self.memory.create_user_memories, {"message": user_message_str, "user_id": user_id}, None))
 
-            # Update the session summary if needed
-            if self.enable_session_summaries:
-                futures.append(
-                    executor.submit(self.memory.create_session_summary, session_id=session_id, user_id=user_id)  # type: ignore
+        # Update the session summary if needed
+        if self.enable_session_summaries:
+            jobs.append(
+                (
+                    self.memory.create_session_summary,  # type: ignore
+                    {"session_id": session_id, "user_id": user_id},
+                    ("session_summary", id(self.memory), session_id),
                 )
+            )
 
-            if futures:
-                if self.stream_intermediate_steps:
-                    yield self._handle_event(
-                        create_team_memory_update_started_event(from_run_response=self.run_response), self.run_response
-                    )
+        if jobs:
+            executor = get_background_executor()
+            if self.background_memory_updates:
+                for fn, kwargs, key in jobs:
+                    executor.submit(fn, key=key, **kwargs)
+                log_debug("Memory updates scheduled in the background.")
+                return
 
-                # Wait for all operations to complete and handle any errors
-                for future in as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        log_warning(f"Error in memory/summary operation: {str(e)}")
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_team_memory_update_started_event(from_run_response=self.run_response), self.run_response
+                )
 
-                if self.stream_intermediate_steps:
-                    yield self._handle_event(
-                        create_team_memory_update_completed_event(from_run_response=self.run_response),
-                        self.run_response,
-                    )
+            futures = [executor.submit(fn, key=key, **kwargs) for fn, kwargs, key in jobs]
+            # Wait for all operations to complete and handle any errors
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log_warning(f"Error in memory/summary operation: {str(e)}")
+
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_team_memory_update_completed_event(from_run_response=self.run_response), self.run_response
+                )
 
     async def _amake_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> AsyncIterator[TeamRunResponseEvent]:
         self.memory = cast(Memory, self.memory)
         self.run_response = cast(TeamRunResponse, self.run_response)
+
+        if self.background_memory_updates:
+            # The background workers outlive the event loop, so they run the sync versions
+            for _ in self._make_memories_and_summaries(run_messages, session_id, user_id):
+                pass
+            return
+
         tasks = []
 
         user_message_str = (
@@ -5478,6 +5513,51 @@ class Team:
             else:
                 merge_dictionaries(self.team_session_state, member_agent.team_session_state)
 
+    def _isolate_member_session_state(self, member_agent: Union[Agent, "Team"]) -> Optional[Tuple[Dict, Dict]]:
+        """Give a member that runs concurrently with others its own copy of the team session state.
+
+        Returns the member's session state and a snapshot of it, to pass to _apply_member_session_state.
+        """
+        if member_agent.team_session_state is None:
+            return None
+        state = member_agent.team_session_state
+        snapshot = deepcopy(state)
+        member_agent.team_session_state = deepcopy(snapshot)
+        return state, snapshot
+
+    def _apply_member_session_state(
+        self, member_agent: Union[Agent, "Team"], isolated: Optional[Tuple[Dict, Dict]]
+    ) -> None:
+        """Apply the changes a member made to its own copy of the team session state, including deleted keys"""
+        if isolated is None:
+            self._update_team_session_state(member_agent)
+            return
+        state, snapshot = isolated
+        changed_state = member_agent.team_session_state
+        member_agent.team_session_state = state
+        if changed_state is not None:
+            apply_dictionary_changes(state, snapshot, changed_state)
+        if self.team_session_state is not state:
+            self._update_team_session_state(member_agent)
+
+    def _format_member_response(self, member_agent: Union[Agent, "Team"], run_response: Any) -> Optional[str]:
+        """Format a member's response for the team leader"""
+        try:
+            if run_response.content is None and (run_response.tools is None or len(run_response.tools) == 0):
+                return f"Agent {member_agent.name}: No response from the member agent."
+            elif isinstance(run_response.content, str):
+                if len(run_response.content.strip()) > 0:
+                    return f"Agent {member_agent.name}: {run_response.content}"
+                elif run_response.tools is not None and len(run_response.tools) > 0:
+                    return f"Agent {member_agent.name}: {','.join([tool.result for tool in run_response.tools])}"  # type: ignore
+            elif issubclass(type(run_response.content), BaseModel):
+                return f"Agent {member_agent.name}: {run_response.content.model_dump_json(indent=2)}"  # type: ignore
+            else:
+                return f"Agent {member_agent.name}: {json.dumps(run_response.content, indent=2)}"
+        except Exception as e:
+            return f"Agent {member_agent.name}: Error - {str(e)}"
+        return None
+
     def get_run_member_agents_function(
         self,
         session_id: str,
@@ -5557,11 +5637,16 @@ class Team:
                 task_description, expected_output, team_context_str, team_member_interactions_str
             )
 
-            for member_agent_index, member_agent in enumerate(self.members):
+            # Members run concurrently, so each one works on its own copy of the team session state. Their
+            # changes are applied to the shared state on this thread.
+            isolated_states = []
+            for member_agent in self.members:
                 self._initialize_member(member_agent, session_id=session_id)
+                isolated_states.append(self._isolate_member_session_state(member_agent))
 
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
+            def run_member(member_agent: Union[Agent, "Team"], chunks: Optional[Queue] = None) -> Any:
+                if chunks is None:
+                    return member_agent.run(
                         member_agent_task,
                         user_id=user_id,
                         # All members have the same session_id
@@ -5570,14 +5655,10 @@ class Team:
                         videos=videos,
                         audio=audio,
                         files=files,
-                        stream=True,
-                        stream_intermediate_steps=stream_intermediate_steps,
+                        stream=False,
                     )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        yield member_agent_run_response_chunk
-                else:
-                    member_agent_run_response = member_agent.run(
+                try:
+                    for chunk in member_agent.run(
                         member_agent_task,
                         user_id=user_id,
                         # All members have the same session_id
@@ -5586,59 +5667,83 @@ class Team:
                         videos=videos,
                         audio=audio,
                         files=files,
-                        stream=False,
-                    )
+                        stream=True,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                    ):
+                        chunks.put((member_agent, chunk))
+                finally:
+                    chunks.put((member_agent, None))
 
-                    check_if_run_cancelled(member_agent_run_response)
+            # Members run concurrently on a bounded pool. Each worker gets a copy of the caller's context.
+            # Results are aggregated, and the shared team state updated, on this thread only.
+            try:
+                max_workers = max(1, min(self.max_member_workers or len(self.members), len(self.members)))
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="team-member") as executor:
+                    if stream:
+                        # Chunks from all members are interleaved in the order they arrive
+                        chunks: Queue = Queue()
+                        futures = [
+                            executor.submit(copy_context().run, run_member, member_agent, chunks)
+                            for member_agent in self.members
+                        ]
+                        pending = len(futures)
+                        while pending > 0:
+                            _, member_agent_run_response_chunk = chunks.get()
+                            if member_agent_run_response_chunk is None:
+                                pending -= 1
+                                continue
+                            check_if_run_cancelled(member_agent_run_response_chunk)
+                            yield member_agent_run_response_chunk
+                        for future in futures:
+                            # Surface errors raised by the member runs
+                            future.result()
+                    else:
+                        futures = [
+                            executor.submit(copy_context().run, run_member, member_agent)
+                            for member_agent in self.members
+                        ]
 
-                    try:
-                        if member_agent_run_response.content is None and (
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):
-                            if len(member_agent_run_response.content.strip()) > 0:
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0
-                            ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+                    # Results are reported in member order
+                    for member_agent_index, (member_agent, future) in enumerate(zip(self.members, futures)):
+                        if not stream:
+                            member_agent_run_response = future.result()
+                            check_if_run_cancelled(member_agent_run_response)
+                            member_response_str = self._format_member_response(member_agent, member_agent_run_response)
+                            if member_response_str is not None:
+                                yield member_response_str
+
+                        # Update the memory
+                        member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                        if isinstance(self.memory, TeamMemory):
+                            self.memory = cast(TeamMemory, self.memory)
+                            self.memory.add_interaction_to_team_context(
+                                member_name=member_name,
+                                task=task_description,
+                                run_response=member_agent.run_response,  # type: ignore
+                            )
                         else:
-                            import json
-
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
-
-                # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                if isinstance(self.memory, TeamMemory):
-                    self.memory = cast(TeamMemory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
-                else:
-                    self.memory = cast(Memory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        session_id=session_id,
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
+                            self.memory = cast(Memory, self.memory)
+                            self.memory.add_interaction_to_team_context(
+                                session_id=session_id,
+                                member_name=member_name,
+                                task=task_description,
+                                run_response=member_agent.run_response,  # type: ignore
+                            )
 
-                # Add the member run to the team run response
-                self.run_response = cast(TeamRunResponse, self.run_response)
-                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                        # Add the member run to the team run response
+                        self.run_response = cast(TeamRunResponse, self.run_response)
+                        self.run_response.add_member_run(member_agent.run_response)  # type: ignore
 
-                # Update team session state
-                self._update_team_session_state(member_agent)
+                        # Update team session state
+                        self._apply_member_session_state(member_agent, isolated_states[member_agent_index])
 
-                # Update the team media
-                self._update_team_media(member_agent.run_response)  # type: ignore
+                        # Update the team media
+                        self._update_team_media(member_agent.run_response)  # type: ignore
+            finally:
+                # Members that failed keep the shared state, not their copy
+                for member_agent, isolated in zip(self.members, isolated_states):
+                    if isolated is not None:
+                        member_agent.team_session_state = isolated[0]
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -5711,7 +5816,7 @@ class Team:
                     self.run_response.add_member_run(agent.run_response)
 
                     # Update team session state
-                    self._update_team_session_state(current_agent)
+                    self._update_team_session_state(agent)
 
                     # Update the team media
                     self._update_team_media(agent.run_response)
@@ -6472,6 +6577,9 @@ class Team:
             self.team_session = cast(
                 TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
             )
+            if self.team_session is not None and isinstance(self.memory, Memory):
+                # Archived runs are in storage now
+                self.memory.release_archived_runs(session_id)
         return self.team_session
 
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
@@ -6497,7 +6605,7 @@ class Team:
 
     def load_team_session(self, session: TeamSession):
         """Load the existing TeamSession from an TeamSession (from the database)"""
-        from agno.utils.merge_dict import merge_dictionaries
+        from agno.utils.merge_dict import apply_dictionary_changes, merge_dictionaries
 
         # Get the team_id, user_id and session_id from the database
         if self.team_id is None and session.team_id is not None:
@@ -6631,15 +6739,7 @@ class Team:
             elif isinstance(self.memory, Memory):
                 if "runs" in session.memory:
                     try:
-                        if self.memory.runs is None:
-                            self.memory.runs = {}
-                        self.memory.runs[session.session_id] = []
-                        for run in session.memory["runs"]:
-                            run_session_id = run["session_id"]
-                            if "team_id" in run:
-                                self.memory.runs[run_session_id].append(TeamRunResponse.from_dict(run))
-                            else:
-                                self.memory.runs[run_session_id].append(RunResponse.from_dict(run))
+                        self.memory.load_session_runs(session.session_id, session.memory["runs"])
                     except Exception as e:
                         import traceback
 
@@ -7345,9 +7445,10 @@ class Team:
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 if self.memory.runs is not None:
                     memory_dict = self.memory.to_dict()
-                    run_responses = self.memory.runs.get(session_id)
-                    if run_responses is not None:
-                        memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                    if self.memory.runs.get(session_id) is not None:
+                        memory_dict["runs"] = self._get_stored_runs(session_id) + self.memory.get_session_runs(
+                            session_id
+                        )
         return TeamSession(
             session_id=session_id,
             team_id=self.team_id,
@@ -7360,6 +7461,22 @@ class Team:
             created_at=int(time()),
         )
 
+    def _get_stored_runs(self, session_id: str) -> List[Dict[str, Any]]:
+        """Return the runs of the session that Memory only keeps in storage, as stored"""
+        self.memory = cast(Memory, self.memory)
+        num_stored_runs = self.memory.get_num_stored_runs(session_id)
+        if num_stored_runs == 0:
+            return []
+
+        # The last session read or written holds the stored runs, otherwise read them back
+        session = self.team_session
+        if (session is None or session.session_id != session_id) and self.storage is not None:
+            session = cast(TeamSession, self.storage.read(session_id=session_id))
+        stored_runs = (session.memory or {}).get("runs", []) if session is not None else []
+        if len(stored_runs) < num_stored_runs:
+            log_warning(f"Only {len(stored_runs)} of {num_stored_runs} stored runs found for session {session_id}")
+        return stored_runs[:num_stored_runs]
+
     def _log_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         if not self.telemetry and not self.monitoring:
             return
@@ -1,29 +1,49 @@
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
-
-from docstring_parser import parse
+from inspect import Signature, getdoc, signature, unwrap
+from threading import Lock
+from types import MethodType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
+
+from docstring_parser import Docstring, parse
 from pydantic import BaseModel, Field, validate_call
 from pydantic._internal._validate_call import ValidateCallWrapper
 
 from agno.exceptions import AgentRunException
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.utils.lru_cache import LRUCache
 
 T = TypeVar("T")
 
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
-    from inspect import getdoc
-
     if isinstance(entrypoint, partial):
         return str(entrypoint)
 
-    docstring = getdoc(entrypoint)
-    if not docstring:
-        return ""
+    try:
+        return _get_callable_schema(entrypoint).description
+    except Exception:
+        # The signature or type hints could not be read, the docstring alone is enough here
+        docstring = getdoc(entrypoint)
+        return _describe_docstring(parse(docstring)) if docstring else ""
 
-    parsed_doc = parse(docstring)
 
+def _describe_docstring(parsed_doc: Docstring) -> str:
     # Combine short and long descriptions
     lines = []
     if parsed_doc.short_description:
@@ -34,6 +54,74 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     return "\n".join(lines)
 
 
+class _CallableSchema:
+    """The signature, type hints and docstring of a callable, and the JSON schemas built from them"""
+
+    __slots__ = ("signature", "type_hints", "param_docs", "description", "_json_schemas")
+
+    def __init__(self, c: Callable):
+        self.signature: Signature = signature(c)
+        self.type_hints: Dict[str, Any] = get_type_hints(c)
+        # Parameter name -> (type name, description) from the docstring
+        self.param_docs: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self.description: str = ""
+        docstring = getdoc(c)
+        if docstring:
+            parsed_doc = parse(docstring)
+            for param in parsed_doc.params or []:
+                self.param_docs[param.arg_name] = (param.type_name, param.description)
+            self.description = _describe_docstring(parsed_doc)
+        self._json_schemas: Dict[Hashable, Dict[str, Any]] = {}
+
+    def json_schema(
+        self, param_type_hints: Dict[str, Any], param_descriptions: Dict[str, Any], strict: bool
+    ) -> Dict[str, Any]:
+        """Return a copy of the JSON schema for the parameters, building it only the first time"""
+        from agno.utils.json_schema import get_json_schema
+
+        key = (tuple(param_type_hints), tuple(param_descriptions.items()), strict)
+        json_schema = self._json_schemas.get(key)
+        if json_schema is None:
+            json_schema = get_json_schema(
+                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
+            )
+            self._json_schemas[key] = json_schema
+        return deepcopy(json_schema)
+
+
+# Parsed callables, shared by every agent and run. Functions defined inside methods, like the knowledge search
+# tools, are created again on every run, so they are keyed by their code object and signature, not their identity.
+_callable_schemas: LRUCache[_CallableSchema] = LRUCache(maxsize=4096)
+# Function -> the function wrapped with validate_call. Bound methods share the wrapper of their function.
+_validated_functions: "WeakKeyDictionary[Callable, Callable]" = WeakKeyDictionary()
+_validated_functions_lock = Lock()
+
+
+def _get_callable_schema(c: Callable) -> _CallableSchema:
+    code = getattr(unwrap(c), "__code__", None)
+    if code is None:
+        return _CallableSchema(c)
+
+    sig = signature(c)
+    try:
+        key: Optional[Hashable] = (
+            code,
+            getattr(c, "__doc__", None),
+            tuple((p.name, p.kind, p.annotation, p.default is p.empty) for p in sig.parameters.values()),
+        )
+        hash(key)
+    except TypeError:
+        # Unhashable annotations
+        key = None
+
+    callable_schema = _callable_schemas.get(key) if key is not None else None
+    if callable_schema is None:
+        callable_schema = _CallableSchema(c)
+        if key is not None:
+            _callable_schemas.set(key, callable_schema)
+    return callable_schema
+
+
 @dataclass
 class UserInputField:
     name: str
@@ -131,15 +219,12 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
         try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
+            callable_schema = _get_callable_schema(c)
+            sig = callable_schema.signature
+            type_hints = dict(callable_schema.type_hints)
 
             # If function has an the agent argument, remove the agent parameter from the type hints
             if "agent" in sig.parameters:
@@ -155,25 +240,16 @@ class Function(BaseModel):
                 if name != "return" and name not in ["agent", "team"]
             }
 
-            # Parse docstring for parameters
+            # Parameter descriptions from the docstring
             param_descriptions: Dict[str, Any] = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-                        if param_type is None:
-                            param_descriptions[param_name] = param.description
-                        else:
-                            param_descriptions[param_name] = f"({param_type}) {param.description}"
+            for param_name, (param_type, description) in callable_schema.param_docs.items():
+                if param_type is None:
+                    param_descriptions[param_name] = description
+                else:
+                    param_descriptions[param_name] = f"({param_type}) {description}"
 
             # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
+            parameters = callable_schema.json_schema(param_type_hints, param_descriptions, strict)
 
             # If strict=True mark all fields as required
             # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
@@ -202,10 +278,6 @@ class Function(BaseModel):
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.skip_entrypoint_processing:
             if strict:
                 self.process_schema_for_strict()
@@ -225,8 +297,9 @@ class Function(BaseModel):
             self.user_input_schema = self.user_input_schema or []
 
         try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
+            callable_schema = _get_callable_schema(self.entrypoint)
+            sig = callable_schema.signature
+            type_hints = dict(callable_schema.type_hints)
 
             # If function has an the agent argument, remove the agent parameter from the type hints
             if "agent" in sig.parameters:
@@ -246,22 +319,14 @@ class Function(BaseModel):
             # Get filtered list of parameter types
             param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
 
-            # Parse docstring for parameters
+            # Parameter descriptions from the docstring
             param_descriptions = {}
             param_descriptions_clean = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-                        param_descriptions_clean[param_name] = param.description
+            for param_name, (param_type, description) in callable_schema.param_docs.items():
+                # TODO: We should use type hints first, then map param types in docs to json schema types.
+                # This is temporary to not lose information
+                param_descriptions[param_name] = f"({param_type}) {description}"
+                param_descriptions_clean[param_name] = description
 
             # If the function requires user input, we should set the user_input_schema to all parameters. The arguments provided by the model are filled in later.
             if self.requires_user_input:
@@ -275,9 +340,7 @@ class Function(BaseModel):
                 ]
 
             # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
+            parameters = callable_schema.json_schema(param_type_hints, param_descriptions, strict)
 
             # If strict=True mark all fields as required
             # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
@@ -322,7 +385,7 @@ class Function(BaseModel):
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
-        from inspect import isasyncgenfunction
+        from inspect import isasyncgenfunction, isfunction
 
         # Don't wrap async generator with validate_call
         if isasyncgenfunction(func):
@@ -330,9 +393,24 @@ class Function(BaseModel):
         # Don't wrap ValidateCallWrapper with validate_call
         elif isinstance(func, ValidateCallWrapper):
             return func
-        # Wrap the callable with validate_call
-        else:
+
+        # Functions and methods are wrapped once, and the wrapper is reused by every agent and run
+        function = func.__func__ if isinstance(func, MethodType) else func
+        if not isfunction(function):
             return validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
+        # Already wrapped with validate_call, e.g. when the entrypoint is processed again
+        if hasattr(function, "raw_function"):
+            return func
+
+        with _validated_functions_lock:
+            wrapped = _validated_functions.get(function)
+        if wrapped is None:
+            wrapped = validate_call(function, config=dict(arbitrary_types_allowed=True))  # type: ignore
+            with _validated_functions_lock:
+                _validated_functions[function] = wrapped
+        if isinstance(func, MethodType):
+            return MethodType(wrapped, func.__self__)
+        return wrapped
 
     def process_schema_for_strict(self):
         self.parameters["additionalProperties"] = False
@@ -403,6 +481,40 @@ class Function(BaseModel):
             log_error(f"Error writing cache: {e}")
 
 
+def precompile_schemas(tools: Iterable[Any], strict: bool = False) -> None:
+    """Build the schemas and argument validators of tools ahead of time, e.g. when the module defining an agent is
+    imported, so that creating the agent and its first run do not pay for it.
+
+    Args:
+        tools (Iterable[Any]): Toolkits, Functions or callables.
+        strict (bool): Build the schemas used with strict structured outputs instead.
+    """
+    for tool in tools:
+        functions: List[Function]
+        if isinstance(getattr(tool, "functions", None), dict):
+            functions = list(tool.functions.values())
+        elif isinstance(tool, Function):
+            functions = [tool]
+        elif callable(tool):
+            functions = [Function(name=getattr(tool, "__name__", "tool"), entrypoint=tool)]
+        else:
+            continue
+
+        for function in functions:
+            if function.entrypoint is None or function.skip_entrypoint_processing:
+                continue
+            try:
+                # Process a throwaway Function, which fills the caches without changing the tool
+                Function(
+                    name=function.name,
+                    entrypoint=function.entrypoint,
+                    requires_user_input=function.requires_user_input,
+                    user_input_fields=function.user_input_fields,
+                ).process_entrypoint(strict=strict)
+            except Exception as e:
+                log_debug(f"Could not precompile schema for {function.name}: {e}")
+
+
 class FunctionExecutionResult(BaseModel):
     status: Literal["success", "failure"]
     result: Optional[Any] = None
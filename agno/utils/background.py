@@ -0,0 +1,144 @@
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import Future
+from contextvars import copy_context
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+from agno.utils.log import log_debug, log_warning
+
+
+class _Job:
+    __slots__ = ("fn", "args", "kwargs", "key", "future")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any], key: Optional[Hashable]):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.future: Future = Future()
+
+
+class BackgroundExecutor:
+    """A persistent pool of daemon worker threads for work that should not hold up a response.
+
+    Jobs submitted with a key are coalesced: while a job with the same key is still waiting to start, a new
+    submission replaces its arguments instead of queueing another job, so a burst of runs on one session creates
+    a single summary. When `max_pending` jobs are already waiting, the caller runs the job itself, which slows
+    producers down to the rate the workers can keep up with.
+
+    Args:
+        max_workers (int): Number of worker threads, started on first use.
+        max_pending (int): Number of jobs allowed to wait for a worker.
+        name (str): Prefix of the worker thread names.
+    """
+
+    def __init__(self, max_workers: int = 3, max_pending: int = 64, name: str = "agno-background"):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.name = name
+
+        self._queue: Deque[_Job] = deque()
+        # key -> job waiting in the queue
+        self._pending_keys: Dict[Hashable, _Job] = {}
+        self._unfinished = 0
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+
+    def submit(self, fn: Callable[..., Any], *args: Any, key: Optional[Hashable] = None, **kwargs: Any) -> Future:
+        """Schedule fn(*args, **kwargs) and return a Future for its result.
+
+        Args:
+            fn (Callable[..., Any]): The function to run.
+            key (Optional[Hashable]): Jobs with the same key that have not started yet are merged into one,
+                which runs with the latest arguments.
+        """
+        # Run the job in the caller's context so context variables such as the active logger carry over
+        context = copy_context()
+        with self._cond:
+            if key is not None:
+                pending = self._pending_keys.get(key)
+                if pending is not None:
+                    pending.fn, pending.args, pending.kwargs = context.run, (fn, *args), kwargs
+                    log_debug(f"Coalesced background job {key}")
+                    return pending.future
+
+            job = _Job(context.run, (fn, *args), kwargs, key)
+            if len(self._queue) >= self.max_pending:
+                inline = True
+            else:
+                inline = False
+                self._queue.append(job)
+                if key is not None:
+                    self._pending_keys[key] = job
+                self._unfinished += 1
+                self._start_workers()
+                self._cond.notify()
+
+        if inline:
+            log_debug("Background queue is full, running job in the caller")
+            self._run(job)
+        return job.future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job has finished. Returns False if the timeout expired first."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._unfinished == 0, timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return len(self._queue)
+
+    def _start_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < min(self.max_workers, self._unfinished):
+            worker = threading.Thread(target=self._work, name=f"{self.name}-{len(self._workers)}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._queue) > 0)
+                job = self._queue.popleft()
+                if job.key is not None and self._pending_keys.get(job.key) is job:
+                    del self._pending_keys[job.key]
+            try:
+                self._run(job)
+            finally:
+                with self._cond:
+                    self._unfinished -= 1
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _run(job: _Job) -> None:
+        if not job.future.set_running_or_notify_cancel():
+            return
+        try:
+            job.future.set_result(job.fn(*job.args, **job.kwargs))
+        except BaseException as e:
+            log_warning(f"Error in background job: {e}")
+            job.future.set_exception(e)
+
+
+_executor: Optional[BackgroundExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_background_executor() -> BackgroundExecutor:
+    """Return the process-wide background executor"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BackgroundExecutor()
+    return _executor
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    # Give pending memories and summaries a chance to be written before the interpreter exits
+    if _executor is not None and not _executor.flush(timeout=30):
+        log_warning("Exiting with background jobs still running")
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from agno.media import Image
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 try:
     from google.genai.types import (
@@ -22,11 +23,9 @@ def format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
         content_bytes = image.image_url_content
         if content_bytes is not None:
             try:
-                import base64
-
                 image_data = {
                     "mime_type": "image/jpeg",
-                    "data": base64.b64encode(content_bytes).decode("utf-8"),
+                    "data": get_media_cache().encode(content_bytes),
                 }
                 return image_data
             except Exception as e:
@@ -41,8 +40,7 @@ def format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
         try:
             image_path = Path(image.filepath)
             if image_path.exists() and image_path.is_file():
-                with open(image_path, "rb") as f:
-                    content_bytes = f.read()
+                content_bytes = get_media_cache().read_file(image_path)
             else:
                 log_error(f"Image file {image_path} does not exist.")
                 raise
@@ -57,9 +55,7 @@ def format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
     # Case 3: Image is a bytes object
     # Add it as base64 encoded data
     elif image.content is not None and isinstance(image.content, bytes):
-        import base64
-
-        image_data = {"mime_type": "image/jpeg", "data": base64.b64encode(image.content).decode("utf-8")}
+        image_data = {"mime_type": "image/jpeg", "data": get_media_cache().encode(image.content)}
         return image_data
     else:
         log_warning(f"Unknown image type: {type(image)}")
@@ -0,0 +1,36 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, Sequence[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the PEP 562 `__getattr__` and `__dir__` of a package whose exports are imported on first access.
+
+    Importing a package runs its `__init__`, so a package that re-exports its classes eagerly makes every import
+    of one of its submodules load all of them. With lazy exports, `import agno.utils.log` does not import the
+    Agent, and `from agno.agent import Agent` does not import the team or workflow modules.
+
+    Usage, in the package `__init__.py`:
+        __getattr__, __dir__ = lazy_exports(__name__, {"agno.agent.agent": ["Agent"]})
+
+    Args:
+        package (str): Name of the package, i.e. `__name__` of its `__init__`.
+        exports (Dict[str, Sequence[str]]): Module -> names the package re-exports from it.
+    """
+    modules: Dict[str, str] = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        # Cache on the package, so later lookups do not go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(modules))
+
+    return __getattr__, __dir__
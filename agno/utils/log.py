@@ -2,9 +2,6 @@ import logging
 from os import getenv
 from typing import Any, Optional
 
-from rich.logging import RichHandler
-from rich.text import Text
-
 LOGGER_NAME = "agno"
 TEAM_LOGGER_NAME = f"{LOGGER_NAME}-team"
 
@@ -21,22 +18,44 @@ LOG_STYLES = {
 }
 
 
-class ColoredRichHandler(RichHandler):
-    def __init__(self, *args, source_type: Optional[str] = None, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.source_type = source_type
+def build_rich_handler(source_type: Optional[str] = None) -> logging.Handler:
+    from agno.utils.rich_handler import ColoredRichHandler
+
+    # https://rich.readthedocs.io/en/latest/reference/logging.html#rich.logging.RichHandler
+    # https://rich.readthedocs.io/en/latest/logging.html#handle-exceptions
+    rich_handler = ColoredRichHandler(
+        show_time=False,
+        rich_tracebacks=False,
+        show_path=True if getenv("AGNO_API_RUNTIME") == "dev" else False,
+        tracebacks_show_locals=False,
+        source_type=source_type or "agent",
+    )
+    rich_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(message)s",
+            datefmt="[%X]",
+        )
+    )
+    return rich_handler
 
-    def get_level_text(self, record: logging.LogRecord) -> Text:
-        # Return empty Text if message is empty
-        if not record.msg:
-            return Text("")
 
-        level_name = record.levelname.lower()
-        if self.source_type and self.source_type in LOG_STYLES:
-            if level_name in LOG_STYLES[self.source_type]:
-                color = LOG_STYLES[self.source_type][level_name]
-                return Text(record.levelname, style=color)
-        return super().get_level_text(record)
+class DeferredRichHandler(logging.Handler):
+    """Builds the rich handler when the first record is emitted.
+
+    Importing rich is a large share of the time it takes to import agno, and a logger that is never used at the
+    enabled level never needs it.
+    """
+
+    def __init__(self, source_type: Optional[str] = None):
+        super().__init__()
+        self.source_type = source_type
+        self.handler: Optional[logging.Handler] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called with self.lock held, so the handler is only built once
+        if self.handler is None:
+            self.handler = build_rich_handler(self.source_type)
+        self.handler.handle(record)
 
 
 class AgnoLogger(logging.Logger):
@@ -44,11 +63,16 @@ class AgnoLogger(logging.Logger):
         super().__init__(name, level)
 
     def debug(self, msg: str, center: bool = False, symbol: str = "*", *args, **kwargs):
+        # Skip centering the header when the record would be discarded
+        if not self.isEnabledFor(logging.DEBUG):
+            return
         if center:
             msg = center_header(str(msg), symbol)
         super().debug(msg, *args, **kwargs)
 
     def info(self, msg: str, center: bool = False, symbol: str = "*", *args, **kwargs):
+        if not self.isEnabledFor(logging.INFO):
+            return
         if center:
             msg = center_header(str(msg), symbol)
         super().info(msg, *args, **kwargs)
@@ -64,23 +88,7 @@ def build_logger(logger_name: str, source_type: Optional[str] = None) -> Any:
     # Reset logger class to default to avoid affecting other loggers
     logging.setLoggerClass(logging.Logger)
 
-    # https://rich.readthedocs.io/en/latest/reference/logging.html#rich.logging.RichHandler
-    # https://rich.readthedocs.io/en/latest/logging.html#handle-exceptions
-    rich_handler = ColoredRichHandler(
-        show_time=False,
-        rich_tracebacks=False,
-        show_path=True if getenv("AGNO_API_RUNTIME") == "dev" else False,
-        tracebacks_show_locals=False,
-        source_type=source_type or "agent",
-    )
-    rich_handler.setFormatter(
-        logging.Formatter(
-            fmt="%(message)s",
-            datefmt="[%X]",
-        )
-    )
-
-    _logger.addHandler(rich_handler)
+    _logger.addHandler(DeferredRichHandler(source_type=source_type or "agent"))
     _logger.setLevel(logging.INFO)
     _logger.propagate = False
     return _logger
@@ -135,28 +143,61 @@ def use_agent_logger():
     logger = agent_logger
 
 
+def is_log_level_enabled(level: int = logging.DEBUG) -> bool:
+    """Whether the current logger emits records at this level.
+
+    Callers that build expensive log messages check this first, so nothing is formatted when the level is off.
+    """
+    global logger
+    global debug_on
+    if level <= logging.DEBUG and not debug_on:
+        return False
+    return logger.isEnabledFor(level)
+
+
 def log_debug(msg, center: bool = False, symbol: str = "*", *args, **kwargs):
     global logger
     global debug_on
-    if debug_on:
+    if debug_on and logger.isEnabledFor(logging.DEBUG):
+        # A callable message is only evaluated when the record is emitted
+        if callable(msg):
+            msg = msg()
         logger.debug(msg, center, symbol, *args, **kwargs)
 
 
 def log_info(msg, center: bool = False, symbol: str = "*", *args, **kwargs):
     global logger
-    logger.info(msg, center, symbol, *args, **kwargs)
+    if logger.isEnabledFor(logging.INFO):
+        if callable(msg):
+            msg = msg()
+        logger.info(msg, center, symbol, *args, **kwargs)
 
 
 def log_warning(msg, *args, **kwargs):
     global logger
-    logger.warning(msg, *args, **kwargs)
+    if logger.isEnabledFor(logging.WARNING):
+        if callable(msg):
+            msg = msg()
+        logger.warning(msg, *args, **kwargs)
 
 
 def log_error(msg, *args, **kwargs):
     global logger
-    logger.error(msg, *args, **kwargs)
+    if logger.isEnabledFor(logging.ERROR):
+        if callable(msg):
+            msg = msg()
+        logger.error(msg, *args, **kwargs)
 
 
 def log_exception(msg, *args, **kwargs):
     global logger
     logger.exception(msg, *args, **kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    # ColoredRichHandler lives in agno.utils.rich_handler, so importing this module does not import rich
+    if name == "ColoredRichHandler":
+        from agno.utils.rich_handler import ColoredRichHandler
+
+        return ColoredRichHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
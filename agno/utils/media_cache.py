@@ -0,0 +1,349 @@
+import asyncio
+import base64
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_warning
+from agno.utils.lru_cache import LRUCache
+
+
+class _CachedMedia:
+    """Media bytes together with the encodings built from them"""
+
+    __slots__ = ("digest", "content", "mime_type", "encoded", "data_urls")
+
+    def __init__(self, digest: str, content: bytes, mime_type: Optional[str] = None):
+        self.digest = digest
+        self.content = content
+        self.mime_type = mime_type
+        self.encoded: Optional[str] = None
+        # mime type -> data url
+        self.data_urls: Dict[str, str] = {}
+
+    @property
+    def size(self) -> int:
+        size = len(self.content) + len(self.encoded or "")
+        return size + sum(len(data_url) for data_url in self.data_urls.values())
+
+
+class MediaCache:
+    """Content-addressed cache of media bytes and their base64 encodings.
+
+    Images, audio and files sent to a model stay in the conversation history, so without a cache they are
+    downloaded, read and base64-encoded again on every turn. Media are stored once per sha256 digest, next to
+    their base64 and data url forms, and urls and file paths map to the digest of their content. Downloads reuse
+    one pooled http client and can be persisted to a directory, so they survive restarts.
+
+    The cache is process-wide, so every worker process holds its own copy. An entry takes up to about three times
+    the size of the media with its encodings, which is why the memory budget is small by default. Downloads are
+    requested again once they are older than `url_ttl`, so a url whose content changes is not served stale forever.
+
+    Args:
+        max_memory_bytes (int): Bytes of media and encodings kept in memory. 0 disables the in-memory cache.
+        max_item_bytes (int): Media larger than this are returned but never cached.
+        cache_dir (Optional[Union[str, Path]]): Directory downloads are persisted to. None keeps them in memory only.
+        max_disk_bytes (int): Bytes of downloads kept in `cache_dir`.
+        timeout (float): Download timeout in seconds.
+        url_ttl (Optional[float]): Seconds a download is reused for. None reuses downloads until they are evicted.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 32 * 1024 * 1024,
+        max_item_bytes: int = 8 * 1024 * 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+        timeout: float = 30.0,
+        url_ttl: Optional[float] = 3600.0,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_item_bytes = max_item_bytes
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.timeout = timeout
+        self.url_ttl = url_ttl
+
+        # digest -> media
+        self._entries: "OrderedDict[str, _CachedMedia]" = OrderedDict()
+        self._memory_bytes = 0
+        # id of a bytes object -> digest, so content passed around by reference is not hashed again
+        self._ids: Dict[int, str] = {}
+        # url -> (digest, time.monotonic() of the download)
+        self._urls: LRUCache[Tuple[str, float]] = LRUCache(maxsize=4096)
+        # (path, mtime, size) -> digest
+        self._paths: LRUCache[str] = LRUCache(maxsize=4096)
+        self._disk_bytes: Optional[int] = None
+        self._client: Optional[Any] = None
+        self._lock = threading.RLock()
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from httpx import Client as HttpxClient
+
+            self._client = HttpxClient(timeout=self.timeout, follow_redirects=True)
+        return self._client
+
+    def _entry(self, content: bytes, mime_type: Optional[str] = None) -> Optional[_CachedMedia]:
+        """Return the cached media for the content, adding it if it fits"""
+        if len(content) > self.max_item_bytes or len(content) > self.max_memory_bytes:
+            return None
+        with self._lock:
+            digest = self._ids.get(id(content))
+            entry = self._entries.get(digest) if digest is not None else None
+            if entry is None or entry.content is not content:
+                digest = hashlib.sha256(content).hexdigest()
+                entry = self._entries.get(digest)
+                if entry is None:
+                    entry = _CachedMedia(digest, content, mime_type)
+                    self._entries[digest] = entry
+                    self._memory_bytes += entry.size
+                    self._ids[id(entry.content)] = digest
+            if mime_type and not entry.mime_type:
+                entry.mime_type = mime_type
+            self._entries.move_to_end(digest)
+            self._evict()
+            return entry
+
+    def _lookup(self, digest: Optional[str]) -> Optional[_CachedMedia]:
+        if digest is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+            return entry
+
+    def _grow(self, entry: _CachedMedia, size_before: int) -> None:
+        with self._lock:
+            self._memory_bytes += entry.size - size_before
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._memory_bytes > self.max_memory_bytes and len(self._entries) > 0:
+            digest, entry = self._entries.popitem(last=False)
+            self._memory_bytes -= entry.size
+            if self._ids.get(id(entry.content)) == digest:
+                del self._ids[id(entry.content)]
+
+    def encode(self, content: bytes) -> str:
+        """Return the content as a base64 string, encoding it only the first time"""
+        entry = self._entry(content)
+        if entry is None:
+            return base64.b64encode(content).decode("utf-8")
+        if entry.encoded is None:
+            size_before = entry.size
+            entry.encoded = base64.b64encode(entry.content).decode("utf-8")
+            self._grow(entry, size_before)
+        return entry.encoded
+
+    def data_url(self, content: bytes, mime_type: str) -> str:
+        """Return the content as a `data:` url"""
+        entry = self._entry(content, mime_type)
+        if entry is None:
+            return f"data:{mime_type};base64,{base64.b64encode(content).decode('utf-8')}"
+        data_url = entry.data_urls.get(mime_type)
+        if data_url is None:
+            encoded = self.encode(entry.content)
+            size_before = entry.size
+            data_url = entry.data_urls[mime_type] = f"data:{mime_type};base64,{encoded}"
+            self._grow(entry, size_before)
+        return data_url
+
+    def read_file(self, path: Union[str, Path]) -> bytes:
+        """Read a local file, returning the cached bytes while the file is unchanged"""
+        path = Path(path)
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        entry = self._lookup(self._paths.get(key))
+        if entry is not None:
+            return entry.content
+
+        content = path.read_bytes()
+        entry = self._entry(content)
+        if entry is not None:
+            self._paths.set(key, entry.digest)
+            return entry.content
+        return content
+
+    def fetch(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """Download a url, returning its content and mime type. Cached downloads are not requested again."""
+        cached = self._cached_url(url)
+        if cached is not None:
+            return cached
+
+        response = self.client.get(url)
+        return self._store_url(url, response)
+
+    async def afetch(self, url: str, client: Optional[Any] = None) -> Tuple[bytes, Optional[str]]:
+        """Download a url asynchronously, returning its content and mime type"""
+        cached = self._cached_url(url)
+        if cached is not None:
+            return cached
+
+        if client is not None:
+            response = await client.get(url)
+        else:
+            from httpx import AsyncClient
+
+            async with AsyncClient(timeout=self.timeout, follow_redirects=True) as async_client:
+                response = await async_client.get(url)
+        return self._store_url(url, response)
+
+    async def aprefetch(self, urls: Iterable[str]) -> None:
+        """Download urls concurrently, so formatting the request reads them from the cache"""
+        from httpx import AsyncClient
+
+        missing = list(dict.fromkeys(url for url in urls if self._cached_url(url) is None))
+        if not missing:
+            return
+
+        log_debug(f"Prefetching {len(missing)} media urls")
+        async with AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+            results = await asyncio.gather(
+                *[self.afetch(url, client=client) for url in missing], return_exceptions=True
+            )
+        for url, result in zip(missing, results):
+            if isinstance(result, BaseException):
+                log_warning(f"Could not prefetch {url}: {result}")
+
+    def _expired(self, age: float) -> bool:
+        return self.url_ttl is not None and age > self.url_ttl
+
+    def _cached_url(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        cached = self._urls.get(url)
+        if cached is not None:
+            digest, fetched_at = cached
+            if self._expired(time.monotonic() - fetched_at):
+                self._urls.pop(url)
+                return None
+            entry = self._lookup(digest)
+            if entry is not None:
+                return entry.content, entry.mime_type
+
+        stored = self._read_disk(url)
+        if stored is not None:
+            content, mime_type, age = stored
+            entry = self._entry(content, mime_type)
+            if entry is not None:
+                self._urls.set(url, (entry.digest, time.monotonic() - age))
+            return content, mime_type
+        return None
+
+    def _store_url(self, url: str, response: Any) -> Tuple[bytes, Optional[str]]:
+        content: bytes = response.content
+        mime_type = response.headers.get("Content-Type", "").split(";")[0] or None
+        # Error pages are returned like before, but not cached
+        if response.is_success:
+            entry = self._entry(content, mime_type)
+            if entry is not None:
+                self._urls.set(url, (entry.digest, time.monotonic()))
+                content = entry.content
+            self._write_disk(url, content, mime_type)
+        return content, mime_type
+
+    def _disk_path(self, url: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _read_disk(self, url: str) -> Optional[Tuple[bytes, Optional[str], float]]:
+        """Return the persisted download of the url with its mime type and age in seconds, unless it expired"""
+        path = self._disk_path(url)
+        if path is None or not path.exists():
+            return None
+        try:
+            mime_path = path.with_suffix(".mime")
+            if not mime_path.exists():
+                return None
+            # The mime type file is written with the download and never touched, so it dates the download
+            age = max(time.time() - mime_path.stat().st_mtime, 0.0)
+            if self._expired(age):
+                return None
+            content = path.read_bytes()
+            mime_type = mime_path.read_text(encoding="utf-8") or None
+            # Mark as recently used, so eviction removes the least recently used downloads first
+            path.touch()
+            return content, mime_type, age
+        except OSError as e:
+            log_debug(f"Could not read cached media for {url}: {e}")
+            return None
+
+    def _write_disk(self, url: str, content: bytes, mime_type: Optional[str]) -> None:
+        path = self._disk_path(url)
+        if path is None or len(content) > self.max_item_bytes:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(path)
+            path.with_suffix(".mime").write_text(mime_type or "", encoding="utf-8")
+        except OSError as e:
+            log_debug(f"Could not cache media for {url}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(f.stat().st_size for f in path.parent.iterdir() if not f.suffix)
+            else:
+                self._disk_bytes += len(content)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        if self.cache_dir is None:
+            return
+        files = sorted((f for f in self.cache_dir.iterdir() if not f.suffix), key=lambda f: f.stat().st_mtime)
+        total = sum(f.stat().st_size for f in files)
+        for f in files:
+            if total <= self.max_disk_bytes * 0.9:
+                break
+            total -= f.stat().st_size
+            f.unlink(missing_ok=True)
+            f.with_suffix(".mime").unlink(missing_ok=True)
+        self._disk_bytes = total
+        log_debug(f"Evicted cached media down to {total} bytes")
+
+    def clear(self) -> None:
+        """Forget every cached media in memory. Downloads persisted to disk are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._ids.clear()
+            self._urls.clear()
+            self._paths.clear()
+            self._memory_bytes = 0
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+_media_cache: Optional[MediaCache] = None
+_media_cache_lock = threading.Lock()
+
+
+def get_media_cache() -> MediaCache:
+    """Return the process-wide media cache"""
+    global _media_cache
+
+    if _media_cache is None:
+        with _media_cache_lock:
+            if _media_cache is None:
+                _media_cache = MediaCache()
+    return _media_cache
+
+
+def set_media_cache(media_cache: MediaCache) -> None:
+    """Replace the process-wide media cache, e.g. to persist downloads to a directory or change the size limits"""
+    global _media_cache
+
+    with _media_cache_lock:
+        previous, _media_cache = _media_cache, media_cache
+    if previous is not None:
+        previous.close()
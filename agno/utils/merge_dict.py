@@ -18,3 +18,30 @@ def merge_dictionaries(a: Dict[str, Any], b: Dict[str, Any]) -> None:
             merge_dictionaries(a[key], b[key])
         else:
             a[key] = b[key]
+
+
+def apply_dictionary_changes(target: Dict[str, Any], before: Dict[str, Any], after: Dict[str, Any]) -> None:
+    """
+    Applies to 'target' the changes that turned 'before' into 'after', including deleted keys.
+    Nested dictionaries are compared key by key, so changes to different keys of a nested dictionary are kept.
+
+    Args:
+        target (Dict[str, Any]): The dictionary to update.
+        before (Dict[str, Any]): The dictionary before the changes.
+        after (Dict[str, Any]): The dictionary after the changes.
+
+    Returns:
+        None: The function modifies the target dictionary in place.
+    """
+    for key in before:
+        if key not in after:
+            target.pop(key, None)
+    for key, value in after.items():
+        if key in before:
+            old_value = before[key]
+            if isinstance(old_value, dict) and isinstance(value, dict) and isinstance(target.get(key), dict):
+                apply_dictionary_changes(target[key], old_value, value)
+                continue
+            if old_value is value or old_value == value:
+                continue
+        target[key] = value
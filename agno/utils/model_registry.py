@@ -0,0 +1,46 @@
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from agno.utils.log import log_debug
+
+# Process-wide registry of loaded local models (embedders, rerankers, ...)
+_models: Dict[Tuple[Hashable, ...], Any] = {}
+# Guards the registry dict
+_registry_lock = Lock()
+# One lock per key, so loading one model does not block loading another
+_key_locks: Dict[Tuple[Hashable, ...], Lock] = {}
+
+
+def get_or_load_model(key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+    """Return the model registered under `key`, loading it with `loader` on first use.
+
+    Concurrent callers asking for the same key wait for a single load instead of loading the weights twice.
+    """
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        key_lock = _key_locks.setdefault(key, Lock())
+
+    with key_lock:
+        model = _models.get(key)
+        if model is None:
+            log_debug(f"Loading local model: {key}")
+            model = loader()
+            _models[key] = model
+    return model
+
+
+def remove_model(key: Tuple[Hashable, ...]) -> None:
+    """Drop a model from the registry, e.g. to free memory"""
+    with _registry_lock:
+        _models.pop(key, None)
+        _key_locks.pop(key, None)
+
+
+def clear_models() -> None:
+    """Drop every model from the registry"""
+    with _registry_lock:
+        _models.clear()
+        _key_locks.clear()
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from agno.media import Image
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 try:
     from anthropic.types import (
@@ -28,8 +29,6 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
     """
     using_filetype = False
 
-    import base64
-
     # 'imghdr' was deprecated in Python 3.11: https://docs.python.org/3/library/imghdr.html
     # 'filetype' used as a fallback
     try:
@@ -61,8 +60,7 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
 
             path = Path(image.filepath) if isinstance(image.filepath, str) else image.filepath
             if path.exists() and path.is_file():
-                with open(image.filepath, "rb") as f:
-                    content_bytes = f.read()
+                content_bytes = get_media_cache().read_file(path)
             else:
                 log_error(f"Image file not found: {image}")
                 return None
@@ -99,7 +97,7 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
             "source": {
                 "type": "base64",
                 "media_type": media_type,
-                "data": base64.b64encode(content_bytes).decode("utf-8"),  # type: ignore
+                "data": get_media_cache().encode(content_bytes),  # type: ignore
             },
         }
 
@@ -108,10 +106,67 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _format_message(message: Message) -> Dict[str, Any]:
+    """
+    Format a user, assistant or tool message into the format expected by AWS Bedrock Claude.
+
+    Args:
+        message (Message): The message to format.
+
+    Returns:
+        Dict[str, Any]: The formatted message.
+    """
+    content = message.content or ""
+    if message.role == "user":
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        else:
+            # Copy the content, so the images are not added to the message itself
+            content = list(content)
+
+        if message.images is not None:
+            for image in message.images:
+                image_content = _format_image_for_message(image)
+                if image_content:
+                    content.append(image_content)
+
+        if message.files is not None and len(message.files) > 0:
+            log_warning("Files are not supported for AWS Bedrock Claude")
+
+        if message.audio is not None and len(message.audio) > 0:
+            log_warning("Audio is not supported for AWS Bedrock Claude")
+
+        if message.videos is not None and len(message.videos) > 0:
+            log_warning("Video is not supported for AWS Bedrock Claude")
+
+    # Handle tool calls from history
+    elif message.role == "assistant":
+        content = []
+
+        if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
+            content.append(TextBlock(text=message.content, type="text"))
+
+        if message.tool_calls:
+            for tool_call in message.tool_calls:
+                content.append(
+                    ToolUseBlock(
+                        id=tool_call["id"],
+                        input=json.loads(tool_call["function"]["arguments"])
+                        if "arguments" in tool_call["function"]
+                        else {},
+                        name=tool_call["function"]["name"],
+                        type="tool_use",
+                    )
+                )
+    return {"role": ROLE_MAP[message.role], "content": content}
+
+
 def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]:
     """
     Process the list of messages and separate them into API messages and system messages.
 
+    Messages are formatted once and reused by later requests while they are unchanged.
+
     Args:
         messages (List[Message]): The list of messages to process.
 
@@ -123,48 +178,9 @@ def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]
     system_messages: List[str] = []
 
     for message in messages:
-        content = message.content or ""
         if message.role == "system":
-            if content is not None:
-                system_messages.append(content)  # type: ignore
+            system_messages.append(message.content or "")  # type: ignore
             continue
-        elif message.role == "user":
-            if isinstance(content, str):
-                content = [{"type": "text", "text": content}]
-
-            if message.images is not None:
-                for image in message.images:
-                    image_content = _format_image_for_message(image)
-                    if image_content:
-                        content.append(image_content)
-
-            if message.files is not None and len(message.files) > 0:
-                log_warning("Files are not supported for AWS Bedrock Claude")
-
-            if message.audio is not None and len(message.audio) > 0:
-                log_warning("Audio is not supported for AWS Bedrock Claude")
-
-            if message.videos is not None and len(message.videos) > 0:
-                log_warning("Video is not supported for AWS Bedrock Claude")
-
-        # Handle tool calls from history
-        elif message.role == "assistant":
-            content = []
-
-            if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
-                content.append(TextBlock(text=message.content, type="text"))
-
-            if message.tool_calls:
-                for tool_call in message.tool_calls:
-                    content.append(
-                        ToolUseBlock(
-                            id=tool_call["id"],
-                            input=json.loads(tool_call["function"]["arguments"])
-                            if "arguments" in tool_call["function"]
-                            else {},
-                            name=tool_call["function"]["name"],
-                            type="tool_use",
-                        )
-                    )
-        chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
+
+        chat_messages.append(message.get_formatted("aws_claude", _format_message))  # type: ignore
     return chat_messages, " ".join(system_messages)
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from agno.media import File, Image
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 try:
     from anthropic.types import (
@@ -44,8 +45,6 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
     """
     using_filetype = False
 
-    import base64
-
     # 'imghdr' was deprecated in Python 3.11: https://docs.python.org/3/library/imghdr.html
     # 'filetype' used as a fallback
     try:
@@ -81,8 +80,7 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
 
             path = Path(image.filepath) if isinstance(image.filepath, str) else image.filepath
             if path.exists() and path.is_file():
-                with open(image.filepath, "rb") as f:
-                    content_bytes = f.read()
+                content_bytes = get_media_cache().read_file(path)
             else:
                 log_error(f"Image file not found: {image}")
                 return None
@@ -119,7 +117,7 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
             "source": {
                 "type": "base64",
                 "media_type": media_type,
-                "data": base64.b64encode(content_bytes).decode("utf-8"),  # type: ignore
+                "data": get_media_cache().encode(content_bytes),  # type: ignore
             },
         }
 
@@ -160,12 +158,12 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
         }
     # Case 2: Document is a local file path
     elif file.filepath is not None:
-        import base64
         from pathlib import Path
 
         path = Path(file.filepath) if isinstance(file.filepath, str) else file.filepath
         if path.exists() and path.is_file():
-            file_data = base64.standard_b64encode(path.read_bytes()).decode("utf-8")
+            media_cache = get_media_cache()
+            file_data = media_cache.encode(media_cache.read_file(path))
 
             # Determine media type
             media_type = file.mime_type
@@ -191,9 +189,7 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
             return None
     # Case 3: Document is bytes content
     elif file.content is not None:
-        import base64
-
-        file_data = base64.standard_b64encode(file.content).decode("utf-8")
+        file_data = get_media_cache().encode(file.content)
         return {
             "type": "document",
             "source": {"type": "base64", "media_type": file.mime_type or "application/pdf", "data": file_data},
@@ -202,84 +198,104 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
     return None
 
 
-def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]:
+def _format_message(message: Message) -> Optional[Dict[str, Any]]:
     """
-    Process the list of messages and separate them into API messages and system messages.
+    Format a user, assistant or tool message into the format expected by Anthropic.
 
     Args:
-        messages (List[Message]): The list of messages to process.
+        message (Message): The message to format.
 
     Returns:
-        Tuple[List[Dict[str, str]], str]: A tuple containing the list of API messages and the concatenated system messages.
+        Optional[Dict[str, Any]]: The formatted message, or None for an empty assistant response.
     """
-    chat_messages: List[Dict[str, str]] = []
-    system_messages: List[str] = []
+    content = message.content or ""
+    if message.role == "user":
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        else:
+            # Copy the content, so the media parts are not added to the message itself
+            content = list(content)
+
+        if message.images is not None:
+            for image in message.images:
+                image_content = _format_image_for_message(image)
+                if image_content:
+                    content.append(image_content)
+
+        if message.files is not None:
+            for file in message.files:
+                file_content = _format_file_for_message(file)
+                if file_content:
+                    content.append(file_content)
+
+        if message.audio is not None and len(message.audio) > 0:
+            log_warning("Audio input is currently unsupported.")
+
+        if message.videos is not None and len(message.videos) > 0:
+            log_warning("Video input is currently unsupported.")
+
+    elif message.role == "assistant":
+        content = []
+
+        if message.thinking is not None and message.provider_data is not None:
+            from anthropic.types import RedactedThinkingBlock, ThinkingBlock
+
+            content.append(
+                ThinkingBlock(
+                    thinking=message.thinking,
+                    signature=message.provider_data.get("signature"),
+                    type="thinking",
+                )
+            )
 
-    for message in messages:
-        content = message.content or ""
-        if message.role == "system":
-            if content is not None:
-                system_messages.append(content)  # type: ignore
-            continue
-        elif message.role == "user":
-            if isinstance(content, str):
-                content = [{"type": "text", "text": content}]
+        if message.redacted_thinking is not None:
+            from anthropic.types import RedactedThinkingBlock
 
-            if message.images is not None:
-                for image in message.images:
-                    image_content = _format_image_for_message(image)
-                    if image_content:
-                        content.append(image_content)
+            content.append(RedactedThinkingBlock(data=message.redacted_thinking, type="redacted_thinking"))
 
-            if message.files is not None:
-                for file in message.files:
-                    file_content = _format_file_for_message(file)
-                    if file_content:
-                        content.append(file_content)
+        if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
+            content.append(TextBlock(text=message.content, type="text"))
 
-            if message.audio is not None and len(message.audio) > 0:
-                log_warning("Audio input is currently unsupported.")
+        if message.tool_calls:
+            for tool_call in message.tool_calls:
+                content.append(
+                    ToolUseBlock(
+                        id=tool_call["id"],
+                        input=json.loads(tool_call["function"]["arguments"])
+                        if "arguments" in tool_call["function"]
+                        else {},
+                        name=tool_call["function"]["name"],
+                        type="tool_use",
+                    )
+                )
+    # Skip empty assistant responses
+    if message.role == "assistant" and not content:
+        return None
 
-            if message.videos is not None and len(message.videos) > 0:
-                log_warning("Video input is currently unsupported.")
+    return {"role": ROLE_MAP[message.role], "content": content}
 
-        elif message.role == "assistant":
-            content = []
 
-            if message.thinking is not None and message.provider_data is not None:
-                from anthropic.types import RedactedThinkingBlock, ThinkingBlock
+def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]:
+    """
+    Process the list of messages and separate them into API messages and system messages.
 
-                content.append(
-                    ThinkingBlock(
-                        thinking=message.thinking,
-                        signature=message.provider_data.get("signature"),
-                        type="thinking",
-                    )
-                )
+    Messages are formatted once and reused by later requests while they are unchanged.
 
-            if message.redacted_thinking is not None:
-                from anthropic.types import RedactedThinkingBlock
-
-                content.append(RedactedThinkingBlock(data=message.redacted_thinking, type="redacted_thinking"))
-
-            if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
-                content.append(TextBlock(text=message.content, type="text"))
-
-            if message.tool_calls:
-                for tool_call in message.tool_calls:
-                    content.append(
-                        ToolUseBlock(
-                            id=tool_call["id"],
-                            input=json.loads(tool_call["function"]["arguments"])
-                            if "arguments" in tool_call["function"]
-                            else {},
-                            name=tool_call["function"]["name"],
-                            type="tool_use",
-                        )
-                    )
-        # Skip empty assistant responses
-        if message.role == "assistant" and not content:
+    Args:
+        messages (List[Message]): The list of messages to process.
+
+    Returns:
+        Tuple[List[Dict[str, str]], str]: A tuple containing the list of API messages and the concatenated system messages.
+    """
+    chat_messages: List[Dict[str, str]] = []
+    system_messages: List[str] = []
+
+    for message in messages:
+        if message.role == "system":
+            system_messages.append(message.content or "")  # type: ignore
             continue
 
-        chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
+        chat_message = message.get_formatted("anthropic", _format_message)
+        if chat_message is not None:
+            chat_messages.append(chat_message)  # type: ignore
     return chat_messages, " ".join(system_messages)
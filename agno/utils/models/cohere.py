@@ -1,9 +1,9 @@
-from pathlib import Path
 from typing import Any, Dict, List, Sequence
 
 from agno.media import Image
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 
 def _format_images_for_message(message: Message, images: Sequence[Image]) -> List[Dict[str, Any]]:
@@ -22,20 +22,13 @@ def _format_images_for_message(message: Message, images: Sequence[Image]) -> Lis
             elif image.url is not None:
                 image_content = image.image_url_content
             elif image.filepath is not None:
-                if isinstance(image.filepath, Path):
-                    image_content = image.filepath.read_bytes()
-                else:
-                    with open(image.filepath, "rb") as f:
-                        image_content = f.read()
+                image_content = get_media_cache().read_file(image.filepath)
             else:
                 log_warning(f"Unsupported image format: {image}")
                 continue
 
             if image_content is not None:
-                import base64
-
-                base64_image = base64.b64encode(image_content).decode("utf-8")
-                image_url = f"data:image/jpeg;base64,{base64_image}"
+                image_url = get_media_cache().data_url(image_content, "image/jpeg")
                 image_payload = {"type": "image_url", "image_url": {"url": image_url}}
                 message_content_with_image.append(image_payload)
 
@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Union
 from agno.media import Image
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 try:
     from mistralai.models import (
@@ -26,7 +27,6 @@ def _format_image_for_message(image: Image) -> Optional[ImageURLChunk]:
         return ImageURLChunk(image_url=image.url)
     # Case 2: Image is a local file path
     elif image.filepath is not None:
-        import base64
         from pathlib import Path
 
         path = Path(image.filepath) if isinstance(image.filepath, str) else image.filepath
@@ -34,16 +34,12 @@ def _format_image_for_message(image: Image) -> Optional[ImageURLChunk]:
             log_error(f"Image file not found: {image}")
             raise FileNotFoundError(f"Image file not found: {image}")
 
-        with open(image.filepath, "rb") as image_file:
-            base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-            return ImageURLChunk(image_url=f"data:image/jpeg;base64,{base64_image}")
+        media_cache = get_media_cache()
+        return ImageURLChunk(image_url=media_cache.data_url(media_cache.read_file(path), "image/jpeg"))
 
     # Case 3: Image is a bytes object
     elif image.content is not None:
-        import base64
-
-        base64_image = base64.b64encode(image.content).decode("utf-8")
-        return ImageURLChunk(image_url=f"data:image/jpeg;base64,{base64_image}")
+        return ImageURLChunk(image_url=get_media_cache().data_url(image.content, "image/jpeg"))
     return None
 
 
@@ -3,21 +3,18 @@ from typing import Any, Dict, List, Optional, Sequence, Union
 
 from agno.media import Image
 from agno.utils.log import logger
+from agno.utils.media_cache import get_media_cache
 
 
 def _process_bytes_image(image: bytes) -> Dict[str, Any]:
     """Process bytes image data."""
-    import base64
-
-    base64_image = base64.b64encode(image).decode("utf-8")
-    image_url = f"data:image/jpeg;base64,{base64_image}"
+    image_url = get_media_cache().data_url(image, "image/jpeg")
     return {"type": "input_image", "image_url": image_url}
 
 
 def _process_image_path(image_path: Union[Path, str]) -> Dict[str, Any]:
     """Process image ( file path)."""
     # Process local file image
-    import base64
     import mimetypes
 
     path = image_path if isinstance(image_path, Path) else Path(image_path)
@@ -25,10 +22,9 @@ def _process_image_path(image_path: Union[Path, str]) -> Dict[str, Any]:
         raise FileNotFoundError(f"Image file not found: {image_path}")
 
     mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
-    with open(path, "rb") as image_file:
-        base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-        image_url = f"data:{mime_type};base64,{base64_image}"
-        return {"type": "input_image", "image_url": image_url}
+    media_cache = get_media_cache()
+    image_url = media_cache.data_url(media_cache.read_file(path), mime_type)
+    return {"type": "input_image", "image_url": image_url}
 
 
 def _process_image_url(image_url: str) -> Dict[str, Any]:
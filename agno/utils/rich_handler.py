@@ -0,0 +1,25 @@
+import logging
+from typing import Optional
+
+from rich.logging import RichHandler
+from rich.text import Text
+
+from agno.utils.log import LOG_STYLES
+
+
+class ColoredRichHandler(RichHandler):
+    def __init__(self, *args, source_type: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.source_type = source_type
+
+    def get_level_text(self, record: logging.LogRecord) -> Text:
+        # Return empty Text if message is empty
+        if not record.msg:
+            return Text("")
+
+        level_name = record.levelname.lower()
+        if self.source_type and self.source_type in LOG_STYLES:
+            if level_name in LOG_STYLES[self.source_type]:
+                color = LOG_STYLES[self.source_type][level_name]
+                return Text(record.levelname, style=color)
+        return super().get_level_text(record)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -7,6 +8,26 @@ from agno.document import Document
 class VectorDb(ABC):
     """Base class for Vector Databases"""
 
+    # Searches take a projection: `return_embeddings=False` leaves the stored vectors out of the results, and
+    # `metadata_keys` keeps only the given metadata keys. Vectors are still fetched when the reranker needs them.
+
+    def include_embeddings(self, return_embeddings: bool = True) -> bool:
+        """Whether a search needs to fetch the stored vectors"""
+        reranker = getattr(self, "reranker", None)
+        return return_embeddings or bool(getattr(reranker, "requires_embeddings", False))
+
+    @staticmethod
+    def project_documents(
+        documents: List[Document], return_embeddings: bool = True, metadata_keys: Optional[List[str]] = None
+    ) -> List[Document]:
+        """Apply the projection of a search to the documents it returns"""
+        for document in documents:
+            if not return_embeddings:
+                document.embedding = None
+            if metadata_keys is not None and document.meta_data:
+                document.meta_data = {k: v for k, v in document.meta_data.items() if k in metadata_keys}
+        return documents
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
@@ -23,6 +44,22 @@ class VectorDb(ABC):
     async def async_doc_exists(self, document: Document) -> bool:
         raise NotImplementedError
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which of the documents already exist, in order.
+        Backends that can look up many content hashes in one query should override this.
+        """
+        return [self.doc_exists(document) for document in documents]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which of the documents already exist asynchronously, in order."""
+        results = await asyncio.gather(
+            *[self.async_doc_exists(document) for document in documents], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, NotImplementedError):
+                raise result
+        return [isinstance(result, bool) and result for result in results]
+
     @abstractmethod
     def name_exists(self, name: str) -> bool:
         raise NotImplementedError
@@ -54,12 +91,24 @@ class VectorDb(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         raise NotImplementedError
 
     @abstractmethod
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         raise NotImplementedError
 
@@ -94,3 +143,7 @@ class VectorDb(ABC):
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """Delete the documents whose content hash (md5 of the cleaned content) is in `content_hashes`"""
+        raise NotImplementedError
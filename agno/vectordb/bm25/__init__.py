@@ -0,0 +1,9 @@
+from agno.vectordb.bm25.hybrid import HybridVectorDb, reciprocal_rank_fusion
+from agno.vectordb.bm25.index import BM25Index, tokenize
+
+__all__ = [
+    "BM25Index",
+    "HybridVectorDb",
+    "reciprocal_rank_fusion",
+    "tokenize",
+]
@@ -0,0 +1,257 @@
+from copy import copy
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from agno.document import Document
+from agno.knowledge.manifest import vector_content_hash
+from agno.utils.log import log_debug, log_info
+from agno.vectordb.base import VectorDb
+from agno.vectordb.bm25.index import BM25Index
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]], k: int = 60, weights: Optional[Sequence[float]] = None
+) -> List[Tuple[str, float]]:
+    """Fuse ranked lists of keys with reciprocal rank fusion, best first.
+
+    Each key scores sum(weight / (k + rank)) over the lists it appears in, so only ranks matter
+    and scores from different retrievers need no calibration.
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class HybridVectorDb(VectorDb):
+    """
+    Adds BM25 keyword search, fused with vector search by reciprocal rank fusion, to any vector db.
+
+    Writes go to the wrapped vector db and to an in-process BM25 index kept in sync with it, so backends
+    without native hybrid search still match exact terms such as product names and SKUs. Other attributes
+    are read from the wrapped vector db.
+
+    Args:
+        vector_db (VectorDb): The vector db to wrap.
+        index_path (Optional[Union[str, Path]]): File the BM25 index is persisted to. None keeps it in memory.
+        bm25 (Optional[BM25Index]): A BM25 index to use instead of creating one.
+        rrf_k (int): Reciprocal rank fusion constant.
+        vector_weight (float): Weight of the vector ranking in the fusion.
+        keyword_weight (float): Weight of the keyword ranking in the fusion.
+        candidate_factor (int): Number of candidates fetched from each retriever per result returned.
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDb,
+        index_path: Optional[Union[str, Path]] = None,
+        bm25: Optional[BM25Index] = None,
+        rrf_k: int = 60,
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+        candidate_factor: int = 3,
+    ):
+        self.vector_db: VectorDb = vector_db
+        self.bm25: BM25Index = bm25 or BM25Index(path=index_path)
+        self.rrf_k: int = rrf_k
+        self.vector_weight: float = vector_weight
+        self.keyword_weight: float = keyword_weight
+        self.candidate_factor: int = candidate_factor
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "vector_db":
+            raise AttributeError(name)
+        return getattr(self.vector_db, name)
+
+    def _index_documents(self, documents: List[Document], filters: Optional[Dict[str, Any]]) -> None:
+        entries = []
+        for document in documents:
+            meta_data = dict(document.meta_data or {})
+            if filters:
+                meta_data.update(filters)
+            entries.append(
+                (
+                    vector_content_hash(document.content),
+                    Document(name=document.name, content=document.content, meta_data=meta_data),
+                )
+            )
+        self.bm25.add(entries)
+
+    def create(self) -> None:
+        self.vector_db.create()
+
+    async def async_create(self) -> None:
+        await self.vector_db.async_create()
+
+    def doc_exists(self, document: Document) -> bool:
+        return self.vector_db.doc_exists(document)
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return await self.vector_db.async_doc_exists(document)
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        return self.vector_db.docs_exist(documents)
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        return await self.vector_db.async_docs_exist(documents)
+
+    def name_exists(self, name: str) -> bool:
+        return self.vector_db.name_exists(name)
+
+    async def async_name_exists(self, name: str) -> bool:  # type: ignore
+        return await self.vector_db.async_name_exists(name)  # type: ignore
+
+    def id_exists(self, id: str) -> bool:
+        return self.vector_db.id_exists(id)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.insert(documents, filters)
+        self._index_documents(documents, filters)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.vector_db.async_insert(documents, filters)
+        self._index_documents(documents, filters)
+
+    def upsert_available(self) -> bool:
+        return self.vector_db.upsert_available()
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.upsert(documents, filters)
+        self._index_documents(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.vector_db.async_upsert(documents, filters)
+        self._index_documents(documents, filters)
+
+    def _indexed_document(self, key: str, metadata_keys: Optional[List[str]]) -> Optional[Document]:
+        """A copy of a document of the BM25 index, so projecting it leaves the index unchanged"""
+        document = self.bm25.get_document(key)
+        if document is None:
+            return None
+        return self.project_documents([copy(document)], metadata_keys=metadata_keys)[0]
+
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        """Search the BM25 index only"""
+        documents = [self._indexed_document(key, metadata_keys) for key, _ in self.bm25.search(query, limit, filters)]
+        return [document for document in documents if document is not None]
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.vector_db.search(query=query, limit=limit)
+
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        return self.search(
+            query=query, limit=limit, filters=filters, return_embeddings=return_embeddings, metadata_keys=metadata_keys
+        )
+
+    def _fuse(
+        self,
+        query: str,
+        vector_results: List[Document],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        metadata_keys: Optional[List[str]],
+    ) -> List[Document]:
+        keyword_results = self.bm25.search(query, limit * self.candidate_factor, filters)
+
+        by_key: Dict[str, Document] = {}
+        vector_ranking: List[str] = []
+        for document in vector_results:
+            key = vector_content_hash(document.content)
+            if key not in by_key:
+                by_key[key] = document
+                vector_ranking.append(key)
+        keyword_ranking = [key for key, _ in keyword_results]
+
+        fused = reciprocal_rank_fusion(
+            [vector_ranking, keyword_ranking], k=self.rrf_k, weights=[self.vector_weight, self.keyword_weight]
+        )
+
+        search_results: List[Document] = []
+        for key, _ in fused[:limit]:
+            document = by_key.get(key) or self._indexed_document(key, metadata_keys)
+            if document is not None:
+                search_results.append(document)
+
+        log_debug(f"Fused {len(vector_ranking)} vector and {len(keyword_ranking)} keyword results")
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        """Search with the wrapped vector db and the BM25 index, fusing both rankings"""
+        vector_results = self.vector_db.search(
+            query=query,
+            limit=limit * self.candidate_factor,
+            filters=filters,
+            return_embeddings=return_embeddings,
+            metadata_keys=metadata_keys,
+        )
+        return self._fuse(query, vector_results, limit, filters, metadata_keys)
+
+    async def async_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        vector_results = await self.vector_db.async_search(
+            query=query,
+            limit=limit * self.candidate_factor,
+            filters=filters,
+            return_embeddings=return_embeddings,
+            metadata_keys=metadata_keys,
+        )
+        return self._fuse(query, vector_results, limit, filters, metadata_keys)
+
+    def drop(self) -> None:
+        self.vector_db.drop()
+        self.bm25.clear()
+
+    async def async_drop(self) -> None:
+        await self.vector_db.async_drop()
+        self.bm25.clear()
+
+    def exists(self) -> bool:
+        return self.vector_db.exists()
+
+    async def async_exists(self) -> bool:
+        return await self.vector_db.async_exists()
+
+    def optimize(self) -> None:
+        self.vector_db.optimize()
+        self.bm25.compact()
+
+    def delete(self) -> bool:
+        deleted = self.vector_db.delete()
+        if deleted:
+            self.bm25.clear()
+        return deleted
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        deleted = self.vector_db.delete_by_content_hashes(content_hashes)
+        if deleted:
+            self.bm25.remove(content_hashes)
+        return deleted
@@ -0,0 +1,275 @@
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from heapq import nlargest
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from agno.document import Document
+from agno.utils.log import log_debug, logger
+
+# Words, and runs of words joined by "-", "_", "." or "/" such as SKUs, versions, file names and paths
+_TOKEN_PATTERN = re.compile(r"\w+(?:[-./]\w+)*", re.UNICODE)
+_JOINER_PATTERN = re.compile(r"[-_./]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded word tokens. Works for any script, e.g. Hebrew.
+
+    Joined runs such as `SKU-1234` or `v2.1` are kept whole, so exact identifiers match, and are also indexed
+    by their parts (`sku`, `1234`).
+    """
+    tokens: List[str] = []
+    for token in _TOKEN_PATTERN.findall(text.casefold()):
+        tokens.append(token)
+        parts = [part for part in _JOINER_PATTERN.split(token) if part]
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class BM25Index:
+    """In-process Okapi BM25 inverted index over document contents.
+
+    Documents are keyed by the content hash the vector dbs use, so keyword and vector results can be matched.
+    The index is updated incrementally and, when a path is given, persisted as an append-only JSONL journal
+    that is replayed on load and compacted once it holds too many removed entries. Several processes can share
+    a journal: before each search or write, entries appended by other processes are replayed.
+
+    Args:
+        path (Optional[Union[str, Path]]): Journal file. None keeps the index in memory only.
+        k1 (float): Term frequency saturation.
+        b (float): Document length normalization.
+        tokenizer (Callable[[str], List[str]]): Function splitting text into terms.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Callable[[str], List[str]] = tokenize,
+    ):
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer
+
+        # key -> {"name", "content", "meta_data"}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        # term -> {key: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.total_length = 0
+
+        self._lock = threading.RLock()
+        # Number of journal lines that no longer describe a live document
+        self._stale_entries = 0
+        # Bytes of the journal replayed so far, and the inode of the journal they belong to
+        self._journal_offset = 0
+        self._journal_inode: Optional[int] = None
+        if self.path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.documents
+
+    def _index(self, key: str, payload: Dict[str, Any]) -> None:
+        if key in self.documents:
+            self._unindex(key)
+        terms = Counter(self.tokenizer(payload["content"]))
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[key] = frequency
+        length = sum(terms.values())
+        self.documents[key] = payload
+        self.doc_lengths[key] = length
+        self.total_length += length
+
+    def _unindex(self, key: str) -> None:
+        payload = self.documents.pop(key, None)
+        if payload is None:
+            return
+        for term in set(self.tokenizer(payload["content"])):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(key, 0)
+
+    def add(self, entries: Iterable[Tuple[str, Document]]) -> None:
+        """Index documents by key, replacing documents already indexed under the same key"""
+        with self._lock:
+            self.refresh()
+            journal: List[Dict[str, Any]] = []
+            for key, document in entries:
+                payload = {"name": document.name, "content": document.content, "meta_data": document.meta_data or {}}
+                if key in self.documents:
+                    self._stale_entries += 1
+                self._index(key, payload)
+                journal.append({"op": "add", "key": key, **payload})
+            self._append(journal)
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Remove documents from the index"""
+        with self._lock:
+            self.refresh()
+            journal: List[Dict[str, Any]] = []
+            for key in keys:
+                if key in self.documents:
+                    self._unindex(key)
+                    journal.append({"op": "remove", "key": key})
+                    # The removal line and the line that added the document
+                    self._stale_entries += 2
+            self._append(journal)
+
+    def clear(self) -> None:
+        """Remove every document and truncate the journal"""
+        with self._lock:
+            self._reset()
+            if self.path is not None and self.path.exists():
+                self.path.write_text("", encoding="utf-8")
+                self._journal_inode = self.path.stat().st_ino
+
+    def _reset(self) -> None:
+        self.documents.clear()
+        self.postings.clear()
+        self.doc_lengths.clear()
+        self.total_length = 0
+        self._stale_entries = 0
+        self._journal_offset = 0
+        self._journal_inode = None
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Tuple[str, float]]:
+        """Return the keys and BM25 scores of the best matching documents, best first.
+
+        Args:
+            query (str): Query string to search for.
+            limit (int): Maximum number of results.
+            filters (Optional[Dict[str, Any]]): Metadata values the results must match.
+        """
+        with self._lock:
+            self.refresh()
+            num_documents = len(self.documents)
+            if num_documents == 0:
+                return []
+            average_length = self.total_length / num_documents
+
+            scores: Dict[str, float] = {}
+            for term in set(self.tokenizer(query)):
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (num_documents - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[key] / average_length)
+                    scores[key] = scores.get(key, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+            if filters:
+                scores = {key: score for key, score in scores.items() if self._matches(key, filters)}
+            return nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def _matches(self, key: str, filters: Dict[str, Any]) -> bool:
+        meta_data = self.documents[key].get("meta_data") or {}
+        return all(meta_data.get(name) == value for name, value in filters.items())
+
+    def get_document(self, key: str) -> Optional[Document]:
+        payload = self.documents.get(key)
+        if payload is None:
+            return None
+        return Document(name=payload.get("name"), content=payload["content"], meta_data=dict(payload["meta_data"]))
+
+    def _append(self, journal: List[Dict[str, Any]]) -> None:
+        if self.path is None or not journal:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in journal).encode("utf-8")
+        with open(self.path, "ab") as f:
+            f.write(data)
+            end = f.tell()
+            # Skip replaying our own entries, unless another process appended entries before them
+            if end - len(data) == self._journal_offset and os.fstat(f.fileno()).st_ino == self._journal_inode:
+                self._journal_offset = end
+            elif self._journal_inode is None and end == len(data):
+                self._journal_offset, self._journal_inode = end, os.fstat(f.fileno()).st_ino
+        if self._stale_entries > max(1000, len(self.documents)):
+            self.compact()
+
+    def load(self) -> None:
+        """Replay the journal into memory"""
+        if self.path is None or not self.path.exists():
+            return
+        with self._lock:
+            self._reset()
+            self._replay_journal()
+            log_debug(f"Loaded {len(self.documents)} documents into BM25 index from {self.path}")
+
+    def refresh(self) -> None:
+        """Replay the entries other processes appended to the journal since it was last read.
+
+        The whole journal is reloaded when another process compacted or cleared it.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                return
+            if stat.st_ino != self._journal_inode or stat.st_size < self._journal_offset:
+                self.load()
+            elif stat.st_size > self._journal_offset:
+                self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """Apply the complete journal lines after the replayed offset"""
+        with open(self.path, "rb") as f:  # type: ignore
+            self._journal_inode = os.fstat(f.fileno()).st_ino
+            f.seek(self._journal_offset)
+            data = f.read()
+        # A line without its newline is still being written
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # A partial line from an interrupted write
+                logger.warning(f"Skipping corrupt entry in BM25 index {self.path}")
+                self._stale_entries += 1
+                continue
+            key = entry["key"]
+            if entry["op"] == "add":
+                if key in self.documents:
+                    self._stale_entries += 1
+                self._index(key, {k: entry[k] for k in ("name", "content", "meta_data")})
+            elif entry["op"] == "remove":
+                # The removal line, and the line that added the document if there was one
+                self._stale_entries += 2 if key in self.documents else 1
+                self._unindex(key)
+        self._journal_offset += end
+
+    def compact(self) -> None:
+        """Rewrite the journal with one entry per live document"""
+        if self.path is None:
+            return
+        with self._lock:
+            # Keep the entries other processes appended since the last read
+            self.refresh()
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                for key, payload in self.documents.items():
+                    entry = json.dumps({"op": "add", "key": key, **payload}, ensure_ascii=False) + "\n"
+                    f.write(entry.encode("utf-8"))
+                offset = f.tell()
+            tmp_path.replace(self.path)
+            self._journal_offset, self._journal_inode = offset, self.path.stat().st_ino
+            self._stale_entries = 0
+            log_debug(f"Compacted BM25 index {self.path} to {len(self.documents)} documents")
@@ -121,16 +121,30 @@ class Cassandra(VectorDb):
         """Upsert documents asynchronously by running in a thread."""
         await asyncio.to_thread(self.upsert, documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """Keyword-based search on document metadata."""
         log_debug(f"Cassandra VectorDB : Performing Vector Search on {self.table_name} with query {query}")
-        return self.vector_search(query=query, limit=limit)
+        return self.vector_search(
+            query=query, limit=limit, return_embeddings=return_embeddings, metadata_keys=metadata_keys
+        )
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await asyncio.to_thread(self.search, query, limit, filters, return_embeddings, metadata_keys)
 
     def _search_to_documents(
         self,
@@ -138,9 +152,15 @@ class Cassandra(VectorDb):
     ) -> List[Document]:
         return [self._row_to_document(row=hit) for hit in hits]
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """Vector similarity search implementation."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         hits = list(
             self.table.metric_ann_search(
                 vector=query_embedding,
@@ -149,7 +169,7 @@ class Cassandra(VectorDb):
             )
         )
         d = self._search_to_documents(hits)
-        return d
+        return self.project_documents(d, return_embeddings, metadata_keys)
 
     def drop(self) -> None:
         """Drop the vector table in Cassandra."""
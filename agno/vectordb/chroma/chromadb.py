@@ -13,6 +13,7 @@ except ImportError:
     raise ImportError("The `chromadb` package is not installed. Please install it via `pip install chromadb`.")
 
 from agno.document import Document
+from agno.document.base import embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
@@ -98,24 +99,38 @@ class ChromaDb(VectorDb):
         Returns:
             bool: True if document exists, False otherwise.
         """
+        return self.docs_exist([document])[0]
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        """Check if a document exists asynchronously."""
+        return await asyncio.to_thread(self.doc_exists, document)
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the collection with a single lookup by id.
+        Args:
+            documents (List[Document]): Documents to check.
+        Returns:
+            List[bool]: Whether each document exists, in the same order as `documents`.
+        """
+        if not documents:
+            return []
         if not self.client:
             logger.warning("Client not initialized")
-            return False
+            return [False] * len(documents)
 
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
         try:
             collection: Collection = self.client.get_collection(name=self.collection_name)
-            collection_data: GetResult = collection.get(include=["documents"])  # type: ignore
-            existing_documents = collection_data.get("documents", [])
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            if cleaned_content in existing_documents:  # type: ignore
-                return True
+            collection_data: GetResult = collection.get(ids=list(set(doc_ids)), include=[])  # type: ignore
+            existing_ids = set(collection_data.get("ids", []))
+            return [doc_id in existing_ids for doc_id in doc_ids]
         except Exception as e:
-            logger.error(f"Document does not exist: {e}")
-        return False
+            logger.error(f"Documents do not exist: {e}")
+        return [False] * len(documents)
 
-    async def async_doc_exists(self, document: Document) -> bool:
-        """Check if a document exists asynchronously."""
-        return await asyncio.to_thread(self.doc_exists, document)
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously."""
+        return await asyncio.to_thread(self.docs_exist, documents)
 
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
@@ -153,8 +168,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -200,8 +215,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -221,7 +236,14 @@ class ChromaDb(VectorDb):
         """Upsert documents asynchronously by running in a thread."""
         await asyncio.to_thread(self.upsert, documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """Search the collection for a query.
 
         Args:
@@ -233,10 +255,12 @@ class ChromaDb(VectorDb):
                 - $gt, $gte, $lt, $lte: Numeric comparisons
                 - $in, $nin: List inclusion/exclusion
                 - $and, $or: Logical operators
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
         Returns:
             List[Document]: List of search results.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -247,11 +271,14 @@ class ChromaDb(VectorDb):
         # Convert simple filters to ChromaDB's format if needed
         where_filter = self._convert_filters(filters) if filters else None
 
+        include = ["metadatas", "documents", "distances", "uris"]
+        if self.include_embeddings(return_embeddings):
+            include.append("embeddings")
         result: QueryResult = self._collection.query(
             query_embeddings=query_embedding,
             n_results=limit,
             where=where_filter,  # Add where filter
-            include=["metadatas", "documents", "embeddings", "distances", "uris"],
+            include=include,  # type: ignore
         )
 
         # Build search results
@@ -260,7 +287,7 @@ class ChromaDb(VectorDb):
         ids = result.get("ids", [[]])[0]
         metadata = result.get("metadatas", [{}])[0]
         documents = result.get("documents", [[]])[0]
-        embeddings = result.get("embeddings")[0]
+        embeddings = (result.get("embeddings") or [[None] * len(ids)])[0]
         embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in embeddings]
         distances = result.get("distances", [[]])[0]
 
@@ -282,6 +309,7 @@ class ChromaDb(VectorDb):
 
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
@@ -312,10 +340,15 @@ class ChromaDb(VectorDb):
         return converted
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await asyncio.to_thread(self.search, query, limit, filters, return_embeddings, metadata_keys)
 
     def drop(self) -> None:
         """Delete the collection."""
@@ -360,3 +393,16 @@ class ChromaDb(VectorDb):
         except Exception as e:
             logger.error(f"Error clearing collection: {e}")
             return False
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes, which are the ids used on insert."""
+        if not content_hashes:
+            return True
+        try:
+            if not self._collection:
+                self._collection = self.client.get_collection(name=self.collection_name)
+            self._collection.delete(ids=content_hashes)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
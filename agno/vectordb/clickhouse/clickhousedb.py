@@ -404,8 +404,15 @@ class Clickhouse(VectorDb):
             parameters=parameters,
         )
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -428,8 +435,11 @@ class Clickhouse(VectorDb):
             order_by_query = "ORDER BY cosineDistance(embedding, {query_embedding:Array(Float32)})"
             parameters["query_embedding"] = query_embedding
 
+        # The embedding column is only read when the results need it
+        with_embeddings = self.include_embeddings(return_embeddings)
+        columns = "name, meta_data, content, usage, embedding" if with_embeddings else "name, meta_data, content, usage"
         clickhouse_query = (
-            "SELECT name, meta_data, content, embedding, usage FROM "
+            f"SELECT {columns} FROM "
             "{database_name:Identifier}.{table_name:Identifier} "
             f"{where_query} {order_by_query} LIMIT {limit}"
         )
@@ -456,20 +466,25 @@ class Clickhouse(VectorDb):
                     meta_data=result[1],
                     content=result[2],
                     embedder=self.embedder,
-                    embedding=result[3],
-                    usage=result[4],
+                    embedding=result[4] if with_embeddings else None,
+                    usage=result[3],
                 )
             )
 
-        return search_results
+        return self.project_documents(search_results, return_embeddings, metadata_keys)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for documents asynchronously."""
         async_client = await self._ensure_async_client()
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -492,8 +507,11 @@ class Clickhouse(VectorDb):
             order_by_query = "ORDER BY cosineDistance(embedding, {query_embedding:Array(Float32)})"
             parameters["query_embedding"] = query_embedding
 
+        # The embedding column is only read when the results need it
+        with_embeddings = self.include_embeddings(return_embeddings)
+        columns = "name, meta_data, content, usage, embedding" if with_embeddings else "name, meta_data, content, usage"
         clickhouse_query = (
-            "SELECT name, meta_data, content, embedding, usage FROM "
+            f"SELECT {columns} FROM "
             "{database_name:Identifier}.{table_name:Identifier} "
             f"{where_query} {order_by_query} LIMIT {limit}"
         )
@@ -520,12 +538,12 @@ class Clickhouse(VectorDb):
                     meta_data=result[1],
                     content=result[2],
                     embedder=self.embedder,
-                    embedding=result[3],
-                    usage=result[4],
+                    embedding=result[4] if with_embeddings else None,
+                    usage=result[3],
                 )
             )
 
-        return search_results
+        return self.project_documents(search_results, return_embeddings, metadata_keys)
 
     def drop(self) -> None:
         if self.table_exists():
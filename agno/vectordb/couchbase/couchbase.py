@@ -433,9 +433,16 @@ class CouchbaseSearch(VectorDb):
         if errors_occurred:
             logger.warning("Some errors occurred during the upsert operation. Please check logs for details.")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """Search the Couchbase bucket for documents relevant to the query."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -447,8 +454,8 @@ class CouchbaseSearch(VectorDb):
             )
             request = SearchRequest.create(vector_search)
 
-            # Prepare the options dictionary
-            options_dict = {"limit": limit, "fields": ["*"]}
+            # Prepare the options dictionary. Only the hit ids are used, the documents are read from the KV store.
+            options_dict: Dict[str, Any] = {"limit": limit}
             if filters:
                 options_dict["raw"] = filters
 
@@ -463,7 +470,7 @@ class CouchbaseSearch(VectorDb):
             else:
                 results = self.scope.search(**search_args)
 
-            return self.__get_doc_from_kv(results)
+            return self.project_documents(self.__get_doc_from_kv(results), return_embeddings, metadata_keys)
         except Exception as e:
             logger.error(f"Error during search: {e}")
             raise
@@ -943,9 +950,14 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"[async] Total successfully upserted: {total_upserted_count}, Total failed: {total_failed_count}.")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"[async] Failed to generate embedding for query: {query}")
             return []
@@ -956,8 +968,8 @@ class CouchbaseSearch(VectorDb):
             )
             request = SearchRequest.create(vector_search)
 
-            # Prepare the options dictionary
-            options_dict = {"limit": limit, "fields": ["*"]}
+            # Prepare the options dictionary. Only the hit ids are used, the documents are read from the KV store.
+            options_dict: Dict[str, Any] = {"limit": limit}
             if filters:
                 options_dict["raw"] = filters
 
@@ -974,7 +986,8 @@ class CouchbaseSearch(VectorDb):
                 async_scope_instance = await self.get_async_scope()
                 results = async_scope_instance.search(**search_args)
 
-            return await self.__async_get_doc_from_kv(results)
+            documents = await self.__async_get_doc_from_kv(results)
+            return self.project_documents(documents, return_embeddings, metadata_keys)
         except Exception as e:
             logger.error(f"[async] Error during search: {e}")
             raise
@@ -1,14 +1,18 @@
+import asyncio
 import json
+import time
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import lancedb
     import pyarrow as pa
+    from lancedb.index import BTree
 except ImportError:
     raise ImportError("`lancedb` not installed. Please install using `pip install lancedb`")
 
 from agno.document import Document
+from agno.document.base import embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
@@ -37,6 +41,10 @@ class LanceDb(VectorDb):
         use_tantivy: Whether to use Tantivy for full text search.
         on_bad_vectors: What to do if the vector is bad. One of "error", "drop", "fill", "null".
         fill_value: The value to fill the vector with if on_bad_vectors is "fill".
+        filter_columns: Metadata keys stored as their own columns, so filters on them are pushed down to LanceDB
+            as prefilters and served by scalar indexes. Filters on other keys are applied after the search.
+        refresh_interval: Seconds between checks for a newer table version written by another process.
+        post_filter_factor: How many times `limit` rows to fetch when some filters are applied after the search.
     """
 
     def __init__(
@@ -56,6 +64,9 @@ class LanceDb(VectorDb):
         use_tantivy: bool = True,
         on_bad_vectors: Optional[str] = None,  # One of "error", "drop", "fill", "null".
         fill_value: Optional[float] = None,  # Only used if on_bad_vectors is "fill"
+        filter_columns: Optional[List[str]] = None,
+        refresh_interval: float = 1.0,
+        post_filter_factor: int = 4,
     ):
         # Embedder for embedding the document contents
         if embedder is None:
@@ -82,6 +93,16 @@ class LanceDb(VectorDb):
         self.async_connection: Optional[lancedb.AsyncConnection] = async_connection
         self.async_table: Optional[lancedb.db.AsyncTable] = async_table
 
+        # Metadata keys stored as top-level columns for prefiltering
+        self.filter_columns: List[str] = list(filter_columns or [])
+        reserved = {"vector", "id", "payload"}.intersection(self.filter_columns)
+        if reserved:
+            raise ValueError(f"filter_columns cannot use reserved column names: {sorted(reserved)}")
+        self.refresh_interval: float = refresh_interval
+        self.post_filter_factor: int = post_filter_factor
+        self._table_checked_at: float = time.monotonic()
+        self._scalar_indexes_created: bool = False
+
         if table_name and table_name in self.connection.table_names():
             # Open the table if it exists
             self.table = self.connection.open_table(name=table_name)
@@ -110,6 +131,11 @@ class LanceDb(VectorDb):
                 self._vector_col = "vector"
                 self.table = self._init_table()
 
+        missing_columns = [c for c in self.filter_columns if c not in self.table.schema.names]  # type: ignore
+        if missing_columns:
+            logger.warning(f"Table '{self.table_name}' has no columns for filter_columns {missing_columns}")
+            self.filter_columns = [c for c in self.filter_columns if c not in missing_columns]
+
         self.reranker: Optional[Reranker] = reranker
         self.nprobes: Optional[int] = nprobes
         self.on_bad_vectors: Optional[str] = on_bad_vectors
@@ -162,6 +188,7 @@ class LanceDb(VectorDb):
                 pa.field(self._id, pa.string()),
                 pa.field("payload", pa.string()),
             ]
+            + [pa.field(column, pa.string()) for column in self.filter_columns]
         )
 
     def _init_table(self) -> lancedb.db.LanceTable:
@@ -200,10 +227,46 @@ class LanceDb(VectorDb):
         Returns:
             bool: True if document exists, False otherwise
         """
-        if self.connection:
-            self.table = self.connection.open_table(name=self.table_name)
+        self._refresh_table()
         return self.doc_exists(document)
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist with a single filtered scan over their ids
+
+        Args:
+            documents (List[Document]): Documents to validate
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as `documents`
+        """
+        if not documents:
+            return []
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        try:
+            if self.table is not None:
+                id_list = ", ".join(f"'{doc_id}'" for doc_id in set(doc_ids))
+                result = self.table.search().where(f"{self._id} IN ({id_list})").select([self._id]).to_arrow()
+                existing_ids = set(result[self._id].to_pylist())
+                return [doc_id in existing_ids for doc_id in doc_ids]
+        except Exception:
+            # Search sometimes fails with stale cache data, it means the docs don't exist
+            pass
+        return [False] * len(documents)
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Asynchronously validate which documents exist
+
+        Args:
+            documents (List[Document]): Documents to validate
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as `documents`
+        """
+        self._refresh_table()
+        return self.docs_exist(documents)
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -219,17 +282,18 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
-        for document in documents:
-            if self.doc_exists(document):
-                continue
+        exists = self.docs_exist(documents)
+        new_documents = [document for document, doc_exists in zip(documents, exists) if not doc_exists]
+        # Embed the new documents in one call to the embedder
+        embed_documents(new_documents, self.embedder)
 
+        for document in new_documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -243,6 +307,7 @@ class LanceDb(VectorDb):
                     "id": doc_id,
                     "vector": document.embedding,
                     "payload": json.dumps(payload),
+                    **self._filter_column_values(document.meta_data),
                 }
             )
             log_debug(f"Parsed document: {document.name} ({document.meta_data})")
@@ -260,6 +325,9 @@ class LanceDb(VectorDb):
         else:
             self.table.add(data)
 
+        if not self._scalar_indexes_created:
+            self.create_scalar_indexes()
+
         log_debug(f"Inserted {len(data)} documents")
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
@@ -277,18 +345,19 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
-        # Prepare documents for insertion
-        for document in documents:
-            if await self.async_doc_exists(document):
-                continue
+        exists = await self.async_docs_exist(documents)
+        new_documents = [document for document, doc_exists in zip(documents, exists) if not doc_exists]
+        # Embed the new documents in one call to the embedder
+        embed_documents(new_documents, self.embedder)
 
+        # Prepare documents for insertion
+        for document in new_documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -302,6 +371,7 @@ class LanceDb(VectorDb):
                     "id": doc_id,
                     "vector": document.embedding,
                     "payload": json.dumps(payload),
+                    **self._filter_column_values(document.meta_data),
                 }
             )
             log_debug(f"Parsed document: {document.name} ({document.meta_data})")
@@ -318,6 +388,9 @@ class LanceDb(VectorDb):
             else:
                 await self.async_table.add(data)  # type: ignore
 
+            if not self._scalar_indexes_created:
+                await self.async_create_scalar_indexes()
+
             log_debug(f"Asynchronously inserted {len(data)} documents")
         except Exception as e:
             logger.error(f"Error during async document insertion: {e}")
@@ -336,29 +409,43 @@ class LanceDb(VectorDb):
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Search for documents matching the query.
 
+        Filters on `filter_columns` are pushed down to LanceDB as prefilters. Any other filters are applied
+        to the results, fetching `post_filter_factor` times more rows so that `limit` results remain.
+
         Args:
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents
         """
-        if self.connection:
-            self.table = self.connection.open_table(name=self.table_name)
+        self._refresh_table()
+
+        _, post_filters = self._split_filters(filters)
+        fetch_limit = limit * self.post_filter_factor if post_filters else limit
 
         results = None
 
         if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
+            results = self.vector_search(query, fetch_limit, filters, return_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
+            results = self.keyword_search(query, fetch_limit, filters, return_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
+            results = self.hybrid_search(query, fetch_limit, filters, return_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
@@ -368,8 +455,8 @@ class LanceDb(VectorDb):
 
         search_results = self._build_search_results(results)
 
-        # Filter results based on metadata if filters are provided
-        if filters and search_results:
+        # Filter results on the metadata keys that could not be pushed down
+        if post_filters and search_results:
             filtered_results = []
             for doc in search_results:
                 if doc.meta_data is None:
@@ -377,7 +464,7 @@ class LanceDb(VectorDb):
 
                 # Check if all filter criteria match
                 match = True
-                for key, value in filters.items():
+                for key, value in post_filters.items():
                     if key not in doc.meta_data or doc.meta_data[key] != value:
                         match = False
                         break
@@ -385,76 +472,91 @@ class LanceDb(VectorDb):
                 if match:
                     filtered_results.append(doc)
 
-            search_results = filtered_results
+            search_results = filtered_results[:limit]
 
         if self.reranker and search_results:
             search_results = self.reranker.rerank(query=query, documents=search_results)
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Asynchronously search for documents matching the query.
 
+        The sync LanceDB query runs in a worker thread so the event loop is not blocked.
+
         Args:
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents
         """
-        # TODO: Search is not yet supported in async (https://github.com/lancedb/lancedb/pull/2049)
-        if self.connection:
-            self.table = self.connection.open_table(name=self.table_name)
-
-        results = None
-
-        if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
-        elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
-        elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
-        else:
-            logger.error(f"Invalid search type '{self.search_type}'.")
-            return []
-
-        if results is None:
-            return []
+        return await asyncio.to_thread(self.search, query, limit, filters, return_embeddings, metadata_keys)
 
-        search_results = self._build_search_results(results)
-
-        # Filter results based on metadata if filters are provided
-        if filters and search_results:
-            filtered_results = []
-            for doc in search_results:
-                if doc.meta_data is None:
-                    continue
-
-                # Check if all filter criteria match
-                match = True
-                for key, value in filters.items():
-                    if key not in doc.meta_data or doc.meta_data[key] != value:
-                        match = False
-                        break
-
-                if match:
-                    filtered_results.append(doc)
-
-            search_results = filtered_results
+    def _refresh_table(self) -> None:
+        """Reuse the open table handle, checking at most every `refresh_interval` seconds for a newer version."""
+        if self.table is None:
+            if self.connection and self.exists():
+                self.table = self.connection.open_table(name=self.table_name)
+                self._table_checked_at = time.monotonic()
+            return
 
-        if self.reranker and search_results:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
+        now = time.monotonic()
+        if now - self._table_checked_at < self.refresh_interval:
+            return
+        self._table_checked_at = now
+        try:
+            self.table.checkout_latest()
+        except Exception:
+            # Older lancedb versions: fall back to reopening the table
+            if self.connection:
+                self.table = self.connection.open_table(name=self.table_name)
+
+    def _filter_column_values(self, meta_data: Optional[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        meta_data = meta_data or {}
+        return {
+            column: str(meta_data[column]) if meta_data.get(column) is not None else None
+            for column in self.filter_columns
+        }
+
+    def _split_filters(self, filters: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Split filters into a LanceDB `where` clause over `filter_columns` and the filters applied after the search."""
+        if not filters:
+            return None, {}
+
+        clauses: List[str] = []
+        post_filters: Dict[str, Any] = {}
+        for key, value in filters.items():
+            if key not in self.filter_columns or value is None:
+                post_filters[key] = value
+            elif isinstance(value, (list, tuple, set)):
+                values = ", ".join(self._sql_literal(v) for v in value)
+                clauses.append(f"{key} IN ({values})")
+            else:
+                clauses.append(f"{key} = {self._sql_literal(value)}")
+        return (" AND ".join(clauses) if clauses else None), post_filters
 
-        log_info(f"Found {len(search_results)} documents")
-        return search_results
+    @staticmethod
+    def _sql_literal(value: Any) -> str:
+        return "'" + str(value).replace("'", "''") + "'"
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    def vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = True
+    ) -> List[Document]:
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return None
@@ -468,13 +570,20 @@ class LanceDb(VectorDb):
             vector_column_name=self._vector_col,
         ).limit(limit)
 
+        results = results.select(self._select_columns(return_embeddings) + ["_distance"])
+        where, _ = self._split_filters(filters)
+        if where:
+            results = results.where(where, prefilter=True)
+
         if self.nprobes:
             results.nprobes(self.nprobes)
 
         return results.to_pandas()
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    def hybrid_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = True
+    ) -> List[Document]:
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -497,12 +606,19 @@ class LanceDb(VectorDb):
             .limit(limit)
         )
 
+        results = results.select(self._select_columns(return_embeddings))
+        where, _ = self._split_filters(filters)
+        if where:
+            results = results.where(where, prefilter=True)
+
         if self.nprobes:
             results.nprobes(self.nprobes)
 
         return results.to_pandas()
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = True
+    ) -> List[Document]:
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return []
@@ -516,8 +632,20 @@ class LanceDb(VectorDb):
             query_type="fts",
         ).limit(limit)
 
+        results = results.select(self._select_columns(return_embeddings))
+        where, _ = self._split_filters(filters)
+        if where:
+            results = results.where(where, prefilter=True)
+
         return results.to_pandas()
 
+    def _select_columns(self, return_embeddings: bool = True) -> List[str]:
+        """Columns read by searches. The vector column is only read when the results need it."""
+        columns = [self._id, "payload"]
+        if self.include_embeddings(return_embeddings):
+            columns.append(self._vector_col)
+        return columns
+
     def _build_search_results(self, results) -> List[Document]:  # TODO: typehint pandas?
         search_results: List[Document] = []
         try:
@@ -529,7 +657,7 @@ class LanceDb(VectorDb):
                         meta_data=payload["meta_data"],
                         content=payload["content"],
                         embedder=self.embedder,
-                        embedding=item["vector"],
+                        embedding=item[self._vector_col] if self._vector_col in item else None,
                         usage=payload["usage"],
                     )
                 )
@@ -575,11 +703,49 @@ class LanceDb(VectorDb):
         return 0
 
     def optimize(self) -> None:
-        pass
+        """Create scalar indexes on the filter columns so prefiltered searches do not scan the table"""
+        self.create_scalar_indexes(replace=True)
+
+    def create_scalar_indexes(self, replace: bool = False) -> None:
+        if self.table is None or not self.filter_columns:
+            return
+        for column in self.filter_columns:
+            try:
+                self.table.create_scalar_index(column, replace=replace)
+                log_debug(f"Created scalar index on column: {column}")
+            except Exception as e:
+                logger.warning(f"Could not create scalar index on column '{column}': {e}")
+        self._scalar_indexes_created = True
+
+    async def async_create_scalar_indexes(self, replace: bool = False) -> None:
+        if self.async_table is None or not self.filter_columns:
+            return
+        for column in self.filter_columns:
+            try:
+                await self.async_table.create_index(column, replace=replace, config=BTree())
+                log_debug(f"Created scalar index on column: {column}")
+            except Exception as e:
+                logger.warning(f"Could not create scalar index on column '{column}': {e}")
+        self._scalar_indexes_created = True
 
     def delete(self) -> bool:
         return False
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """Delete the rows with the given content hashes, which are the ids used on insert."""
+        if not content_hashes:
+            return True
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return False
+        try:
+            id_list = ", ".join(f"'{content_hash}'" for content_hash in content_hashes)
+            self.table.delete(f"{self._id} IN ({id_list})")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with the given name exists in the database"""
         if self.table is None:
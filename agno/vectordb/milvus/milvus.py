@@ -139,6 +139,13 @@ class Milvus(VectorDb):
 
         return sparse_vector
 
+    def _output_fields(self, vector_field: str, return_embeddings: bool = True) -> List[str]:
+        """Fields returned by searches. The vector field is only returned when the results need it."""
+        fields = ["name", "meta_data", "content", "usage"]
+        if self.include_embeddings(return_embeddings):
+            fields.append(vector_field)
+        return fields
+
     def _create_hybrid_schema(self) -> Any:
         """Create a schema for hybrid collection with all necessary fields."""
         from pymilvus import DataType
@@ -518,7 +525,14 @@ class Milvus(VectorDb):
         """
         return MILVUS_DISTANCE_MAP.get(self.distance, "COSINE")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Search for documents matching the query.
 
@@ -526,14 +540,16 @@ class Milvus(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents
         """
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit)
+            return self.hybrid_search(query, limit, filters, return_embeddings, metadata_keys)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -542,7 +558,7 @@ class Milvus(VectorDb):
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=self._output_fields("vector", return_embeddings),
             limit=limit,
         )
 
@@ -560,17 +576,23 @@ class Milvus(VectorDb):
                     usage=result["entity"].get("usage", None),
                 )
             )
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit, filters)
+            return self.hybrid_search(query, limit, filters, return_embeddings, metadata_keys)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -579,7 +601,7 @@ class Milvus(VectorDb):
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=self._output_fields("vector", return_embeddings),
             limit=limit,
         )
 
@@ -597,11 +619,19 @@ class Milvus(VectorDb):
                     usage=result["entity"].get("usage", None),
                 )
             )
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Perform a hybrid search combining dense and sparse vector similarity.
 
@@ -609,6 +639,8 @@ class Milvus(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents
@@ -616,7 +648,7 @@ class Milvus(VectorDb):
         from pymilvus import AnnSearchRequest, RRFRanker
 
         # Get query embeddings
-        dense_vector = self.embedder.get_embedding(query)
+        dense_vector = self.embedder.get_query_embedding(query)
         sparse_vector = self._get_sparse_vector(query)
 
         if dense_vector is None:
@@ -657,7 +689,11 @@ class Milvus(VectorDb):
 
             log_info("Performing hybrid search")
             results = self._client.hybrid_search(
-                collection_name=self.collection, reqs=reqs, ranker=ranker, limit=limit, output_fields=["*"]
+                collection_name=self.collection,
+                reqs=reqs,
+                ranker=ranker,
+                limit=limit,
+                output_fields=self._output_fields("dense_vector", return_embeddings),
             )
 
             # Build search results
@@ -683,6 +719,7 @@ class Milvus(VectorDb):
             # Apply additional reranking if custom reranker is provided
             if self.reranker and search_results:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -530,13 +530,19 @@ class MongoDb(VectorDb):
         return True
 
     def search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, min_score: float = 0.0
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: float = 0.0,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for documents using vector similarity."""
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit=limit)
+            return self.hybrid_search(query, limit=limit, metadata_keys=metadata_keys)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -578,6 +584,7 @@ class MongoDb(VectorDb):
                     for doc in results
                 ]
 
+                docs = self.project_documents(docs, return_embeddings, metadata_keys)
                 log_info(f"Search completed. Found {len(docs)} documents.")
                 return docs
 
@@ -621,7 +628,8 @@ class MongoDb(VectorDb):
                 if match_filters:
                     pipeline.append({"$match": match_filters})  # type: ignore
 
-                pipeline.append({"$project": {"embedding": 0}})
+                if not self.include_embeddings(return_embeddings):
+                    pipeline.append({"$project": {"embedding": 0}})
 
                 results = list(collection.aggregate(pipeline))  # type: ignore
 
@@ -634,9 +642,11 @@ class MongoDb(VectorDb):
                         name=clean_doc.get("name"),
                         content=clean_doc["content"],
                         meta_data={**clean_doc.get("meta_data", {}), "score": clean_doc.get("score", 0.0)},
+                        embedding=clean_doc.get("embedding"),
                     )
                     docs.append(document)
 
+                docs = self.project_documents(docs, return_embeddings, metadata_keys)
                 log_info(f"Search completed. Found {len(docs)} documents.")
                 return docs
 
@@ -649,7 +659,9 @@ class MongoDb(VectorDb):
         log_debug("Performing vector search.")
         return self.search(query, limit=limit)
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(
+        self, query: str, limit: int = 5, metadata_keys: Optional[List[str]] = None
+    ) -> List[Document]:
         """Perform a keyword-based search."""
         try:
             collection = self._get_collection()
@@ -666,6 +678,7 @@ class MongoDb(VectorDb):
                 )
                 for doc in cursor
             ]
+            results = self.project_documents(results, metadata_keys=metadata_keys)
             log_debug(f"Keyword search completed. Found {len(results)} documents.")
             return results
         except Exception as e:
@@ -676,6 +689,7 @@ class MongoDb(VectorDb):
         self,
         query: str,
         limit: int = 5,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector and keyword-based searches using Reciprocal Rank Fusion.
@@ -692,7 +706,7 @@ class MongoDb(VectorDb):
 
         log_debug(f"Performing hybrid search for query: '{query}' with limit: {limit}")
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -822,6 +836,7 @@ class MongoDb(VectorDb):
                 )
                 docs.append(document)
                 
+            docs = self.project_documents(docs, metadata_keys=metadata_keys)
             log_info(f"Hybrid search completed. Found {len(docs)} documents.")
             return docs
         except errors.OperationFailure as e:
@@ -990,10 +1005,15 @@ class MongoDb(VectorDb):
                 logger.error(f"Error upserting document '{document.name}' asynchronously: {e}")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for documents asynchronously."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -1026,7 +1046,8 @@ class MongoDb(VectorDb):
 
                 pipeline.append({"$match": mongo_filters})
 
-            pipeline.append({"$project": {"embedding": 0}})
+            if not self.include_embeddings(return_embeddings):
+                pipeline.append({"$project": {"embedding": 0}})
 
             # With AsyncMongoClient, aggregate() returns a coroutine that resolves to a cursor
             # We need to await it first to get the cursor
@@ -1045,10 +1066,12 @@ class MongoDb(VectorDb):
                     name=doc.get("name"),
                     content=doc["content"],
                     meta_data={**doc.get("meta_data", {}), "score": doc.get("score", 0.0)},
+                    embedding=doc.get("embedding"),
                 )
                 for doc in results
             ]
 
+            docs = self.project_documents(docs, return_embeddings, metadata_keys)
             log_info(f"Async search completed. Found {len(docs)} documents.")
             return docs
 
@@ -0,0 +1,5 @@
+from agno.vectordb.numpydb.numpy_db import NumpyDb
+
+__all__ = [
+    "NumpyDb",
+]
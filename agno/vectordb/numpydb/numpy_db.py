@@ -0,0 +1,702 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from agno.document import Document
+from agno.document.base import embed_documents
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+
+@dataclass
+class _Snapshot:
+    """Immutable view of the table that searches run on, so they need no lock while scoring"""
+
+    vectors: np.ndarray
+    # Vector rows of the live documents, sorted
+    rows: np.ndarray
+    # IVF partition of each row in `rows`, -1 when unassigned
+    partitions: np.ndarray
+    centroids: Optional[np.ndarray]
+
+
+class NumpyDb(VectorDb):
+    """
+    Embedded vector db for single-node deployments, built on NumPy and SQLite only.
+
+    Vectors are stored in a memory-mapped file, one fixed-size row per document, and metadata in a SQLite
+    database next to it. Searches are exact top-k matrix products over the stored vectors, optionally restricted
+    to the closest IVF partitions once `optimize()` has built the index. Any number of processes can search the
+    same files concurrently: they share the vectors through the OS page cache and pick up writes through a
+    version stamp in SQLite. Writes are serialized by the SQLite write lock. Rewrites of the vectors file go to a
+    new file whose name is committed with the metadata, so readers never pair metadata with the wrong file.
+
+    Args:
+        table_name (str): Name of the table, used for the file names.
+        path (Union[str, Path]): Directory holding the table files.
+        embedder (Embedder): Embedder used to embed documents and queries.
+        distance (Distance): Distance metric used for search.
+        dtype (str): Storage type of the vectors, "float32" or "float16".
+        nlist (Optional[int]): Number of IVF partitions built by `optimize()`. None searches all vectors.
+        nprobe (int): Number of IVF partitions searched per query.
+        block_size (int): Number of vectors scored per block, bounding the memory used by a search.
+        reranker (Optional[Reranker]): Reranker applied to the search results.
+    """
+
+    def __init__(
+        self,
+        table_name: str = "documents",
+        path: Union[str, Path] = "tmp/numpydb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        dtype: str = "float32",
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        block_size: int = 65536,
+        reranker: Optional[Reranker] = None,
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}. Use 'float32' or 'float16'.")
+
+        self.table_name: str = table_name
+        self.path: Path = Path(path)
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.dimensions: Optional[int] = self.embedder.dimensions
+
+        self.distance: Distance = distance
+        self.dtype: str = dtype
+        self.nlist: Optional[int] = nlist
+        self.nprobe: int = nprobe
+        self.block_size: int = block_size
+        self.reranker: Optional[Reranker] = reranker
+
+        self.db_path: Path = self.path / f"{table_name}.sqlite"
+        self.vectors_path: Path = self.path / f"{table_name}.vectors"
+        self.centroids_path: Path = self.path / f"{table_name}.centroids.npy"
+
+        # One SQLite connection per thread
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+        # Snapshot of the table used by searches, replaced when the version stamp changes
+        self._version: Optional[str] = None
+        self._snapshot: Optional[_Snapshot] = None
+
+    @property
+    def _np_dtype(self) -> Any:
+        return np.float16 if self.dtype == "float16" else np.float32
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the SQLite write lock, so a single writer across processes updates the table and the vectors file"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute(
+                    "UPDATE settings SET value = CAST(CAST(value AS INTEGER) + 1 AS TEXT) WHERE key = 'version'"
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _get_setting(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_setting(self, conn: sqlite3.Connection, key: str, value: Any) -> None:
+        conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _vectors_file(self, conn: sqlite3.Connection) -> Path:
+        """The vectors file matching the metadata visible on `conn`"""
+        return self.path / (self._get_setting(conn, "vectors_file") or self.vectors_path.name)
+
+    def _replace_vectors_file(self, conn: sqlite3.Connection) -> Tuple[Path, Path]:
+        """Name a new vectors file for the transaction on `conn` and record it in the settings.
+
+        Returns the new file, for the caller to fill before committing, and the file it replaces, for the caller
+        to remove after committing. A rolled back transaction leaves the new file behind, the next rewrite reuses
+        its name.
+        """
+        previous = self._vectors_file(conn)
+        # The version is incremented by every commit, so the name is not used by a committed transaction
+        current = self.path / f"{self.table_name}.v{self._get_setting(conn, 'version')}.vectors"
+        self._set_setting(conn, "vectors_file", current.name)
+        return current, previous
+
+    def create(self) -> None:
+        """Create the table files if they do not exist"""
+        if self.exists():
+            return
+
+        log_debug(f"Creating table: {self.table_name}")
+        conn = self._connection()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                vector_row INTEGER PRIMARY KEY,
+                content_hash TEXT NOT NULL UNIQUE,
+                id TEXT,
+                name TEXT,
+                content TEXT NOT NULL,
+                meta_data TEXT,
+                usage TEXT,
+                partition INTEGER NOT NULL DEFAULT -1
+            );
+            CREATE INDEX IF NOT EXISTS documents_name ON documents (name);
+            CREATE INDEX IF NOT EXISTS documents_id ON documents (id);
+            CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT);
+            INSERT OR IGNORE INTO settings (key, value) VALUES ('version', '0');
+            INSERT OR IGNORE INTO settings (key, value) VALUES ('next_row', '0');
+            """
+        )
+        self.vectors_path.touch(exist_ok=True)
+
+    async def async_create(self) -> None:
+        await asyncio.to_thread(self.create)
+
+    def exists(self) -> bool:
+        if not self.db_path.exists():
+            return False
+        row = (
+            self._connection()
+            .execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'documents'")
+            .fetchone()
+        )
+        return row is not None
+
+    async def async_exists(self) -> bool:
+        return await asyncio.to_thread(self.exists)
+
+    def doc_exists(self, document: Document) -> bool:
+        return self.docs_exist([document])[0]
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return await asyncio.to_thread(self.doc_exists, document)
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist with a single lookup of their content hashes"""
+        if not documents or not self.exists():
+            return [False] * len(documents)
+        content_hashes = [self._content_hash(document.content) for document in documents]
+        rows = self._select_in("SELECT content_hash FROM documents", "content_hash", content_hashes)
+        existing = {row[0] for row in rows}
+        return [content_hash in existing for content_hash in content_hashes]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        return await asyncio.to_thread(self.docs_exist, documents)
+
+    def name_exists(self, name: str) -> bool:
+        if not self.exists():
+            return False
+        row = self._connection().execute("SELECT 1 FROM documents WHERE name = ? LIMIT 1", (name,)).fetchone()
+        return row is not None
+
+    async def async_name_exists(self, name: str) -> bool:  # type: ignore
+        return await asyncio.to_thread(self.name_exists, name)
+
+    def id_exists(self, id: str) -> bool:
+        if not self.exists():
+            return False
+        row = self._connection().execute("SELECT 1 FROM documents WHERE id = ? LIMIT 1", (id,)).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        return md5(content.replace("\x00", "\ufffd").encode()).hexdigest()
+
+    def _select_in(self, query: str, column: str, values: List[Any], chunk_size: int = 500) -> List[Tuple]:
+        """Run `query` with a `column IN (...)` condition, chunked below the SQLite variable limit"""
+        conn = self._connection()
+        rows: List[Tuple] = []
+        for i in range(0, len(values), chunk_size):
+            chunk = values[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(conn.execute(f"{query} WHERE {column} IN ({placeholders})", chunk).fetchall())
+        return rows
+
+    def _prepare_vectors(self, embeddings: List[List[float]]) -> np.ndarray:
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if self.distance == Distance.cosine:
+            # Cosine search is an inner product over normalized vectors
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors = vectors / norms
+        return vectors
+
+    def _write_vectors(self, path: Path, start_row: int, vectors: np.ndarray) -> None:
+        """Write contiguous vector rows to the vectors file, extending it as needed"""
+        data = np.ascontiguousarray(vectors, dtype=self._np_dtype)
+        with open(path, "r+b") as f:
+            f.seek(start_row * data.shape[1] * data.itemsize)
+            f.write(data.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _assign_partitions(self, vectors: np.ndarray) -> np.ndarray:
+        centroids = self._load_centroids()
+        if centroids is None or len(vectors) == 0:
+            return np.full(len(vectors), -1, dtype=np.int64)
+        return self._nearest_centroids(vectors, centroids)
+
+    def _nearest_centroids(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        vectors = vectors.astype(np.float32, copy=False)
+        distances = (centroids**2).sum(axis=1)[None, :] - 2 * vectors @ centroids.T
+        return np.argmin(distances, axis=1).astype(np.int64)
+
+    def _load_centroids(self) -> Optional[np.ndarray]:
+        if not self.centroids_path.exists():
+            return None
+        return np.load(self.centroids_path)
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]], upsert: bool) -> None:
+        if not documents:
+            return
+        if not self.exists():
+            self.create()
+
+        # Deduplicate the batch by content hash, the last occurrence wins
+        batch: Dict[str, Document] = {}
+        for document in documents:
+            batch[self._content_hash(document.content)] = document
+
+        # Stored contents keep their vector, so only new contents are embedded
+        stored = {row[0] for row in self._select_in("SELECT content_hash FROM documents", "content_hash", list(batch))}
+        if not upsert:
+            batch = {content_hash: document for content_hash, document in batch.items() if content_hash not in stored}
+        embed_documents(
+            [d for content_hash, d in batch.items() if content_hash not in stored and not d.embedding], self.embedder
+        )
+        if not batch:
+            return
+
+        with self._write_transaction() as conn:
+            existing = dict(
+                self._select_in("SELECT content_hash, vector_row FROM documents", "content_hash", list(batch))
+            )
+            # Contents deleted by another writer since the lookup above
+            embed_documents(
+                [d for content_hash, d in batch.items() if content_hash not in existing and not d.embedding],
+                self.embedder,
+            )
+
+            # Content hash and column values of each new document
+            new_documents: List[Tuple[str, Tuple[Any, ...]]] = []
+            updated = 0
+            for content_hash, document in batch.items():
+                meta_data = dict(document.meta_data or {})
+                if filters:
+                    meta_data.update(filters)
+                values = (document.id, document.name, document.content.replace("\x00", "\ufffd"), json.dumps(meta_data))
+                if content_hash in existing:
+                    if not upsert:
+                        continue
+                    conn.execute(
+                        "UPDATE documents SET id = ?, name = ?, content = ?, meta_data = ? WHERE content_hash = ?",
+                        (*values, content_hash),
+                    )
+                    updated += 1
+                elif not document.embedding:
+                    logger.warning(f"Skipping document without embedding: {document.name}")
+                else:
+                    new_documents.append((content_hash, values))
+
+            if new_documents:
+                embeddings = [batch[content_hash].embedding for content_hash, _ in new_documents]
+                vectors = self._prepare_vectors(embeddings)  # type: ignore
+                partitions = self._assign_partitions(vectors)
+                dimensions = self._get_setting(conn, "dimensions")
+                if dimensions is None:
+                    self._set_setting(conn, "dimensions", vectors.shape[1])
+                    self._set_setting(conn, "dtype", self.dtype)
+                elif int(dimensions) != vectors.shape[1]:
+                    raise ValueError(f"Embedding dimensions {vectors.shape[1]} do not match the table ({dimensions})")
+
+                next_row = int(self._get_setting(conn, "next_row") or 0)
+                for i, (content_hash, values) in enumerate(new_documents):
+                    usage = batch[content_hash].usage
+                    conn.execute(
+                        "INSERT INTO documents "
+                        "(vector_row, content_hash, id, name, content, meta_data, usage, partition) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (next_row + i, content_hash, *values, json.dumps(usage) if usage else None, int(partitions[i])),
+                    )
+                # New vectors are appended in one write
+                self._write_vectors(self._vectors_file(conn), next_row, vectors)
+                self._set_setting(conn, "next_row", next_row + len(new_documents))
+
+        log_debug(f"Wrote {len(new_documents)} new and {updated} updated documents to {self.table_name}")
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, skipping documents whose content already exists"""
+        log_debug(f"Inserting {len(documents)} documents")
+        self._write(documents, filters, upsert=False)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await asyncio.to_thread(self.insert, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, updating documents whose content already exists"""
+        log_debug(f"Upserting {len(documents)} documents")
+        self._write(documents, filters, upsert=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await asyncio.to_thread(self.upsert, documents, filters)
+
+    def _refresh(self) -> None:
+        """Reload the search snapshot if another writer, in this or another process, changed the table"""
+        conn = self._connection()
+        version = self._get_setting(conn, "version")
+        if version == self._version:
+            return
+
+        while True:
+            # A read transaction, so the rows, the settings and the vectors file name are from the same commit
+            conn.execute("BEGIN")
+            try:
+                version = self._get_setting(conn, "version")
+                rows = conn.execute("SELECT vector_row, partition FROM documents ORDER BY vector_row").fetchall()
+                table = np.asarray(rows, dtype=np.int64).reshape(-1, 2)
+                next_row = int(self._get_setting(conn, "next_row") or 0)
+                dimensions = self._get_setting(conn, "dimensions")
+                vectors_file = self._vectors_file(conn)
+            finally:
+                conn.execute("COMMIT")
+
+            snapshot = None
+            if next_row > 0 and dimensions is not None:
+                try:
+                    # A read-only mapping: the pages are shared with every other process reading the file
+                    vectors = np.memmap(vectors_file, dtype=self._np_dtype, mode="r", shape=(next_row, int(dimensions)))
+                except FileNotFoundError:
+                    # Replaced by a writer that committed after the read, read its metadata instead
+                    continue
+                snapshot = _Snapshot(
+                    vectors=vectors,
+                    rows=table[:, 0],
+                    partitions=table[:, 1],
+                    centroids=self._load_centroids(),
+                )
+            break
+
+        self._snapshot = snapshot
+        self._version = version
+        log_debug(f"Loaded {len(table)} vectors from {self.table_name} (version {version})")
+
+    def _filter_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Vector rows of documents whose metadata matches all filters"""
+        conditions: List[str] = []
+        params: List[Any] = []
+        for key, value in filters.items():
+            path = "$." + json.dumps(str(key))
+            if isinstance(value, (list, tuple, set)):
+                values = list(value)
+                conditions.append(f"json_extract(meta_data, ?) IN ({','.join('?' * len(values))})")
+                params.extend([path, *values])
+            else:
+                conditions.append("json_extract(meta_data, ?) = ?")
+                params.extend([path, value])
+        query = f"SELECT vector_row FROM documents WHERE {' AND '.join(conditions)} ORDER BY vector_row"
+        rows = self._connection().execute(query, params).fetchall()
+        return np.asarray([row[0] for row in rows], dtype=np.int64)
+
+    def _candidate_rows(
+        self, snapshot: "_Snapshot", query_vector: np.ndarray, filters: Optional[Dict[str, Any]]
+    ) -> np.ndarray:
+        candidates = snapshot.rows
+        if snapshot.centroids is not None and self.nprobe < len(snapshot.centroids):
+            centroid_scores = self._scores(snapshot.centroids, query_vector)
+            probes = np.argpartition(-centroid_scores, self.nprobe - 1)[: self.nprobe]
+            # Vectors written before the index was built are not assigned to a partition (-1)
+            candidates = candidates[np.isin(snapshot.partitions, probes) | (snapshot.partitions < 0)]
+        if filters:
+            candidates = np.intersect1d(candidates, self._filter_rows(filters), assume_unique=True)
+        return candidates[candidates < len(snapshot.vectors)]
+
+    def _scores(self, vectors: np.ndarray, query_vector: np.ndarray) -> np.ndarray:
+        """Similarity of each vector to the query, higher is closer"""
+        vectors = vectors.astype(np.float32, copy=False)
+        if self.distance == Distance.l2:
+            # Ranking by -||v - q||^2 is the same as ranking by 2 v.q - ||v||^2
+            return 2 * (vectors @ query_vector) - np.einsum("ij,ij->i", vectors, vectors)
+        return vectors @ query_vector
+
+    def _top_k(self, vectors: np.ndarray, candidates: np.ndarray, query_vector: np.ndarray, k: int) -> List[int]:
+        """Exact top-k over the candidate rows, scored block by block"""
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start in range(0, len(candidates), self.block_size):
+            block_rows = candidates[start : start + self.block_size]
+            block_scores = self._scores(vectors[block_rows], query_vector)
+            rows = np.concatenate([best_rows, block_rows])
+            scores = np.concatenate([best_scores, block_scores])
+            if len(scores) > k:
+                keep = np.argpartition(-scores, k - 1)[:k]
+                rows, scores = rows[keep], scores[keep]
+            best_rows, best_scores = rows, scores
+        order = np.argsort(-best_scores, kind="stable")
+        return best_rows[order].tolist()
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        """
+        Search for the documents closest to the query.
+
+        Args:
+            query (str): Query string to search for
+            limit (int): Maximum number of results to return
+            filters (Optional[Dict[str, Any]]): Metadata values the results must match
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
+
+        Returns:
+            List[Document]: List of matching documents
+        """
+        if not self.exists():
+            return []
+
+        query_embedding = self.embedder.get_query_embedding(query)
+        if query_embedding is None or len(query_embedding) == 0:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        query_vector = self._prepare_vectors([query_embedding])[0]
+
+        with self._lock:
+            self._refresh()
+            snapshot = self._snapshot
+        if snapshot is None or limit <= 0:
+            return []
+        if len(query_vector) != snapshot.vectors.shape[1]:
+            logger.error(f"Query embedding dimensions {len(query_vector)} do not match the table")
+            return []
+
+        candidates = self._candidate_rows(snapshot, query_vector, filters)
+        top_rows = self._top_k(snapshot.vectors, candidates, query_vector, limit)
+
+        search_results = self._fetch_documents(snapshot.vectors, top_rows, return_embeddings)
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
+        return await asyncio.to_thread(self.search, query, limit, filters, return_embeddings, metadata_keys)
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.search(query=query, limit=limit)
+
+    def _fetch_documents(
+        self, vectors: np.ndarray, vector_rows: List[int], return_embeddings: bool = True
+    ) -> List[Document]:
+        """Load documents by vector row, keeping the order of `vector_rows`"""
+        rows = self._select_in(
+            "SELECT vector_row, id, name, content, meta_data, usage FROM documents", "vector_row", vector_rows
+        )
+        by_row = {row[0]: row for row in rows}
+        with_embeddings = self.include_embeddings(return_embeddings)
+
+        documents: List[Document] = []
+        for vector_row in vector_rows:
+            row = by_row.get(vector_row)
+            if row is None:
+                continue
+            documents.append(
+                Document(
+                    id=row[1],
+                    name=row[2],
+                    content=row[3],
+                    meta_data=json.loads(row[4]) if row[4] else {},
+                    usage=json.loads(row[5]) if row[5] else None,
+                    embedder=self.embedder,
+                    embedding=vectors[vector_row].astype(np.float32).tolist() if with_embeddings else None,
+                )
+            )
+        return documents
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """Delete documents by content hash. Their vector rows are reclaimed by `optimize()`."""
+        if not content_hashes or not self.exists():
+            return True
+        try:
+            with self._write_transaction() as conn:
+                for i in range(0, len(content_hashes), 500):
+                    chunk = content_hashes[i : i + 500]
+                    conn.execute(f"DELETE FROM documents WHERE content_hash IN ({','.join('?' * len(chunk))})", chunk)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents from {self.table_name}: {e}")
+            return False
+
+    def delete(self) -> bool:
+        """Delete all documents, keeping the table"""
+        if not self.exists():
+            return True
+        try:
+            with self._write_transaction() as conn:
+                conn.execute("DELETE FROM documents")
+                self._set_setting(conn, "next_row", 0)
+                # Replace the file rather than truncating it, readers still mapping it would fault on the lost pages
+                vectors_file, previous_file = self._replace_vectors_file(conn)
+                vectors_file.write_bytes(b"")
+                if self.centroids_path.exists():
+                    self.centroids_path.unlink()
+            previous_file.unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents from {self.table_name}: {e}")
+            return False
+
+    def drop(self) -> None:
+        """Delete the table files"""
+        with self._lock:
+            conn = getattr(self._local, "conn", None)
+            if conn is not None:
+                conn.close()
+                self._local.conn = None
+            vectors_files = [self.vectors_path, *self.path.glob(f"{self.table_name}.v*.vectors")]
+            for file in (self.db_path, *vectors_files, self.centroids_path):
+                for path in (file, Path(f"{file}-wal"), Path(f"{file}-shm")):
+                    if path.exists():
+                        path.unlink()
+            self._version = None
+            self._snapshot = None
+        log_debug(f"Dropped table: {self.table_name}")
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def optimize(self) -> None:
+        """Reclaim the vector rows of deleted documents and, if `nlist` is set, rebuild the IVF index"""
+        if not self.exists():
+            return
+        previous_file: Optional[Path] = None
+        with self._write_transaction() as conn:
+            dimensions = self._get_setting(conn, "dimensions")
+            if dimensions is None:
+                return
+            previous_file = self._compact(conn, int(dimensions))
+            if self.nlist:
+                self._build_ivf(conn, int(dimensions))
+        # Readers still mapping the previous file keep a valid mapping until they refresh
+        if previous_file is not None:
+            previous_file.unlink(missing_ok=True)
+
+    def _compact(self, conn: sqlite3.Connection, dimensions: int) -> Optional[Path]:
+        """Copy the live vectors to a new file committed with the renumbered rows. Returns the replaced file."""
+        next_row = int(self._get_setting(conn, "next_row") or 0)
+        live_rows = [row[0] for row in conn.execute("SELECT vector_row FROM documents ORDER BY vector_row")]
+        if len(live_rows) == next_row:
+            return None
+
+        log_debug(f"Compacting {self.table_name}: {next_row - len(live_rows)} deleted vectors")
+        vectors_file, previous_file = self._replace_vectors_file(conn)
+        source = np.memmap(previous_file, dtype=self._np_dtype, mode="r", shape=(next_row, dimensions))
+        with open(vectors_file, "wb") as f:
+            for start in range(0, len(live_rows), self.block_size):
+                f.write(np.ascontiguousarray(source[live_rows[start : start + self.block_size]]).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        del source
+
+        # Rows are renumbered in ascending order, so each new row number is free when it is assigned
+        conn.executemany(
+            "UPDATE documents SET vector_row = ? WHERE vector_row = ?",
+            [(new_row, old_row) for new_row, old_row in enumerate(live_rows) if new_row != old_row],
+        )
+        self._set_setting(conn, "next_row", len(live_rows))
+        return previous_file
+
+    def _build_ivf(self, conn: sqlite3.Connection, dimensions: int) -> None:
+        next_row = int(self._get_setting(conn, "next_row") or 0)
+        if next_row < self.nlist:  # type: ignore
+            log_debug(f"Not enough vectors to build {self.nlist} IVF partitions")
+            return
+
+        vectors = np.memmap(self._vectors_file(conn), dtype=self._np_dtype, mode="r", shape=(next_row, dimensions))
+        centroids = self._train_centroids(vectors, self.nlist)  # type: ignore
+        if self.distance == Distance.cosine:
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        assignments: List[Tuple[int, int]] = []
+        for start in range(0, next_row, self.block_size):
+            block = np.asarray(vectors[start : start + self.block_size], dtype=np.float32)
+            for offset, partition in enumerate(self._nearest_centroids(block, centroids)):
+                assignments.append((int(partition), start + offset))
+        del vectors
+        conn.executemany("UPDATE documents SET partition = ? WHERE vector_row = ?", assignments)
+
+        tmp_path = self.centroids_path.with_suffix(".tmp.npy")
+        np.save(tmp_path, centroids)
+        os.replace(tmp_path, self.centroids_path)
+        log_info(f"Built IVF index on {self.table_name} with {self.nlist} partitions")
+
+    def _train_centroids(self, vectors: np.ndarray, nlist: int, iterations: int = 20) -> np.ndarray:
+        """K-means on a sample of the vectors"""
+        rng = np.random.default_rng(0)
+        sample_size = min(len(vectors), nlist * 256)
+        sample_rows = np.sort(rng.choice(len(vectors), size=sample_size, replace=False))
+        sample = np.asarray(vectors[sample_rows], dtype=np.float32)
+
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = self._nearest_centroids(sample, centroids)
+            for partition in range(nlist):
+                members = sample[assignments == partition]
+                if len(members):
+                    centroids[partition] = members.mean(axis=0)
+                else:
+                    # Re-seed empty partitions with a random sample
+                    centroids[partition] = sample[rng.integers(len(sample))]
+        return centroids
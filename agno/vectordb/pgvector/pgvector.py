@@ -20,6 +20,7 @@ except ImportError:
     raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
 
 from agno.document import Document
+from agno.document.base import embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
@@ -247,6 +248,33 @@ class PgVector(VectorDb):
         """Check if document exists asynchronously by running in a thread."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents already exist using a single query over their content hashes.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as `documents`.
+        """
+        if not documents:
+            return []
+
+        content_hashes = [md5(self._clean_content(doc.content).encode()).hexdigest() for doc in documents]
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(set(content_hashes)))
+                existing = {row[0] for row in sess.execute(stmt).fetchall()}
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            return [False] * len(documents)
+        return [content_hash in existing for content_hash in content_hashes]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.docs_exist, documents)
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -307,11 +335,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in one call to the embedder
+                        embed_documents(batch_docs, self.embedder)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -380,11 +410,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in one call to the embedder
+                        embed_documents(batch_docs, self.embedder)
+
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
 
@@ -435,7 +467,14 @@ class PgVector(VectorDb):
         """Upsert documents asynchronously by running in a thread."""
         await asyncio.to_thread(self.upsert, documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -443,27 +482,72 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return self.vector_search(query=query, limit=limit, filters=filters)
+            return self.vector_search(
+                query=query,
+                limit=limit,
+                filters=filters,
+                return_embeddings=return_embeddings,
+                metadata_keys=metadata_keys,
+            )
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query=query, limit=limit, filters=filters)
+            return self.keyword_search(
+                query=query,
+                limit=limit,
+                filters=filters,
+                return_embeddings=return_embeddings,
+                metadata_keys=metadata_keys,
+            )
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query=query, limit=limit, filters=filters)
+            return self.hybrid_search(
+                query=query,
+                limit=limit,
+                filters=filters,
+                return_embeddings=return_embeddings,
+                metadata_keys=metadata_keys,
+            )
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
-
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return await asyncio.to_thread(self.search, query, limit, filters, return_embeddings, metadata_keys)
+
+    def _search_columns(self, with_embeddings: bool) -> List[Any]:
+        """Columns selected by searches. The embedding column is only read when the results need it."""
+        columns = [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.usage,
+        ]
+        if with_embeddings:
+            columns.append(self.table.c.embedding)
+        return columns
+
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Perform a vector similarity search.
 
@@ -471,26 +555,22 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_query_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            with_embeddings = self.include_embeddings(return_embeddings)
+            columns = self._search_columns(with_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
@@ -541,7 +621,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if with_embeddings else None,
                         usage=result.usage,
                     )
                 )
@@ -549,6 +629,7 @@ class PgVector(VectorDb):
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
 
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
             log_info(f"Found {len(search_results)} documents")
             return search_results
         except Exception as e:
@@ -570,7 +651,14 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
 
@@ -578,20 +666,16 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            with_embeddings = self.include_embeddings(return_embeddings)
+            columns = self._search_columns(with_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
@@ -638,11 +722,12 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if with_embeddings else None,
                         usage=result.usage,
                     )
                 )
 
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
             log_info(f"Found {len(search_results)} documents")
             return search_results
         except Exception as e:
@@ -654,6 +739,8 @@ class PgVector(VectorDb):
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector similarity and full-text search.
@@ -662,26 +749,22 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_query_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            with_embeddings = self.include_embeddings(return_embeddings)
+            columns = self._search_columns(with_embeddings)
 
             # Build the text search vector
             ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
@@ -762,11 +845,12 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if with_embeddings else None,
                         usage=result.usage,
                     )
                 )
 
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
             log_info(f"Found {len(search_results)} documents")
             return search_results
         except Exception as e:
@@ -1039,6 +1123,29 @@ class PgVector(VectorDb):
             sess.rollback()
             return False
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the records with the given content hashes.
+
+        Args:
+            content_hashes (List[str]): Content hashes of the records to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        if not content_hashes:
+            return True
+        try:
+            with self.Session() as sess, sess.begin():
+                sess.execute(delete(self.table).where(self.table.c.content_hash.in_(content_hashes)))
+                log_debug(f"Deleted records with {len(content_hashes)} content hashes from '{self.table.fullname}'.")
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting records from table '{self.table.fullname}': {e}")
+            return False
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the PgVector instance, handling unpickleable attributes.
@@ -386,6 +386,8 @@ class PineconeDb(VectorDb):
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for similar documents in the index.
 
@@ -395,13 +397,16 @@ class PineconeDb(VectorDb):
             filters (Optional[Dict[str, Union[str, float, int, bool, List, dict]]], optional): The filter for the search. Defaults to None.
             namespace (Optional[str], optional): The namespace to search in. Defaults to None.
             include_values (Optional[bool], optional): Whether to include values in the search results. Defaults to None.
+            return_embeddings (bool): Whether to return the stored vectors with the results. Pinecone only returns them
+                when `include_values` is also set.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
             include_metadata (Optional[bool], optional): Whether to include metadata in the search results. Defaults to None.
 
         Returns:
             List[Document]: The list of matching documents.
 
         """
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = self.embedder.get_query_embedding(query)
 
         if self.use_hybrid_search:
             sparse_embedding = self.sparse_encoder.encode_queries(query)
@@ -410,6 +415,8 @@ class PineconeDb(VectorDb):
             logger.error(f"Error getting embedding for Query: {query}")
             return []
 
+        with_values = bool(include_values) and return_embeddings
+        fetch_values = self.include_embeddings(with_values)
         if self.use_hybrid_search:
             hdense, hsparse = self._hybrid_scale(dense_embedding, sparse_embedding, alpha=self.hybrid_alpha)
             response = self.index.query(
@@ -418,7 +425,7 @@ class PineconeDb(VectorDb):
                 top_k=limit,
                 namespace=namespace or self.namespace,
                 filter=filters,
-                include_values=include_values,
+                include_values=fetch_values,
                 include_metadata=True,
             )
         else:
@@ -427,7 +434,7 @@ class PineconeDb(VectorDb):
                 top_k=limit,
                 namespace=namespace or self.namespace,
                 filter=filters,
-                include_values=include_values,
+                include_values=fetch_values,
                 include_metadata=True,
             )
 
@@ -435,7 +442,7 @@ class PineconeDb(VectorDb):
             Document(
                 content=(result.metadata.get("text", "") if result.metadata is not None else ""),
                 id=result.id,
-                embedding=result.values,
+                embedding=result.values or None,
                 meta_data=result.metadata,
             )
             for result in response.matches
@@ -443,6 +450,7 @@ class PineconeDb(VectorDb):
 
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
+        search_results = self.project_documents(search_results, with_values, metadata_keys)
         return search_results
 
     async def async_search(
@@ -452,9 +460,13 @@ class PineconeDb(VectorDb):
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for similar documents in the index asynchronously."""
-        return await asyncio.to_thread(self.search, query, limit, filters, namespace, include_values)
+        return await asyncio.to_thread(
+            self.search, query, limit, filters, namespace, include_values, return_embeddings, metadata_keys
+        )
 
     def optimize(self) -> None:
         """Optimize the index.
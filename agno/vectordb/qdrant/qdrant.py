@@ -10,6 +10,7 @@ except ImportError:
     )
 
 from agno.document import Document
+from agno.document.base import embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info
@@ -260,6 +261,39 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents exist with a single retrieve call over their ids
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if not documents:
+            return []
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        collection_points = self.client.retrieve(
+            collection_name=self.collection,
+            ids=list(set(doc_ids)),
+            with_payload=False,
+            with_vectors=False,
+        )
+        existing_ids = {str(point.id).replace("-", "") for point in collection_points}
+        return [doc_id in existing_ids for doc_id in doc_ids]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously with a single retrieve call."""
+        if not documents:
+            return []
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        collection_points = await self.async_client.retrieve(
+            collection_name=self.collection,
+            ids=list(set(doc_ids)),
+            with_payload=False,
+            with_vectors=False,
+        )
+        existing_ids = {str(point.id).replace("-", "") for point in collection_points}
+        return [doc_id in existing_ids for doc_id in doc_ids]
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -312,26 +346,22 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            # Embed the whole batch in one call to the embedder
+            embed_documents(documents, self.embedder)
+
         points = []
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
-            # TODO(v2.0.0): Remove conditional vector naming logic
-            if self.use_named_vectors:
-                vector = {self.dense_vector_name: document.embedding}
-            else:
-                vector = document.embedding  # type: ignore
-
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -373,6 +403,9 @@ class Qdrant(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            # Embed the whole batch in one call to the embedder
+            embed_documents(documents, self.embedder)
 
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -380,13 +413,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -442,7 +473,14 @@ class Qdrant(VectorDb):
         log_debug("Redirecting the async request to async_insert")
         await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Search for documents in the collection.
 
@@ -450,41 +488,51 @@ class Qdrant(VectorDb):
             query (str): Query to search for
             limit (int): Number of search results to return
             filters (Optional[Dict[str, Any]]): Filters to apply while searching
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
         """
         filters = self._format_filters(filters or {})
+        with_vectors = self.include_embeddings(return_embeddings)
         if self.search_type == SearchType.vector:
-            results = self._run_vector_search_sync(query, limit, filters)
+            results = self._run_vector_search_sync(query, limit, filters, with_vectors)
         elif self.search_type == SearchType.keyword:
-            results = self._run_keyword_search_sync(query, limit, filters)
+            results = self._run_keyword_search_sync(query, limit, filters, with_vectors)
         elif self.search_type == SearchType.hybrid:
-            results = self._run_hybrid_search_sync(query, limit, filters)
+            results = self._run_hybrid_search_sync(query, limit, filters, with_vectors)
         else:
             raise ValueError(f"Unsupported search type: {self.search_type}")
 
-        return self._build_search_results(results, query)
+        return self._build_search_results(results, query, return_embeddings, metadata_keys)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         filters = self._format_filters(filters or {})
+        with_vectors = self.include_embeddings(return_embeddings)
         if self.search_type == SearchType.vector:
-            results = await self._run_vector_search_async(query, limit, filters)
+            results = await self._run_vector_search_async(query, limit, filters, with_vectors)
         elif self.search_type == SearchType.keyword:
-            results = await self._run_keyword_search_async(query, limit, filters)
+            results = await self._run_keyword_search_async(query, limit, filters, with_vectors)
         elif self.search_type == SearchType.hybrid:
-            results = await self._run_hybrid_search_async(query, limit, filters)
+            results = await self._run_hybrid_search_async(query, limit, filters, with_vectors)
         else:
             raise ValueError(f"Unsupported search type: {self.search_type}")
 
-        return self._build_search_results(results, query)
+        return self._build_search_results(results, query, return_embeddings, metadata_keys)
 
     def _run_hybrid_search_sync(
         self,
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = True,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = self.embedder.get_query_embedding(query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = self.client.query_points(
             collection_name=self.collection,
@@ -497,7 +545,7 @@ class Qdrant(VectorDb):
                 models.Prefetch(query=dense_embedding, limit=limit, using=self.dense_vector_name),
             ],
             query=models.FusionQuery(fusion=self.hybrid_fusion_strategy),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             query_filter=filters,
@@ -509,15 +557,16 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = True,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = self.embedder.get_query_embedding(query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
             call = self.client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -528,7 +577,7 @@ class Qdrant(VectorDb):
             call = self.client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -540,12 +589,13 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = True,
     ) -> List[models.ScoredPoint]:
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = self.client.query_points(
             collection_name=self.collection,
             query=models.SparseVector(**sparse_embedding),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             using=self.sparse_vector_name,
@@ -558,15 +608,16 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = True,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = self.embedder.get_query_embedding(query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
             call = await self.async_client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -577,7 +628,7 @@ class Qdrant(VectorDb):
             call = await self.async_client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -589,12 +640,13 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = True,
     ) -> List[models.ScoredPoint]:
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
             query=models.SparseVector(**sparse_embedding),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             using=self.sparse_vector_name,
@@ -607,8 +659,9 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = True,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = self.embedder.get_query_embedding(query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
@@ -621,14 +674,16 @@ class Qdrant(VectorDb):
                 models.Prefetch(query=dense_embedding, limit=limit, using=self.dense_vector_name),
             ],
             query=models.FusionQuery(fusion=self.hybrid_fusion_strategy),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             query_filter=filters,
         )
         return call.points
 
-    def _build_search_results(self, results, query: str) -> List[Document]:
+    def _build_search_results(
+        self, results, query: str, return_embeddings: bool = True, metadata_keys: Optional[List[str]] = None
+    ) -> List[Document]:
         search_results: List[Document] = []
 
         for result in results:
@@ -647,6 +702,7 @@ class Qdrant(VectorDb):
 
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
@@ -704,3 +760,18 @@ class Qdrant(VectorDb):
 
     def delete(self) -> bool:
         return self.client.delete_collection(collection_name=self.collection)
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the points with the given content hashes, which are the point ids used on insert.
+
+        Args:
+            content_hashes (List[str]): Content hashes of the documents to delete
+        """
+        if not content_hashes:
+            return True
+        self.client.delete(
+            collection_name=self.collection,
+            points_selector=models.PointIdsList(points=content_hashes),  # type: ignore
+        )
+        return True
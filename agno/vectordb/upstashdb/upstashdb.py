@@ -243,6 +243,8 @@ class UpstashVectorDb(VectorDb):
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
         namespace: Optional[str] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for documents in the index.
         Args:
@@ -250,6 +252,8 @@ class UpstashVectorDb(VectorDb):
             limit (int, optional): Maximum number of results to return. Defaults to 5.
             filters (Optional[Dict[str, Any]], optional): Metadata filters for the search.
             namespace (Optional[str], optional): The namespace to search in. Defaults to None, which uses the instance namespace.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
         Returns:
             List[Document]: List of matching documents.
         """
@@ -258,7 +262,7 @@ class UpstashVectorDb(VectorDb):
         # filter_str = "" if filters is None else str(filters)
 
         if not self.use_upstash_embeddings and self.embedder is not None:
-            dense_embedding = self.embedder.get_embedding(query)
+            dense_embedding = self.embedder.get_query_embedding(query)
 
             if dense_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
@@ -271,7 +275,7 @@ class UpstashVectorDb(VectorDb):
                 # filter=filter_str,
                 include_data=True,
                 include_metadata=True,
-                include_vectors=True,
+                include_vectors=self.include_embeddings(return_embeddings),
             )
         else:
             response = self.index.query(
@@ -281,7 +285,7 @@ class UpstashVectorDb(VectorDb):
                 # filter=filter_str,
                 include_data=True,
                 include_metadata=True,
-                include_vectors=True,
+                include_vectors=self.include_embeddings(return_embeddings),
             )
 
         if response is None:
@@ -290,7 +294,7 @@ class UpstashVectorDb(VectorDb):
 
         search_results = []
         for result in response:
-            if result.data is not None and result.id is not None and result.vector is not None:
+            if result.data is not None and result.id is not None:
                 search_results.append(
                     Document(
                         content=result.data,
@@ -302,6 +306,7 @@ class UpstashVectorDb(VectorDb):
 
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
+        search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
         return search_results
 
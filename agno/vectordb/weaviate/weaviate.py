@@ -382,7 +382,14 @@ class Weaviate(VectorDb):
         finally:
             await client.close()
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -390,22 +397,29 @@ class Weaviate(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return self.vector_search(query, limit, filters)
+            return self.vector_search(query, limit, filters, return_embeddings, metadata_keys)
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query, limit, filters)
+            return self.keyword_search(query, limit, filters, return_embeddings, metadata_keys)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit, filters)
+            return self.hybrid_search(query, limit, filters, return_embeddings, metadata_keys)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Perform a search based on the configured search type asynchronously.
@@ -414,23 +428,32 @@ class Weaviate(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Whether to return the stored vectors with the results.
+            metadata_keys (Optional[List[str]]): Metadata keys to keep on the results. None keeps all metadata.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return await self.async_vector_search(query, limit, filters)
+            return await self.async_vector_search(query, limit, filters, return_embeddings, metadata_keys)
         elif self.search_type == SearchType.keyword:
-            return await self.async_keyword_search(query, limit, filters)
+            return await self.async_keyword_search(query, limit, filters, return_embeddings, metadata_keys)
         elif self.search_type == SearchType.hybrid:
-            return await self.async_hybrid_search(query, limit, filters)
+            return await self.async_hybrid_search(query, limit, filters, return_embeddings, metadata_keys)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_query_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -442,7 +465,7 @@ class Weaviate(VectorDb):
                 near_vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=self.include_embeddings(return_embeddings),
                 filters=filter_expr,
             )
 
@@ -450,6 +473,7 @@ class Weaviate(VectorDb):
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -461,7 +485,12 @@ class Weaviate(VectorDb):
             return []
 
     async def async_vector_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Perform a vector search in Weaviate asynchronously.
@@ -473,7 +502,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -488,7 +517,7 @@ class Weaviate(VectorDb):
                 near_vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=self.include_embeddings(return_embeddings),
                 filters=filter_expr,
             )
 
@@ -496,6 +525,7 @@ class Weaviate(VectorDb):
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -506,7 +536,14 @@ class Weaviate(VectorDb):
             logger.error(f"Error searching for documents: {e}")
             return []
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         try:
             collection = self.get_client().collections.get(self.collection)
             filter_expr = self._build_filter_expression(filters)
@@ -516,7 +553,7 @@ class Weaviate(VectorDb):
                 query_properties=["content"],
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=self.include_embeddings(return_embeddings),
                 filters=filter_expr,
             )
 
@@ -524,6 +561,7 @@ class Weaviate(VectorDb):
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -535,7 +573,12 @@ class Weaviate(VectorDb):
             return []
 
     async def async_keyword_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Perform a keyword search in Weaviate asynchronously.
@@ -558,7 +601,7 @@ class Weaviate(VectorDb):
                 query_properties=["content"],
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=self.include_embeddings(return_embeddings),
                 filters=filter_expr,
             )
 
@@ -566,6 +609,7 @@ class Weaviate(VectorDb):
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -576,9 +620,16 @@ class Weaviate(VectorDb):
             logger.error(f"Error searching for documents: {e}")
             return []
 
-    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
+    ) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_query_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -591,7 +642,7 @@ class Weaviate(VectorDb):
                 vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=self.include_embeddings(return_embeddings),
                 query_properties=["content"],
                 alpha=self.hybrid_search_alpha,
                 filters=filter_expr,
@@ -601,6 +652,7 @@ class Weaviate(VectorDb):
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -612,7 +664,12 @@ class Weaviate(VectorDb):
             return []
 
     async def async_hybrid_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = True,
+        metadata_keys: Optional[List[str]] = None,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector and keyword search in Weaviate asynchronously.
@@ -624,7 +681,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -640,7 +697,7 @@ class Weaviate(VectorDb):
                 vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=self.include_embeddings(return_embeddings),
                 query_properties=["content"],
                 alpha=self.hybrid_search_alpha,
                 filters=filter_expr,
@@ -650,6 +707,7 @@ class Weaviate(VectorDb):
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = self.project_documents(search_results, return_embeddings, metadata_keys)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -734,7 +792,7 @@ class Weaviate(VectorDb):
         for obj in response.objects:
             properties = obj.properties
             meta_data = json.loads(properties["meta_data"]) if properties.get("meta_data") else None
-            embedding = obj.vector["default"] if isinstance(obj.vector, dict) else obj.vector
+            embedding = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
 
             search_results.append(
                 Document(
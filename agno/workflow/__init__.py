@@ -1,10 +1,17 @@
-from agno.run.workflow import (
-    RunEvent,
-    WorkflowCompletedEvent,
-    WorkflowRunResponseEvent,
-    WorkflowRunResponseStartedEvent,
-)
-from agno.workflow.workflow import RunResponse, Workflow, WorkflowSession
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.run.response import RunResponse
+    from agno.run.workflow import (
+        RunEvent,
+        WorkflowCompletedEvent,
+        WorkflowRunResponseEvent,
+        WorkflowRunResponseStartedEvent,
+    )
+    from agno.storage.session.workflow import WorkflowSession
+    from agno.workflow.workflow import Workflow
 
 __all__ = [
     "RunEvent",
@@ -15,3 +22,18 @@ __all__ = [
     "WorkflowRunResponseStartedEvent",
     "WorkflowCompletedEvent",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "agno.run.response": ["RunResponse"],
+        "agno.run.workflow": [
+            "RunEvent",
+            "WorkflowCompletedEvent",
+            "WorkflowRunResponseEvent",
+            "WorkflowRunResponseStartedEvent",
+        ],
+        "agno.storage.session.workflow": ["WorkflowSession"],
+        "agno.workflow.workflow": ["Workflow"],
+    },
+)
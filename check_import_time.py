@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the agno top-level modules
+
+Runs each import in a fresh interpreter with `python -X importtime` and fails when the median
+time spent importing it is over its budget. Usage: python check_import_time.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Import statement -> budget in milliseconds. Budgets leave room for slower machines, a regression
+# such as an eager import of rich or of every memory/knowledge backend still goes over them.
+BUDGETS_MS: Dict[str, float] = {
+    "import agno": 60,
+    "import agno.utils.log": 60,
+    "import agno.tools": 250,
+    "from agno.memory.v2 import Memory": 350,
+    "from agno.agent import Agent": 500,
+    "from agno.team import Team": 550,
+}
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def import_times(statement: str) -> List[Tuple[str, int, int]]:
+    """Return (module, self us, cumulative us) for the modules imported by the statement, in import order"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PROJECT_DIR, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # One space follows the separator, nested imports are indented by two more per level
+        modules.append((name.rstrip()[1:], int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure(statement: str, startup: set) -> Tuple[float, List[Tuple[str, int]]]:
+    """Return the time in ms the statement spends importing, and its slowest modules"""
+    modules = [m for m in import_times(statement) if m[0].strip() not in startup]
+    # Top-level entries are not indented, their cumulative times add up to the whole import
+    total_us = sum(cumulative for name, _, cumulative in modules if not name.startswith(" "))
+    slowest = sorted(((name.strip(), self_us) for name, self_us, _ in modules), key=lambda m: -m[1])[:5]
+    return total_us / 1000, slowest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Interpreters started per import")
+    args = parser.parse_args()
+
+    # Modules imported by the interpreter itself are not part of any budget
+    startup = {name.strip() for name, _, _ in import_times("pass")}
+
+    failed = False
+    for statement, budget in BUDGETS_MS.items():
+        try:
+            runs = [measure(statement, startup) for _ in range(args.runs)]
+        except RuntimeError as e:
+            # An import that fails is a regression too, it is not left out of the check
+            print(f"FAIL  {statement}: {e}")
+            failed = True
+            continue
+
+        elapsed = statistics.median(total for total, _ in runs)
+        status = "OK  " if elapsed <= budget else "FAIL"
+        print(f"{status}  {statement}: {elapsed:.0f} ms (budget {budget:.0f} ms)")
+        if elapsed > budget:
+            failed = True
+            for name, self_us in runs[-1][1]:
+                print(f"        {self_us / 1000:6.1f} ms  {name}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
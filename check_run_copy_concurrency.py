@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress check for Agent.run_copy
+
+Runs many concurrent sessions, each on its own run_copy of one Agent, against a local model that calls a
+shared toolkit tool before answering. The tool reports the session of the agent it was called with, so
+copies that overwrite each other's tools, run state or history fail the check.
+Usage: python check_run_copy_concurrency.py [--sessions N] [--runs N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, AsyncIterator, Iterator, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agno.agent import Agent  # noqa: E402
+from agno.memory.v2.memory import Memory  # noqa: E402
+from agno.models.base import Model  # noqa: E402
+from agno.models.message import Message  # noqa: E402
+from agno.models.response import ModelResponse  # noqa: E402
+from agno.tools.toolkit import Toolkit  # noqa: E402
+
+
+def whoami(agent: Agent) -> str:
+    """Return the session of the agent running this tool"""
+    return str(agent.session_id)
+
+
+class ToolThenEchoModel(Model):
+    """Calls `whoami` on each new user message, then answers with the tool result and the user message"""
+
+    def __init__(self, delay: float):
+        super().__init__(id="tool-then-echo", name="ToolThenEcho", provider="Local")
+        self.delay = delay
+
+    def _respond(self, messages: List[Message]) -> ModelResponse:
+        last = messages[-1]
+        if last.role == "tool":
+            user = next(m for m in reversed(messages) if m.role == "user")
+            return ModelResponse(role="assistant", content=f"{last.content}:{user.content}")
+        return ModelResponse(
+            role="assistant",
+            tool_calls=[
+                {"id": f"call_{id(last)}", "type": "function", "function": {"name": "whoami", "arguments": "{}"}}
+            ],
+        )
+
+    def invoke(self, messages: List[Message], **kwargs: Any) -> ModelResponse:
+        time.sleep(self.delay)
+        return self._respond(messages)
+
+    async def ainvoke(self, messages: List[Message], **kwargs: Any) -> ModelResponse:
+        # Every copy builds its tools before any of them runs a tool
+        await asyncio.sleep(self.delay)
+        return self._respond(messages)
+
+    def invoke_stream(self, *args: Any, **kwargs: Any) -> Iterator[ModelResponse]:
+        yield self.invoke(*args, **kwargs)
+
+    async def ainvoke_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        yield await self.ainvoke(*args, **kwargs)
+
+    def parse_provider_response(self, response: ModelResponse, **kwargs: Any) -> ModelResponse:
+        return response
+
+    def parse_provider_response_delta(self, response: ModelResponse) -> ModelResponse:
+        return response
+
+
+async def run_session(agent: Agent, session: int, runs: int) -> List[str]:
+    """Run one session on copies of the agent and return what went wrong"""
+    session_id = f"session-{session}"
+    errors = []
+    for run in range(runs):
+        message = f"{session}-{run}"
+        response = await agent.run_copy().arun(message, session_id=session_id, user_id=f"user-{session}")
+        if response.session_id != session_id:
+            errors.append(f"{session_id} run {run}: response of session {response.session_id}")
+        if response.content != f"{session_id}:{message}":
+            errors.append(f"{session_id} run {run}: expected {session_id}:{message}, got {response.content}")
+
+    history = [m.content for m in agent.memory.get_messages_for_session(session_id=session_id) if m.role == "user"]
+    if history != [f"{session}-{run}" for run in range(runs)]:
+        errors.append(f"{session_id}: history {history}")
+    return errors
+
+
+async def stress(sessions: int, runs: int, delay: float) -> int:
+    agent = Agent(
+        model=ToolThenEchoModel(delay=delay),
+        tools=[Toolkit(name="identity", tools=[whoami])],
+        memory=Memory(),
+        add_history_to_messages=True,
+        telemetry=False,
+    )
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[run_session(agent, session, runs) for session in range(sessions)])
+    elapsed = time.perf_counter() - start
+
+    errors = [error for session_errors in results for error in session_errors]
+    if agent.session_id is not None or agent.run_response is not None:
+        errors.append("the base agent was modified by its copies")
+    for error in errors[:20]:
+        print(f"        {error}")
+
+    status = "FAIL" if errors else "OK  "
+    print(f"{status}  {sessions} sessions x {runs} runs: {len(errors)} errors in {elapsed:.2f} s")
+    return 1 if errors else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200, help="Concurrent sessions")
+    parser.add_argument("--runs", type=int, default=2, help="Runs per session")
+    parser.add_argument("--delay", type=float, default=0.05, help="Seconds each model call takes")
+    args = parser.parse_args()
+    return asyncio.run(stress(args.sessions, args.runs, args.delay))
+
+
+if __name__ == "__main__":
+    sys.exit(main())